@@ -0,0 +1 @@
+"""Benchmark suite for the skimpy package."""
@@ -0,0 +1,174 @@
+"""Synthetic data, and the size of the data, for the skimpy benchmarks.
+
+Benchmarks are run over a grid of numbers of rows (ROWS) and columns
+(COLUMNS). By default, only the sizes up to MAX_CELLS cells are run; pass
+--max-cells to run bigger ones (eg --max-cells=1e12 for all of them).
+"""
+
+import functools
+import sqlite3
+from pathlib import Path
+from typing import Callable, Dict, Tuple
+
+import numpy as np
+import pandas as pd
+import pytest
+
+ROWS = [10**3, 10**4, 10**5, 10**6, 10**7, 10**8]
+COLUMNS = [10, 100, 1_000, 10_000]
+# Largest number of cells (rows times columns) that is benchmarked by default
+MAX_CELLS = 10**6
+SEED = 34729
+
+
+def _text(rng: np.random.Generator, n_rows: int) -> pd.Series:
+    string_options = [
+        "How are you?",
+        "What weather!",
+        "Indeed, it was the most outrageously pompous cat I have ever seen.",
+    ]
+    text = pd.Series(rng.choice(string_options, n_rows), dtype="string")
+    text[rng.random(n_rows) < 0.006] = None
+    return text
+
+
+def _datetime_no_freq(
+    rng: np.random.Generator, n_rows: int, with_nat: bool = True
+) -> pd.Series:
+    dates = pd.to_datetime(pd.Series(["01/01/2022", "03/04/2023", "01/05/1992"]))
+    datetimes = pd.Series(rng.choice(dates, n_rows))
+    if with_nat:
+        datetimes[rng.random(n_rows) < 0.003] = pd.NaT
+    return datetimes
+
+
+def _time_diff(rng: np.random.Generator, n_rows: int) -> pd.Series:
+    days = rng.multinomial(40, [1 / 7] * 5, n_rows)[:, 0]
+    time_diff = pd.Series(pd.to_timedelta(days, unit="D"))
+    time_diff[rng.random(n_rows) < 0.005] = pd.NaT
+    return time_diff
+
+
+def _with_nans(values: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    values[rng.choice(len(values), size=len(values) // 8)] = np.nan
+    return values
+
+
+# The columns of generate_test_data, by name, made at any number of rows
+KINDS: Dict[str, Callable[[np.random.Generator, int], pd.Series]] = {
+    "length": lambda rng, n: pd.Series(rng.beta(0.5, 0.5, size=n)),
+    "width": lambda rng, n: pd.Series(rng.gamma(1, 2, size=n)),
+    "depth": lambda rng, n: pd.Series(rng.poisson(10, size=n)),
+    "rnd": lambda rng, n: pd.Series(_with_nans(rng.normal(size=n), rng)),
+    "class": lambda rng, n: pd.Series(
+        rng.choice(["setosa", "virtginica"], size=n), dtype="category"
+    ),
+    "location": lambda rng, n: pd.Series(
+        rng.choice(["UK", "Mexico", "USA", "India"], n, p=[0.6, 0.2, 0.1, 0.1]),
+        dtype="category",
+    ),
+    "booly_col": lambda rng, n: pd.Series(rng.choice([True, False], size=n)),
+    "text": _text,
+    # (minutely, rather than monthly, so that 10^8 rows don't overflow)
+    "datetime": lambda rng, n: pd.Series(
+        pd.date_range("2018-01-01", periods=n, freq="min")
+    ),
+    "datetime_no_freq": _datetime_no_freq,
+    "datetime.date": lambda rng, n: pd.Series(
+        pd.date_range("2018-01-01", periods=n, freq="min").date
+    ),
+    "datetime.date_no_freq": lambda rng, n: _datetime_no_freq(rng, n, False).dt.date,
+    "time diff": _time_diff,
+}
+
+
+@functools.lru_cache(maxsize=4)
+def synthetic_frame(
+    n_rows: int, n_cols: int, kinds: Tuple[str, ...] = tuple(KINDS)
+) -> pd.DataFrame:
+    """Make a dataframe like generate_test_data, of any size.
+
+    Its columns cycle through the kinds of column, and are named after them
+    (eg "depth 12"). Frames are cached, since skimpy never modifies them.
+
+    Args:
+        n_rows (int): Number of rows.
+        n_cols (int): Number of columns.
+        kinds (Tuple[str, ...]): Kinds of column (see KINDS) to cycle through.
+
+    Returns:
+        pd.DataFrame: Synthetic data.
+    """
+    rng = np.random.Generator(np.random.PCG64(SEED))
+    columns = {kind: KINDS[kind](rng, n_rows) for kind in kinds[:n_cols]}
+    return pd.DataFrame(
+        {
+            f"{kinds[i % len(kinds)]} {i}": columns[kinds[i % len(kinds)]]
+            for i in range(n_cols)
+        }
+    )
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Adds the --max-cells option."""
+    parser.addoption(
+        "--max-cells",
+        type=float,
+        default=MAX_CELLS,
+        help="Only run benchmarks of data with up to this many cells.",
+    )
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    """Deselects the benchmarks of data with more than --max-cells cells."""
+    max_cells = config.getoption("--max-cells")
+    selected, deselected = [], []
+    for item in items:
+        params = getattr(item, "callspec", None)
+        params = params.params if params else {}
+        n_cells = params.get("n_rows", 1) * params.get("n_cols", 1)
+        (selected if n_cells <= max_cells else deselected).append(item)
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
+@pytest.fixture(scope="session")
+def make_frame() -> Callable[..., pd.DataFrame]:
+    """Fixture that makes synthetic data (see synthetic_frame)."""
+    return synthetic_frame
+
+
+@pytest.fixture(scope="session")
+def data_file(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Callable[[str, int, int], Path]:
+    """Fixture that writes synthetic data to csv, parquet, feather or sqlite files."""
+    paths: Dict[Tuple[str, int, int], Path] = {}
+
+    def write(suffix: str, n_rows: int, n_cols: int) -> Path:
+        key = (suffix, n_rows, n_cols)
+        if key not in paths:
+            # (durations are read back from files as nullable integers, which
+            # skimpy can't yet summarise when they have missing values)
+            kinds = tuple(kind for kind in KINDS if kind != "time diff")
+            df = synthetic_frame(n_rows, n_cols, kinds)
+            path = tmp_path_factory.mktemp("data") / f"data.{suffix}"
+            if suffix == "csv":
+                df.to_csv(path, index=False)
+            elif suffix == "parquet":
+                df.to_parquet(path, index=False)
+            elif suffix == "feather":
+                df.to_feather(path)
+            else:
+                # sqlite has no date, datetime, or timedelta types
+                with sqlite3.connect(path) as con:
+                    df.select_dtypes(
+                        exclude=["datetime", "timedelta", "object"]
+                    ).to_sql("data", con, index=False)
+            paths[key] = path
+        return paths[key]
+
+    return write
@@ -0,0 +1,175 @@
+"""Benchmarks of skimpy, run with pytest-benchmark (see the benchmarks nox session)."""
+
+import io
+import subprocess
+import sys
+from typing import Callable
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+from click.testing import CliRunner
+from rich.console import Console
+
+from skimpy import (
+    __main__,
+    _bool_variable_summary_table,
+    _category_variable_summary_table,
+    _clean_name,
+    _dataframe_to_rich_table,
+    _datetime_variable_summary_table,
+    _infer_datatypes,
+    _numeric_variable_summary_table,
+    _string_variable_summary_table,
+    _timedelta_variable_summary_table,
+    clean_columns,
+    skim,
+    skim_get_data,
+)
+
+from .conftest import COLUMNS, ROWS
+
+# Summary table functions, and the kinds of column (see KINDS) they summarise
+SUMMARY_TABLES = {
+    "numeric": (_numeric_variable_summary_table, ("length", "width", "depth", "rnd")),
+    "category": (_category_variable_summary_table, ("class", "location")),
+    "bool": (_bool_variable_summary_table, ("booly_col",)),
+    "string": (_string_variable_summary_table, ("text",)),
+    "datetime": (
+        _datetime_variable_summary_table,
+        ("datetime", "datetime_no_freq", "datetime.date", "datetime.date_no_freq"),
+    ),
+    "timedelta": (_timedelta_variable_summary_table, ("time diff",)),
+}
+
+
+@pytest.mark.parametrize("module", ["skimpy", "skimpy.__main__"])
+def test_import(benchmark, module: str) -> None:
+    """Imports skimpy, or its command line, in a new interpreter."""
+
+    def run() -> str:
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return result.stderr
+
+    benchmark.group = "import"
+    importtime = benchmark.pedantic(run, rounds=5, warmup_rounds=1)
+    # lines are "import time: <self us> | <cumulative us> | <module>"
+    timings = {
+        line.split("|")[2].strip(): int(line.split("|")[0].split(":")[1])
+        for line in importtime.splitlines()[1:]
+        if line.startswith("import time:")
+    }
+    # typeguard's instrumentation of every function took seconds
+    assert timings[module] < 500_000
+
+
+@pytest.mark.parametrize("n_cols", COLUMNS)
+@pytest.mark.parametrize("n_rows", ROWS)
+@pytest.mark.parametrize("table", SUMMARY_TABLES)
+def test_summary_table(
+    benchmark, make_frame: Callable, table: str, n_rows: int, n_cols: int
+) -> None:
+    summary_func, kinds = SUMMARY_TABLES[table]
+    xf = _infer_datatypes(make_frame(n_rows, n_cols, kinds))
+    benchmark.group = f"{table} summary table"
+    benchmark(summary_func, xf)
+
+
+@pytest.mark.parametrize("n_cols", COLUMNS)
+def test_dataframe_to_rich_table(benchmark, make_frame: Callable, n_cols: int) -> None:
+    """Builds, and renders, the rich table of a numeric summary."""
+    summary = _numeric_variable_summary_table(
+        make_frame(1_000, n_cols, SUMMARY_TABLES["numeric"][1])
+    )
+
+    def render() -> None:
+        console = Console(file=io.StringIO(), width=200)
+        console.print(_dataframe_to_rich_table("number", summary))
+
+    benchmark.group = "rich table"
+    benchmark(render)
+
+
+@pytest.mark.parametrize("n_cols", COLUMNS)
+@pytest.mark.parametrize("case", ["snake", "camel"])
+def test_clean_columns(benchmark, make_frame: Callable, case: str, n_cols: int) -> None:
+    """Cleans every name from scratch, rather than from the cache of names."""
+    df = pd.DataFrame(columns=make_frame(1, n_cols).columns)
+    benchmark.group = f"clean_columns {case}"
+    benchmark.pedantic(
+        clean_columns,
+        args=(df, case),
+        setup=_clean_name.cache_clear,
+        rounds=20,
+        warmup_rounds=1,
+    )
+
+
+@pytest.mark.parametrize("n_cols", COLUMNS)
+@pytest.mark.parametrize("n_rows", ROWS)
+@pytest.mark.parametrize("suffix", ["csv", "parquet", "feather", "sqlite"])
+def test_load_data_from_file(
+    benchmark, data_file: Callable, suffix: str, n_rows: int, n_cols: int
+) -> None:
+    path = data_file(suffix, n_rows, n_cols)
+    table = "data" if suffix == "sqlite" else None
+    benchmark.group = f"load {suffix}"
+    benchmark(__main__._load_data_from_file, str(path), table)
+
+
+@pytest.mark.parametrize("n_cols", COLUMNS)
+@pytest.mark.parametrize("n_rows", ROWS)
+@pytest.mark.parametrize("engine", ["duckdb", "arrow", "pandas", "stream"])
+def test_cli(
+    benchmark, data_file: Callable, engine: str, n_rows: int, n_cols: int
+) -> None:
+    path = data_file("parquet", n_rows, n_cols)
+    runner = CliRunner()
+    benchmark.group = f"cli {engine}"
+    result = benchmark(runner.invoke, __main__.main, [str(path), "-e", engine])
+    assert result.exit_code == 0
+
+
+@pytest.mark.parametrize("n_cols", COLUMNS)
+@pytest.mark.parametrize("n_rows", ROWS)
+def test_cli_metadata_only(
+    benchmark, data_file: Callable, n_rows: int, n_cols: int
+) -> None:
+    path = data_file("parquet", n_rows, n_cols)
+    runner = CliRunner()
+    benchmark.group = "cli metadata only"
+    result = benchmark(runner.invoke, __main__.main, [str(path), "--metadata-only"])
+    assert result.exit_code == 0
+
+
+@pytest.mark.parametrize("n_cols", COLUMNS)
+@pytest.mark.parametrize("n_rows", ROWS)
+def test_skim_get_data(
+    benchmark, make_frame: Callable, n_rows: int, n_cols: int
+) -> None:
+    df = make_frame(n_rows, n_cols)
+    benchmark.group = "skim_get_data"
+    benchmark(skim_get_data, df)
+
+
+@pytest.mark.parametrize("n_cols", COLUMNS)
+@pytest.mark.parametrize("n_rows", ROWS)
+def test_skim_get_data_arrow(
+    benchmark, make_frame: Callable, n_rows: int, n_cols: int
+) -> None:
+    table = pa.Table.from_pandas(make_frame(n_rows, n_cols), preserve_index=False)
+    benchmark.group = "skim_get_data arrow"
+    benchmark(skim_get_data, table)
+
+
+@pytest.mark.parametrize("n_cols", COLUMNS)
+@pytest.mark.parametrize("n_rows", ROWS)
+def test_skim(benchmark, make_frame: Callable, n_rows: int, n_cols: int) -> None:
+    df = make_frame(n_rows, n_cols)
+    benchmark.group = "skim"
+    benchmark(skim, df)
@@ -165,6 +165,33 @@ def typeguard(session: nox.Session) -> None:
     session.run("pytest", f"--typeguard-packages={package}", *session.posargs)
 
 
+@nox.session(venv_backend="uv", python=python_versions[2])
+def benchmarks(session: nox.Session) -> None:
+    """Run the benchmarks, and compare them with the last saved results.
+
+    Results are saved in benchmarks/results, by machine, named after the commit
+    they were run on, so that releases can be compared with, eg,
+    ``pytest-benchmark --storage benchmarks/results compare``. As they depend
+    on the machine, they aren't committed (git ignores them). Pass, eg,
+    ``-- --max-cells=1e12`` to benchmark the largest data too.
+    """
+    session.run_install(
+        "uv",
+        "sync",
+        "--group=dev",
+        env={"UV_PROJECT_ENVIRONMENT": session.virtualenv.location},
+    )
+    session.run_install("uv", "pip", "install", "-e", ".")
+    session.run(
+        "pytest",
+        "benchmarks",
+        "--benchmark-storage=benchmarks/results",
+        "--benchmark-autosave",
+        "--benchmark-compare",
+        *session.posargs,
+    )
+
+
 @nox.session(venv_backend="uv", python=python_versions)
 def xdoctest(session: nox.Session) -> None:
     """Run examples with xdoctest."""
@@ -2,24 +2,44 @@
 
 from __future__ import annotations  # This is here to get 'dict' typing for <3.10
 
+import contextlib
+import copy
 import datetime
+import functools
+import hashlib
 import os
+import pathlib
+import pickle
 import re
+import sys
+import threading
+import time
+import tracemalloc
 import typing
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from itertools import chain
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
 from unicodedata import normalize
 
 import numpy as np
 import pandas as pd
-from numpy.random import PCG64, Generator
-from rich.columns import Columns
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.text import Text
-from typeguard import typechecked
+import pyarrow as pa
+import pyarrow.compute as pc
 
 # TypeAlias is only built-in for 3.10 and above
 try:
@@ -27,12 +47,13 @@ try:
 except ImportError:
     from typing_extensions import TypeAlias
 
-# polars check
-try:
+# rich, polars, and pyarrow.dataset are imported where they are needed, so that
+# import skimpy is fast; typeguard treats these imports as Any in type hints
+if TYPE_CHECKING:
     import polars as pl
-except ImportError:
-    # no nothing
-    pass
+    import pyarrow.dataset as ds
+    from rich.console import Console
+    from rich.table import Table
 
 from importlib.metadata import PackageNotFoundError, version
 
@@ -41,6 +62,65 @@ try:
 except PackageNotFoundError:
     __version__ = "unknown"
 
+
+# Environment variable that sets which functions have their types checked at
+# runtime: "all" (the default), or "public" for production, where only the
+# public API is checked and internal helpers run unchecked
+TYPECHECK_ENV_VAR = "SKIMPY_TYPECHECK"
+TYPECHECK_MODES = ["all", "public"]
+
+
+def _typecheck_mode() -> str:
+    """Reads the type checking mode from the TYPECHECK_ENV_VAR environment variable.
+
+    Returns:
+        str: One of TYPECHECK_MODES.
+
+    Raises:
+        ValueError: If the environment variable isn't one of TYPECHECK_MODES.
+    """
+    mode = os.environ.get(TYPECHECK_ENV_VAR, "all").strip().lower()
+    if mode not in TYPECHECK_MODES:
+        raise ValueError(
+            f"{TYPECHECK_ENV_VAR}={mode} is invalid, options are: {', '.join(TYPECHECK_MODES)}"
+        )
+    return mode
+
+
+TYPECHECK_MODE = _typecheck_mode()
+
+
+def typechecked(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Checks the types of the arguments and return value of a function at runtime.
+
+    This is typeguard's typechecked, applied the first time that the function
+    is called rather than on import: typeguard instruments a function by
+    parsing and compiling the source of its whole module, which would make
+    import skimpy slow. In the "public" TYPECHECK_MODE, private functions
+    (whose names start with an underscore) are left as they are.
+
+    Args:
+        func (Callable[..., Any]): Function with type hints.
+
+    Returns:
+        Callable[..., Any]: The function, with its types checked.
+    """
+    if TYPECHECK_MODE == "public" and func.__name__.startswith("_"):
+        return func
+    checked_func = None
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        nonlocal checked_func
+        if checked_func is None:
+            from typeguard import typechecked as typeguard_typechecked
+
+            checked_func = typeguard_typechecked(func)
+        return checked_func(*args, **kwargs)
+
+    return wrapper
+
+
 NULL_VALUES = {np.nan, "", None}
 
 CASE_STYLES = {
@@ -55,6 +135,22 @@ CASE_STYLES = {
     "upper",
 }
 
+# Regular expressions that split column names into words, for clean_columns
+_PUNCTUATION_RE = re.compile(r"[!()*+\,\-./:;<=>?[\]^_{|}~]")
+_QUOTES_RE = re.compile(r"[\'\"\`]")
+# A word starts at every run of capitals, of digits, or of other non-word
+# characters, and at every capitalised word
+_STRIPPED_WORD_RE = re.compile(
+    r"\S(?:(?<=[A-Z])[A-Z](?![a-z])|(?<=[0-9])[0-9]|(?<=\W)[^\w\s]|[^\WA-Z0-9])*"
+)
+# Without stripping punctuation, a word only starts at every capitalised word
+_WORD_RE = re.compile(r"[^\s\-_](?:(?![A-Z][a-z])[^\s\-_])*")
+# Number of cleaned column names that clean_columns remembers
+CLEAN_NAME_CACHE_SIZE = 2**16
+# Number of column names from which clean_columns cleans them all at once,
+# rather than one at a time
+CLEAN_BATCH_MIN_NAMES = 1024
+
 QUANTILES = [0, 0.25, 0.5, 0.75, 1]
 HIST_BINS = 6
 # These are defined globally because they are used in more than one function
@@ -63,6 +159,7 @@ DATE_COL_LAST = "last"
 NUM_COL_MEAN = "mean"
 COMPLETE_COL = "NA %"
 MISSING_COL = "NA"
+RANK_ERROR_COL = "rank error"
 
 UNSUPPORTED_INFERRED_TYPES = [
     "mixed-integer",
@@ -77,52 +174,137 @@ except TypeError:
     JSON: TypeAlias = Dict[str, Dict[str, Any]]
 
 
+# Maps the output of pd.api.types.infer_dtype to the dtype a column is cast to.
+# None means the column is left as it is (eg "date" isn't supported by pandas, so
+# it stays as an object; later on we can still pick it up via the type plan).
+INFERRED_TYPE_TO_DTYPE: Dict[str, Optional[str]] = {
+    "string": "string",
+    "integer": "int",
+    "floating": "float64",
+    "timedelta64": "timedelta64[ns]",
+    "datetime64": "datetime64[ns]",
+    "categorical": "category",
+    "boolean": "bool",
+    "complex": "complex128",
+    "empty": "object",  # This is for entirely null columns, which will be dealt with later
+    "date": None,
+}
+
+
 @typechecked
-def _infer_datatypes(df: pd.DataFrame) -> pd.DataFrame:
-    """Infers the, and applies new, datatypes of dataframe columns.
+def _infer_column_type_plan(df: pd.DataFrame) -> pd.DataFrame:
+    """Infers the type of every column once, and decides what to do with it.
+
+    Running pd.api.types.infer_dtype means scanning every value of object
+    columns, so it is done once here and the resulting plan is shared by
+    _delete_unsupported_columns, _infer_datatypes, and the type dispatch in
+    _skim_computation.
 
     Args:
         df (pd.DataFrame): User data that we'd like to infer types on.
 
     Returns:
-        pd.DataFrame: Same dataframe, but typed wherever possible.
+        pd.DataFrame: One row per column of df, with the column name ('column'),
+        the inferred type ('type'), the dtype to cast to ('dtype', None if the
+        column should be left as it is), and whether the column is supported
+        ('keep').
+    """
+    inferred_types = [pd.api.types.infer_dtype(series) for _, series in df.items()]
+    type_plan = pd.DataFrame(
+        {
+            "column": list(df.columns),
+            "type": inferred_types,
+            "dtype": [INFERRED_TYPE_TO_DTYPE.get(x) for x in inferred_types],
+            "keep": [x not in UNSUPPORTED_INFERRED_TYPES for x in inferred_types],
+        },
+        columns=["column", "type", "dtype", "keep"],
+    )
+    return type_plan
+
+
+@typechecked
+def _frame_from_columns(df: pd.DataFrame, positions: List[int]) -> pd.DataFrame:
+    """Builds a dataframe from some of the columns of df without copying them.
+
+    Selecting columns with .loc, .drop, or .select_dtypes consolidates and copies
+    the underlying data, which is expensive for large dataframes. Here, the
+    new dataframe is a view on the columns of df instead.
+
+    Args:
+        df (pd.DataFrame): Dataframe to take columns from.
+        positions (List[int]): Positions of the columns to take, in order.
+
+    Returns:
+        pd.DataFrame: Dataframe with the chosen columns, sharing memory with df.
     """
-    df_types = (
-        pd.DataFrame(df.apply(pd.api.types.infer_dtype, axis=0))
-        .reset_index()
-        .rename(columns={"index": "column", 0: "type"})
+    if not positions:
+        return pd.DataFrame(index=df.index)
+    xf = pd.DataFrame(
+        {i: df.iloc[:, pos] for i, pos in enumerate(positions)}, copy=False
     )
-    loop_types = df_types.values.tolist()
-    for col in loop_types:
-        if col[1] == "string":
-            data_type = "string"
-        elif col[1] == "integer":
-            data_type = "int"
-        elif col[1] == "floating":
-            data_type = "float64"
-        elif col[1] == "timedelta64":
-            data_type = "timedelta64[ns]"
-        elif col[1] == "datetime64":
-            if isinstance(df[col[0]].dtype, pd.DatetimeTZDtype):
+    xf.columns = df.columns[positions]
+    return xf
+
+
+@typechecked
+def _select_dtypes(
+    df: pd.DataFrame,
+    include: Any,
+    exclude: Optional[List[str]] = None,
+) -> pd.DataFrame:
+    """Equivalent of df.select_dtypes that does not copy any data.
+
+    Args:
+        df (pd.DataFrame): Dataframe to select columns from.
+        include (Any): Dtypes to include, as accepted by pd.DataFrame.select_dtypes.
+        exclude (Optional[List[str]], optional): Dtypes to exclude. Defaults to None.
+
+    Returns:
+        pd.DataFrame: Dataframe of the selected columns, sharing memory with df.
+    """
+    # select_dtypes on a zero row frame is cheap and tells us which positions to take
+    empty = df.iloc[:0].set_axis(range(df.shape[1]), axis=1)
+    positions = list(empty.select_dtypes(include, exclude=exclude).columns)
+    return _frame_from_columns(df, positions)
+
+
+@typechecked
+def _infer_datatypes(
+    df: pd.DataFrame, type_plan: Optional[pd.DataFrame] = None
+) -> pd.DataFrame:
+    """Infers the, and applies new, datatypes of dataframe columns.
+
+    The input dataframe is not modified: columns whose type changes are
+    converted into a new dataframe, and all other columns are shared with
+    the input rather than copied.
+
+    Args:
+        df (pd.DataFrame): User data that we'd like to infer types on.
+        type_plan (Optional[pd.DataFrame], optional): Output of
+            _infer_column_type_plan. Computed from df if not given.
+
+    Returns:
+        pd.DataFrame: Same data, but typed wherever possible.
+    """
+    if type_plan is None:
+        type_plan = _infer_column_type_plan(df)
+    target_dtypes = dict(zip(type_plan["column"], type_plan["dtype"]))
+    if not target_dtypes:
+        return df
+    columns = {}
+    for i, (col, series) in enumerate(df.items()):
+        data_type = target_dtypes.get(col)
+        if data_type is not None:
+            if data_type == "datetime64[ns]" and isinstance(
+                series.dtype, pd.DatetimeTZDtype
+            ):
                 # Convert timezone-aware to timezone-naive
-                df[col[0]] = df[col[0]].dt.tz_localize(None)
-            data_type = "datetime64[ns]"
-        elif col[1] == "categorical":
-            data_type = "category"
-        elif col[1] == "boolean":
-            data_type = "bool"
-        elif col[1] == "complex":
-            data_type = "complex128"
-        elif col[1] == "empty":
-            data_type = "object"  # This is for entirely null columns, which will be dealt with later
-        elif col[1] == "date":
-            # do nothing: "date" isn't supported, so we leave as an object.
-            # later on, we will still be able to pick up "date" using
-            # .select_dtypes, which is the important bit.
-            continue
-        # There is no else statement here because logic should never get to this point.
-        df[col[0]] = df[col[0]].astype(data_type)
-    return df
+                series = series.dt.tz_localize(None)
+            series = series.astype(data_type, copy=False)
+        columns[i] = series
+    typed_df = pd.DataFrame(columns, copy=False)
+    typed_df.columns = df.columns
+    return typed_df
 
 
 @typechecked
@@ -136,8 +318,82 @@ def _round_series(s: pd.Series, places: int = 2) -> pd.Series:
     Returns:
         pd.Series: Series with numbers rounded to places s.f.
     """
-    s = s.apply(lambda x: float(f"{float(f'{x:.{places}g}'):g}"))
-    return s
+    if s.empty:
+        return s.apply(float)
+    x = s.to_numpy(dtype="float64")
+    rounded = _round_sig_figs(x, places)
+    # "g" formatting keeps at most 6 s.f., so more places are rounded twice
+    if places > 6:
+        rounded = _round_sig_figs(rounded, 6)
+    # Values that can't be rounded exactly with floats go through formatting
+    fallback = np.isnan(rounded) & ~np.isnan(x)
+    rounded[fallback] = [float(f"{float(f'{v:.{places}g}'):g}") for v in x[fallback]]
+    return pd.Series(rounded, index=s.index, name=s.name)
+
+
+# Powers of ten that are exactly representable as floats
+_EXACT_POWERS_OF_TEN = np.array([float(10**i) for i in range(23)])
+
+
+@typing.no_type_check
+def _round_sig_figs(x: np.ndarray, places: int) -> np.ndarray:
+    """Rounds an array to places significant figures, as "g" formatting would.
+
+    Each value is scaled by an exact power of ten so that the digits to keep
+    are its integer part, rounded half to even, and scaled back. As both the
+    power of ten and the rounded integer are exact, scaling back gives the
+    float nearest to the rounded decimal, just like parsing its string. Values
+    where this can't be guaranteed (very large or small values, or values so
+    close to halfway between two roundings that floating point error could
+    change the outcome) are returned as NaN.
+
+    Args:
+        x (np.ndarray): Array of floats to round.
+        places (int): Number of significant figures to round to, at most 15.
+
+    Returns:
+        np.ndarray: Rounded array, with NaN where the rounding isn't exact.
+    """
+    out = np.full_like(x, np.nan)
+    finite = np.isfinite(x) & (x != 0)
+    # zeros, infinities, and NaN are unchanged by rounding
+    out[~finite] = x[~finite]
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        digits = places - 1 - np.floor(np.log10(np.abs(x)))
+        digits = np.where(finite, digits, 0).astype(int)
+        scaled = _scale_by_power_of_ten(x, digits)
+        # log10 can be a little off near powers of ten
+        digits += finite & (np.abs(scaled) < 10.0 ** (places - 1))
+        digits -= finite & (np.abs(scaled) >= 10.0**places)
+        scaled = _scale_by_power_of_ten(x, digits)
+        ints = np.round(scaled)
+        exact = (
+            finite
+            & (places <= 15)
+            & (np.abs(digits) <= 22)
+            & (
+                np.abs(np.abs(scaled - np.trunc(scaled)) - 0.5)
+                > 2 * np.abs(np.spacing(scaled))
+            )
+        )
+        rounded = _scale_by_power_of_ten(ints, -digits)
+    out[exact] = rounded[exact]
+    return out
+
+
+@typing.no_type_check
+def _scale_by_power_of_ten(x: np.ndarray, digits: np.ndarray) -> np.ndarray:
+    """Multiplies x by 10**digits, with a single rounding error.
+
+    Args:
+        x (np.ndarray): Array of floats to scale.
+        digits (np.ndarray): Power of ten to scale each value by.
+
+    Returns:
+        np.ndarray: Scaled array; only exact where abs(digits) <= 22.
+    """
+    scale = _EXACT_POWERS_OF_TEN[np.clip(np.abs(digits), 0, 22)]
+    return np.where(digits >= 0, x * scale, x / scale)
 
 
 @typechecked
@@ -236,6 +492,7 @@ def _dataframe_to_rich_table(
     string: str = "green",
     bool: str = "turquoise2",
     object: str = "medium_purple1",
+    estimates: Optional[List[str]] = None,
 ) -> Table:
     """Converts a dataframe into a rich table.
 
@@ -256,10 +513,15 @@ def _dataframe_to_rich_table(
         string (str): colour to render strings in
         bool (str): colour to render bools in
         object (str): colour to render objects in
+        estimates (Optional[List[str]]): columns of df that are estimated from
+            a sample of rows; their headers are marked with a '~'
 
     Returns:
         Table: instance of Table from the rich package
     """
+    from rich.table import Table
+    from rich.text import Text
+
     df = df.reset_index().rename(columns={"index": "column"})
     table = Table(show_footer=False, expand=True, title=table_name, show_header=True)
     # generate dict of types to colours
@@ -293,6 +555,8 @@ def _dataframe_to_rich_table(
         ]
         for row in rows
     ]
+    if estimates:
+        df = df.rename(columns={col: f"~{col}" for col in estimates})
     col_widths = _compute_column_widths(df)
     for col, width in zip(df.columns, col_widths):
         table.add_column(str(col), overflow="fold", max_width=width)
@@ -309,41 +573,14 @@ def _dataframe_to_rich_table(
     return table
 
 
-def _find_nearest(array: np.ndarray, value: float) -> float:
-    """Find the nearest numerical match to value in an array.
-
-    Args:
-        array (np.ndarray): An array of numbers to match with.
-        value (float): Single value to find an entry in array that is close.
-
-    Returns:
-        float: The entry in array that is closest to value.
-    """
-    array = np.asarray(array)
-    idx = (np.abs(array - value)).argmin()
-    return array[idx]
-
-
 @typing.no_type_check
-def _create_unicode_hist(series: pd.Series) -> pd.Series:
-    """Return a histogram rendered in block unicode.
-
-    Given a pandas series of numerical values, returns a series with one
-    entry, the original series name, and a histogram made up of unicode
-    characters. However, note that the histogram is very approximate, partly
-    due to limitations in how unicode is displayed across systems.
-
-    Args:
-        series (pd.Series): Numeric column of data frame for analysis
+def _unicode_hist_glyphs() -> Tuple[np.ndarray, np.ndarray]:
+    """Return the heights of unicode blocks, and the blocks themselves.
 
     Returns:
-        pd.Series: Index of series name and entry with unicode histogram as
-        a string, eg '▃▅█'
+        Tuple[np.ndarray, np.ndarray]: Heights, as fractions of a full block,
+        and the unicode characters that have those heights.
     """
-    if series.dtype == "bool":
-        series = series.astype("int")
-    hist, _ = np.histogram(series, density=True, bins=HIST_BINS)
-    hist = hist / hist.max()
     fractions = [
         0.0,
         1 / 8,
@@ -370,49 +607,453 @@ def _create_unicode_hist(series: pd.Series) -> pd.Series:
         del unicode_hist[1.0]
 
     key_vector = np.array(list(unicode_hist.keys()), dtype="float")
-    ucode_to_print = "".join(
-        [unicode_hist[_find_nearest(key_vector, val)] for val in hist]
-    )
-    return pd.Series(index=[series.name], data=ucode_to_print, dtype="string")
+    return key_vector, np.array(list(unicode_hist.values()))
+
+
+@typing.no_type_check
+def _hists_to_unicode(hists: np.ndarray) -> List[str]:
+    """Render histograms, one per row of an array, in block unicode.
+
+    Each bin is drawn with the block whose height is nearest to the height of
+    the bin relative to the tallest bin in its histogram.
+
+    Args:
+        hists (np.ndarray): 2-D array of the height (eg count or density) of
+            each bin, with one row per histogram.
+
+    Returns:
+        List[str]: Histograms as strings, eg '▃▅█'
+    """
+    key_vector, glyphs = _unicode_hist_glyphs()
+    with np.errstate(invalid="ignore", divide="ignore"):
+        hists = hists / hists.max(axis=1, keepdims=True)
+    nearest = np.abs(hists[..., np.newaxis] - key_vector).argmin(axis=-1)
+    return ["".join(row) for row in glyphs[nearest]]
+
+
+@typing.no_type_check
+def _hist_to_unicode(hist: np.ndarray) -> str:
+    """Render the heights of histogram bins in block unicode.
+
+    Args:
+        hist (np.ndarray): Height (eg count or density) of each bin.
+
+    Returns:
+        str: Histogram as a string, eg '▃▅█'
+    """
+    return _hists_to_unicode(np.asarray(hist)[np.newaxis])[0]
+
+
+# Maximum number of values binned at once when building histograms
+HIST_BLOCK_SIZE = 2**22
+
+
+@typing.no_type_check
+def _create_unicode_hists(xf: pd.DataFrame) -> pd.Series:
+    """Return histograms of all the columns of a dataframe in block unicode.
+
+    The columns are binned together, as one 2-D array (in blocks of columns,
+    to limit memory use), with the same equal-width bins as
+    np.histogram(..., bins=HIST_BINS, density=True) gives for each column.
+    Missing values are left out, and bools are binned as 0 and 1.
+
+    Args:
+        xf (pd.DataFrame): Dataframe with only numeric or bool columns
+
+    Returns:
+        pd.Series: Unicode histogram of each column, indexed by column name
+
+    Raises:
+        ValueError: If a column has infinite values, as np.histogram would.
+    """
+    hists = []
+    block_width = max(1, HIST_BLOCK_SIZE // max(len(xf), 1))
+    for start in range(0, xf.shape[1], block_width):
+        # one row per column of xf, so that each column is contiguous
+        values = np.ascontiguousarray(
+            xf.iloc[:, start : start + block_width]
+            .to_numpy(dtype="float64", na_value=np.nan)
+            .T
+        )
+        n_valid = values.shape[1] - np.isnan(values).sum(axis=1)
+        # range of each column, as worked out by np.histogram
+        first_edge = np.where(
+            n_valid > 0, np.fmin.reduce(values, axis=1, initial=np.inf), 0.0
+        )
+        last_edge = np.where(
+            n_valid > 0, np.fmax.reduce(values, axis=1, initial=-np.inf), 1.0
+        )
+        for lo, hi in zip(first_edge, last_edge):
+            if not (np.isfinite(lo) and np.isfinite(hi)):
+                raise ValueError(f"autodetected range of [{lo}, {hi}] is not finite")
+        is_constant = first_edge == last_edge
+        first_edge = np.where(is_constant, first_edge - 0.5, first_edge)
+        last_edge = np.where(is_constant, last_edge + 0.5, last_edge)
+        edges = np.linspace(first_edge, last_edge, HIST_BINS + 1, axis=1)
+        # Values are in bin i if edges[i] <= value < edges[i + 1], with the
+        # last bin including its upper edge
+        n_at_least = [n_valid]
+        n_at_least.extend(
+            (values >= edges[:, [i]]).sum(axis=1) for i in range(1, HIST_BINS)
+        )
+        n_at_least.append(np.zeros_like(n_valid))
+        n_at_least = np.stack(n_at_least, axis=1)
+        counts = n_at_least[:, :-1] - n_at_least[:, 1:]
+        # density, as calculated by np.histogram
+        db = np.diff(edges, axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            hists.append(counts / db / counts.sum(axis=1, keepdims=True))
+    hists = np.concatenate(hists) if hists else np.empty((0, HIST_BINS))
+    return pd.Series(_hists_to_unicode(hists), index=xf.columns, dtype="string")
+
+
+# Number of values kept at the top level of a quantile sketch (see QuantileSketch)
+SKETCH_SIZE = 2048
+# Number of values added to a quantile sketch at once
+SKETCH_BLOCK_SIZE = 2**16
+# Rank error of a sketch of size k is SKETCH_ERROR_SCALE / k**SKETCH_ERROR_POWER
+SKETCH_ERROR_SCALE = 2.296
+SKETCH_ERROR_POWER = 0.9723
+
+
+class QuantileSketch:
+    """Mergeable sketch of the distribution of the values of a numeric column.
+
+    This is a KLL sketch (Karnin, Lang, and Liberty, 2016). Values are kept in
+    levels, where each value at level h stands for 2**h values of the column.
+    When a level is full, it is sorted and every other value, starting at
+    random from the first or the second, is promoted to the level above.
+    Until the first level fills up, every value is kept, and quantiles and
+    histograms are exact; after that, they are approximate, with the rank
+    error given by rank_error. The minimum and maximum are always exact.
+    Memory use depends on the size, not on the number of values.
+
+    Sketches of parts of a column (eg of shards of a dataset) can be merged,
+    and saved with to_dict to be merged later.
+
+    Args:
+        size (int): Capacity of the top level. Lower levels have two thirds
+            of the capacity of the level above. Defaults to SKETCH_SIZE.
+        seed (int): Seed of the random choices made when levels are
+            compacted. Defaults to 0.
+
+    Examples
+    --------
+    Median of a column that arrives in chunks, with a rank error of 0.1%
+
+        >>> sketch = QuantileSketch.from_rank_error(0.001)
+        >>> for chunk in np.array_split(np.arange(1_000_000.0), 10):
+        ...     sketch.update(chunk)
+        >>> sketch.quantiles([0.5])
+    """
+
+    def __init__(self, size: int = SKETCH_SIZE, seed: int = 0) -> None:
+        if size < 2:
+            raise ValueError("The size of a quantile sketch must be at least 2.")
+        self.size = size
+        self.seed = seed
+        self.n = 0
+        self.min = np.nan
+        self.max = np.nan
+        self.levels: List[np.ndarray] = [np.empty(0)]
+        self._rng = np.random.Generator(np.random.PCG64(seed))
+
+    @classmethod
+    def from_rank_error(cls, rank_error: float, seed: int = 0) -> "QuantileSketch":
+        """Creates a sketch that is small enough for a given rank error.
+
+        Args:
+            rank_error (float): Error in the rank of quantiles, as a fraction
+                of the number of values, eg 0.001.
+            seed (int): Seed of the random choices made when levels are
+                compacted. Defaults to 0.
+
+        Returns:
+            QuantileSketch: An empty sketch.
+
+        Raises:
+            ValueError: If the rank error isn't between 0 and 1.
+        """
+        if not 0 < rank_error < 1:
+            raise ValueError("rank_error must be between 0 and 1.")
+        size = int(
+            np.ceil((SKETCH_ERROR_SCALE / rank_error) ** (1 / SKETCH_ERROR_POWER))
+        )
+        return cls(max(size, 2), seed)
+
+    @property
+    def rank_error(self) -> float:
+        """Error in the rank of quantiles, as a fraction of the number of values.
+
+        This is 0 while the sketch keeps every value. After that, it is the
+        bound that the error of all quantiles is within, with 99% confidence
+        (as measured for KLL sketches by Apache DataSketches).
+
+        Returns:
+            float: Rank error, eg 0.001.
+        """
+        if len(self.levels) == 1:
+            return 0.0
+        return SKETCH_ERROR_SCALE / self.size**SKETCH_ERROR_POWER
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Converts the sketch to a dictionary of JSON types, to save it.
+
+        Returns:
+            Dict[str, Any]: The sketch, which from_dict turns back into a
+            QuantileSketch.
+        """
+        return {
+            "size": self.size,
+            "seed": self.seed,
+            "n": self.n,
+            "min": None if np.isnan(self.min) else float(self.min),
+            "max": None if np.isnan(self.max) else float(self.max),
+            "levels": [items.tolist() for items in self.levels],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "QuantileSketch":
+        """Creates a sketch from the output of to_dict.
+
+        Args:
+            data (Dict[str, Any]): Output of to_dict.
+
+        Returns:
+            QuantileSketch: The sketch that was saved.
+        """
+        sketch = cls(data["size"], data["seed"])
+        sketch.n = data["n"]
+        sketch.min = np.nan if data["min"] is None else data["min"]
+        sketch.max = np.nan if data["max"] is None else data["max"]
+        sketch.levels = [np.array(items, dtype="float64") for items in data["levels"]]
+        return sketch
+
+    def update(self, values: np.ndarray) -> None:
+        """Adds values to the sketch. Missing values (NaN) are left out.
+
+        Args:
+            values (np.ndarray): Values to add.
+        """
+        values = np.asarray(values, dtype="float64")
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return
+        self.n += values.size
+        self.min = np.fmin(self.min, values.min())
+        self.max = np.fmax(self.max, values.max())
+        # in blocks, so that no more than a block is sorted at once
+        for start in range(0, values.size, SKETCH_BLOCK_SIZE):
+            block = values[start : start + SKETCH_BLOCK_SIZE]
+            self.levels[0] = np.concatenate([self.levels[0], block])
+            self._compact()
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """Adds all of the values summarised by another sketch to this one.
+
+        Args:
+            other (QuantileSketch): Sketch of other values of the column.
+        """
+        self.n += other.n
+        self.min = np.fmin(self.min, other.min)
+        self.max = np.fmax(self.max, other.max)
+        for level, items in enumerate(other.levels):
+            if level == len(self.levels):
+                self.levels.append(np.empty(0))
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self._compact()
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - 1 - level
+        return max(2, int(np.ceil(self.size * (2 / 3) ** depth)))
+
+    def _compact(self) -> None:
+        level = 0
+        while level < len(self.levels):
+            if self.levels[level].size <= self._capacity(level):
+                level += 1
+                continue
+            if level + 1 == len(self.levels):
+                self.levels.append(np.empty(0))
+            items = np.sort(self.levels[level])
+            # an odd value out stays where it is, so that no weight is lost
+            n_stay = items.size % 2
+            offset = n_stay + self._rng.integers(2)
+            self.levels[level] = items[:n_stay]
+            self.levels[level + 1] = np.concatenate(
+                [self.levels[level + 1], items[offset::2]]
+            )
+            # a new level shrinks the capacities of the levels below it
+            level = 0
+
+    def _sorted_items(self) -> Tuple[np.ndarray, np.ndarray]:
+        weights = np.concatenate(
+            [np.full(items.size, 2**level) for level, items in enumerate(self.levels)]
+        )
+        items = np.concatenate(self.levels)
+        order = np.argsort(items, kind="stable")
+        return items[order], weights[order]
+
+    def quantiles(self, qs: List[float]) -> np.ndarray:
+        """Quantiles of the values, with linear interpolation as np.percentile.
+
+        Args:
+            qs (List[float]): Quantiles to compute, between 0 and 1.
+
+        Returns:
+            np.ndarray: Quantiles of the values (NaN if there are none).
+        """
+        fractions = np.asarray(qs, dtype="float64")
+        if self.n == 0:
+            return np.full(fractions.shape, np.nan)
+        if len(self.levels) == 1:
+            return np.percentile(self.levels[0], fractions * 100)
+        items, weights = self._sorted_items()
+        cum_weights = np.cumsum(weights)
+        ranks = fractions * (self.n - 1)
+        below = np.floor(ranks)
+        last = items.size - 1
+        lo = items[np.minimum(np.searchsorted(cum_weights, below, "right"), last)]
+        hi = items[np.minimum(np.searchsorted(cum_weights, below + 1, "right"), last)]
+        result = lo + (ranks - below) * (hi - lo)
+        result[fractions == 0] = self.min
+        result[fractions == 1] = self.max
+        return result
+
+    def histogram(self) -> np.ndarray:
+        """Density of the values in the bins that _create_unicode_hists uses.
+
+        Returns:
+            np.ndarray: Density of each of the HIST_BINS bins.
+
+        Raises:
+            ValueError: If there are infinite values, as np.histogram would.
+        """
+        first_edge, last_edge = (0.0, 1.0) if self.n == 0 else (self.min, self.max)
+        if not (np.isfinite(first_edge) and np.isfinite(last_edge)):
+            raise ValueError(
+                f"autodetected range of [{first_edge}, {last_edge}] is not finite"
+            )
+        if first_edge == last_edge:
+            first_edge, last_edge = first_edge - 0.5, last_edge + 0.5
+        edges = np.linspace(first_edge, last_edge, HIST_BINS + 1)
+        items, weights = self._sorted_items()
+        cum_weights = np.concatenate([[0], np.cumsum(weights)])
+        # Values are in bin i if edges[i] <= value < edges[i + 1], with the
+        # last bin including its upper edge
+        n_at_least = self.n - cum_weights[np.searchsorted(items, edges[1:-1])]
+        n_at_least = np.concatenate([[self.n], n_at_least, [0]])
+        counts = n_at_least[:-1] - n_at_least[1:]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return counts / np.diff(edges) / counts.sum()
 
 
 @typechecked
-def _numeric_variable_summary_table(xf: pd.DataFrame) -> pd.DataFrame:
+def _numeric_variable_summary_table(
+    xf: pd.DataFrame, quantile_error: Optional[float] = None
+) -> pd.DataFrame:
     """Summarise dataframe columns that have numeric type.
     WARNING: this usually rounds to 4 significant figures.
 
     Args:
         xf (pd.DataFrame): Dataframe with columns of only numeric types
+        quantile_error (Optional[float]): If given, quantiles are estimated
+            with quantile sketches with this rank error, and the rank error
+            of each column is added. Defaults to None (exact quantiles).
 
     Returns:
         pd.DataFrame: A dataframe of summary statistics, with a number of rows
         determined by number of columns of xf
     """
-    count_nans_vec = xf.isna().sum()
+    column_stats = pd.DataFrame(
+        [_numeric_column_stats(xf[col], quantile_error) for col in xf.columns],
+        index=xf.columns,
+    )
+    count_nans_vec = column_stats[MISSING_COL]
     data_dict = {
         MISSING_COL: count_nans_vec,
         COMPLETE_COL: 100 * count_nans_vec / xf.shape[0],
-        NUM_COL_MEAN: _round_series(xf.mean(), 4),
-        "sd": _round_series(xf.std(), 4),
+        NUM_COL_MEAN: _round_series(column_stats[NUM_COL_MEAN], 4),
+        "sd": _round_series(column_stats["sd"], 4),
     }
     display_quantiles_as_pct = 100
-    quantiles_dict = dict(
-        zip(
-            ["p" + str(int(x * display_quantiles_as_pct)) for x in QUANTILES],
-            [_round_series(xf.quantile(x), 4) for x in QUANTILES],
+    quantiles_dict = {
+        "p" + str(int(x * display_quantiles_as_pct)): _round_series(
+            column_stats[f"q{x}"], 4
         )
-    )
+        for x in QUANTILES
+    }
     data_dict.update(quantiles_dict)
+    if quantile_error is not None:
+        data_dict[RANK_ERROR_COL] = _round_series(column_stats[RANK_ERROR_COL], 4)
     # Create histogram using unicode block elements
     # https://en.wikipedia.org/wiki/Block_Elements
-    hist_series = pd.concat(
-        [_create_unicode_hist(xf[col].dropna()) for col in xf.columns], axis=0
-    )
-    data_dict.update({"hist": hist_series})
+    data_dict.update({"hist": _create_unicode_hists(xf)})
     summary_df = pd.DataFrame(data_dict)
     return summary_df
 
 
+@typing.no_type_check
+def _numeric_column_stats(
+    series: pd.Series, quantile_error: Optional[float] = None
+) -> Dict[str, Any]:
+    """Computes all of the summary statistics of one numeric column together.
+
+    The column's values and missing value mask are extracted once, and all of
+    the quantiles come from a single partition of the values that aren't
+    missing. The mean and standard deviation are computed as pandas computes
+    them, so the results are the same as xf.mean(), xf.std(), and
+    xf.quantile(). With a quantile error, the quantiles come from a
+    QuantileSketch instead, which doesn't need a copy of the values.
+
+    Args:
+        series (pd.Series): Numeric column of data frame for analysis
+        quantile_error (Optional[float]): Rank error of the quantiles, if they
+            are to be estimated. Defaults to None (exact quantiles).
+
+    Returns:
+        Dict[str, Any]: Missing values, mean, sd, and quantiles ('q{x}' for x
+        in QUANTILES) of the column, and their rank error if estimated.
+    """
+    values = series.to_numpy()
+    if values.dtype.kind not in "iuf":
+        values = series.to_numpy(dtype="float64", na_value=np.nan)
+    if values.dtype.kind == "f":
+        mask = np.isnan(values)
+        valid = values[~mask]
+    else:
+        mask = None
+        valid = values
+    count = valid.size
+    stats = {MISSING_COL: values.size - count}
+    # as in pandas.core.nanops: missing values are replaced with zeros, and
+    # floats keep their precision (ints are summarised as float64)
+    dtype = values.dtype if values.dtype.kind == "f" else np.dtype("float64")
+    values = values.astype(dtype, copy=mask is not None)
+    if mask is not None:
+        np.putmask(values, mask, 0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = values.sum(dtype=dtype) / dtype.type(count)
+        avg = mean if dtype == np.float64 else values.sum(dtype=np.float64) / count
+        sqr = (avg - values) ** 2
+        if mask is not None:
+            np.putmask(sqr, mask, 0)
+        var = sqr.sum(dtype=np.float64) / (count - 1) if count > 1 else np.nan
+    stats[NUM_COL_MEAN] = mean
+    stats["sd"] = np.sqrt(dtype.type(var))
+    if quantile_error is not None:
+        sketch = QuantileSketch.from_rank_error(quantile_error)
+        sketch.update(valid)
+        quantiles = sketch.quantiles(QUANTILES)
+        stats[RANK_ERROR_COL] = sketch.rank_error
+    elif count:
+        quantiles = np.percentile(valid, np.array(QUANTILES) * 100)
+    else:
+        quantiles = [np.nan] * len(QUANTILES)
+    stats.update({f"q{x}": q for x, q in zip(QUANTILES, quantiles)})
+    return stats
+
+
 @typechecked
 def _category_variable_summary_table(xf: pd.DataFrame) -> pd.DataFrame:
     """Summarise dataframe columns that have category type.
@@ -432,13 +1073,31 @@ def _category_variable_summary_table(xf: pd.DataFrame) -> pd.DataFrame:
             dict(zip(xf.columns, [xf[col].cat.ordered for col in xf.columns]))
         ),
         "unique": pd.Series(
-            dict(zip(xf.columns, [len(xf[col].unique()) for col in xf.columns]))
+            dict(zip(xf.columns, [_count_categories(xf[col]) for col in xf.columns]))
         ),
     }
     summary_df = pd.DataFrame(data_dict)
     return summary_df
 
 
+@typechecked
+def _count_categories(series: pd.Series) -> int:
+    """Counts the unique values of a category column from its codes.
+
+    Unlike series.unique(), this needs no more memory than one count per
+    category. As in pandas, missing values count as a unique value.
+
+    Args:
+        series (pd.Series): Column of category type.
+
+    Returns:
+        int: Number of categories that appear, plus 1 if any are missing.
+    """
+    codes = series.cat.codes.to_numpy()
+    counts = np.bincount(codes[codes >= 0], minlength=len(series.cat.categories))
+    return int(np.count_nonzero(counts)) + int((codes < 0).any())
+
+
 @typechecked
 def _bool_variable_summary_table(xf: pd.DataFrame) -> pd.DataFrame:
     """Summarise dataframe columns that have boolean type.
@@ -454,14 +1113,295 @@ def _bool_variable_summary_table(xf: pd.DataFrame) -> pd.DataFrame:
         "true": xf.sum(),
         "true rate": _round_series(xf.sum() / xf.shape[0]),
     }
-    hist_series = pd.concat(
-        [_create_unicode_hist(xf[col].dropna()) for col in xf.columns], axis=0
-    )
-    data_dict.update({"hist": hist_series})
+    data_dict.update({"hist": _create_unicode_hists(xf)})
     summary_df = pd.DataFrame(data_dict)
     return summary_df
 
 
+# Precision of HyperLogLog: the number of bits of a hash that pick its register
+HLL_PRECISION = 14
+# Number of distinct values up to which HyperLogLog counts exactly
+HLL_EXACT_LIMIT = 2**14
+# Maximum number of bytes of strings hashed at once
+HASH_BLOCK_SIZE = 2**16
+# Multipliers of the polynomial string hash and of the splitmix64 finaliser
+_HASH_PRIME = 0x100000001B3
+_HASH_GOLDEN = 0x9E3779B97F4A7C15
+_HASH_MIX = (0xBF58476D1CE4E5B9, 0x94D049BB133111EB)
+
+
+@typing.no_type_check
+def _hash_strings(arr: pa.Array) -> np.ndarray:
+    """Computes a 64-bit hash of every string (or binary) of an Arrow array.
+
+    Strings are hashed straight from the Arrow buffers, in blocks of about
+    HASH_BLOCK_SIZE bytes, without creating Python objects. Each string is
+    read as a polynomial in its bytes (mod 2**64), so the sum of every string
+    in a block comes from one cumulative sum over the bytes of the block.
+    The polynomial and the length of the string are then mixed with the
+    splitmix64 finaliser. Missing values are left out.
+
+    Args:
+        arr (pa.Array): Array of strings, or of the UTF-8 bytes of strings.
+
+    Returns:
+        np.ndarray: Hashes (uint64) of the strings that aren't missing.
+    """
+    arr = arr.drop_null().cast(pa.large_binary())
+    if isinstance(arr, pa.ChunkedArray):
+        arr = arr.combine_chunks()
+    n = len(arr)
+    offsets = np.frombuffer(arr.buffers()[1], dtype=np.int64)[
+        arr.offset : arr.offset + n + 1
+    ]
+    data = arr.buffers()[2]
+    data = np.frombuffer(data, dtype=np.uint8) if data is not None else np.empty(0)
+    lengths = np.diff(offsets)
+    # powers of the prime, and of its inverse (mod 2**64), by position in a block
+    size = max(HASH_BLOCK_SIZE, int(lengths.max(initial=0))) + 1
+    powers = np.cumprod(np.full(size, _HASH_PRIME, dtype=np.uint64))
+    powers = np.concatenate([[np.uint64(1)], powers[:-1]])
+    inverses = np.cumprod(np.full(size, pow(_HASH_PRIME, -1, 2**64), dtype=np.uint64))
+    inverses = np.concatenate([[np.uint64(1)], inverses[:-1]])
+    hashes = np.empty(n, dtype=np.uint64)
+    start = 0
+    while start < n:
+        end = int(np.searchsorted(offsets, offsets[start] + HASH_BLOCK_SIZE, "right"))
+        end = min(max(end - 1, start + 1), n)
+        lo, hi = offsets[start], offsets[end]
+        terms = data[lo:hi].astype(np.uint64) + np.uint64(1)
+        terms *= powers[: hi - lo]
+        sums = np.concatenate([np.zeros(1, dtype=np.uint64), np.cumsum(terms)])
+        starts = offsets[start:end] - lo
+        # shift each string's polynomial back to start at its first byte
+        z = (sums[offsets[start + 1 : end + 1] - lo] - sums[starts]) * inverses[starts]
+        z ^= lengths[start:end].astype(np.uint64) * np.uint64(_HASH_GOLDEN)
+        for shift, multiplier in zip((30, 27), _HASH_MIX):
+            z = (z ^ (z >> np.uint64(shift))) * np.uint64(multiplier)
+        hashes[start:end] = z ^ (z >> np.uint64(31))
+        start = end
+    return hashes
+
+
+def _hll_sigma(x: float) -> float:
+    """The sigma function of Ertl's HyperLogLog estimator.
+
+    Args:
+        x (float): Fraction of registers that are 0.
+
+    Returns:
+        float: x + sum of x**(2**k) * 2**(k - 1) for k >= 1.
+    """
+    if x == 1:
+        return np.inf
+    y, z = 1.0, x
+    while True:
+        x *= x
+        z_old, z = z, z + x * y
+        y += y
+        if z == z_old:
+            return z
+
+
+def _hll_tau(x: float) -> float:
+    """The tau function of Ertl's HyperLogLog estimator.
+
+    Args:
+        x (float): One minus the fraction of registers that are full.
+
+    Returns:
+        float: (1 - x - sum of (1 - x**(2**-k))**2 * 2**-k for k >= 1) / 3.
+    """
+    if x in (0, 1):
+        return 0.0
+    y, z = 1.0, 1 - x
+    while True:
+        x = np.sqrt(x)
+        y *= 0.5
+        z_old, z = z, z - (1 - x) ** 2 * y
+        if z == z_old:
+            return z / 3
+
+
+class HyperLogLog:
+    """Mergeable estimate of the number of distinct values of a column.
+
+    This is HyperLogLog (Flajolet, Fusy, Gandouet, and Meunier, 2007), with
+    64-bit hashes. The first `precision` bits of the hash of a value pick one
+    of 2**precision registers, which keeps the largest position of the first
+    1 bit among the rest of the hashes it has seen. So memory use is fixed,
+    at 2**precision bytes, and the relative standard error of the estimate
+    is 1.04 / sqrt(2**precision) (0.8% with the default precision). Until
+    more than exact_limit distinct values have been seen, their hashes are
+    kept too, and the count is exact.
+
+    Counts of parts of a column (eg of chunks of rows) can be merged, and
+    saved with to_dict to be merged later.
+
+    Args:
+        precision (int): Number of bits of a hash that pick its register,
+            from 4 to 18. Defaults to HLL_PRECISION.
+        exact_limit (int): Number of distinct values up to which the count is
+            exact. Defaults to HLL_EXACT_LIMIT.
+
+    Raises:
+        ValueError: If the precision is out of range.
+
+    Examples
+    --------
+    Count the distinct values of a column that arrives in chunks
+
+        >>> df = generate_test_data()
+        >>> distinct = HyperLogLog()
+        >>> for start in range(0, len(df), 250):
+        ...     distinct.update(df["text"].iloc[start : start + 250])
+        >>> distinct.count()
+    """
+
+    def __init__(
+        self, precision: int = HLL_PRECISION, exact_limit: int = HLL_EXACT_LIMIT
+    ) -> None:
+        if not 4 <= precision <= 18:
+            raise ValueError("The precision of HyperLogLog must be from 4 to 18.")
+        self.precision = precision
+        self.exact_limit = exact_limit
+        self.registers = np.zeros(2**precision, dtype=np.uint8)
+        self.hashes: Optional[np.ndarray] = np.empty(0, dtype=np.uint64)
+
+    def update(self, values: Any) -> None:
+        """Adds values, as strings, to the count. Missing values are left out.
+
+        Args:
+            values (Any): A pyarrow array, pandas series, or sequence of values.
+        """
+        if not isinstance(values, (pa.Array, pa.ChunkedArray)):
+            try:
+                values = pa.array(values, from_pandas=True)
+            except (pa.ArrowException, UnicodeEncodeError):
+                # eg lone surrogates, which can't be encoded as UTF-8
+                values = pa.array(
+                    [
+                        x.encode("utf-8", "surrogatepass")
+                        for x in pd.Series(values).dropna()
+                    ],
+                    type=pa.binary(),
+                )
+        self.update_hashes(_hash_strings(values))
+
+    def update_hashes(self, hashes: np.ndarray) -> None:
+        """Adds values, given by their 64-bit hashes, to the count.
+
+        Args:
+            hashes (np.ndarray): Hashes (uint64) of the values.
+        """
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        if hashes.size == 0:
+            return
+        # The position of the first 1 bit of the rest of a hash is found from
+        # the exponent of it as a float, so at most 53 bits (a float's
+        # precision) are used
+        n_bits = min(64 - self.precision, 53)
+        rest = (hashes << np.uint64(self.precision)) >> np.uint64(64 - n_bits)
+        _, exponents = np.frexp(rest.astype("float64"))
+        ranks = (n_bits + 1 - exponents).astype(np.uint8)
+        index = (hashes >> np.uint64(64 - self.precision)).astype(np.intp)
+        np.maximum.at(self.registers, index, ranks)
+        if self.hashes is not None:
+            if self._estimate() > 2 * self.exact_limit:
+                self.hashes = None
+            else:
+                self._add_exact(pd.unique(hashes))
+
+    def merge(self, other: "HyperLogLog") -> None:
+        """Adds all of the values counted by another HyperLogLog to this one.
+
+        Args:
+            other (HyperLogLog): Count of other values of the column.
+
+        Raises:
+            ValueError: If the two have different precisions.
+        """
+        if other.precision != self.precision:
+            raise ValueError("Only HyperLogLogs with the same precision can merge.")
+        np.maximum(self.registers, other.registers, out=self.registers)
+        if self.hashes is not None and other.hashes is not None:
+            self._add_exact(other.hashes)
+        else:
+            self.hashes = None
+
+    def _add_exact(self, hashes: np.ndarray) -> None:
+        self.hashes = pd.unique(np.concatenate([self.hashes, hashes]))
+        if self.hashes.size > self.exact_limit:
+            self.hashes = None
+
+    def _estimate(self) -> float:
+        # The improved estimator of Ertl (2017), which, unlike the original
+        # one, is unbiased for small counts without empirical corrections
+        m = self.registers.size
+        q = min(64 - self.precision, 53)
+        counts = np.bincount(self.registers, minlength=q + 2)
+        if counts[0] == m:
+            return 0.0
+        z = m * _hll_tau(1 - counts[q + 1] / m)
+        for k in range(q, 0, -1):
+            z = 0.5 * (z + counts[k])
+        z += m * _hll_sigma(counts[0] / m)
+        return float(m * m / (2 * np.log(2)) / z)
+
+    def count(self) -> int:
+        """The number of distinct values: exact, or estimated.
+
+        Returns:
+            int: Number of distinct values.
+        """
+        if self.hashes is not None:
+            return int(self.hashes.size)
+        return int(round(self._estimate()))
+
+    @property
+    def relative_error(self) -> float:
+        """Relative standard error of count (0 while the count is exact).
+
+        Returns:
+            float: Relative standard error, eg 0.008.
+        """
+        if self.hashes is not None:
+            return 0.0
+        return 1.04 / np.sqrt(self.registers.size)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Converts the count to a dictionary of JSON types, to save it.
+
+        Returns:
+            Dict[str, Any]: The count, which from_dict turns back into a
+            HyperLogLog.
+        """
+        return {
+            "precision": self.precision,
+            "exact_limit": self.exact_limit,
+            "registers": self.registers.tolist(),
+            "hashes": None if self.hashes is None else self.hashes.tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "HyperLogLog":
+        """Creates a HyperLogLog from the output of to_dict.
+
+        Args:
+            data (Dict[str, Any]): Output of to_dict.
+
+        Returns:
+            HyperLogLog: The count that was saved.
+        """
+        distinct = cls(data["precision"], data["exact_limit"])
+        distinct.registers = np.array(data["registers"], dtype=np.uint8)
+        if data["hashes"] is None:
+            distinct.hashes = None
+        else:
+            distinct.hashes = np.array(data["hashes"], dtype=np.uint64)
+        return distinct
+
+
 @typechecked
 def _string_variable_summary_table(xf: pd.DataFrame) -> pd.DataFrame:
     """Summarise dataframe columns that have string type. (NB not object type).
@@ -473,88 +1413,149 @@ def _string_variable_summary_table(xf: pd.DataFrame) -> pd.DataFrame:
         pd.DataFrame: A dataframe of summary statistics, with a number of rows
         determined by number of columns of xf
     """
-    count_nans_vec = xf.isna().sum()
+    column_stats = pd.DataFrame(
+        [_string_column_stats(xf[col]) for col in xf.columns],
+        index=xf.columns,
+    )
+    count_nans_vec = column_stats[MISSING_COL]
+    words_vec = column_stats["words"].astype("int")
     data_dict = {
         MISSING_COL: count_nans_vec,
         COMPLETE_COL: 100 * count_nans_vec / xf.shape[0],
-        "shortest": pd.Series(
-            dict(
-                zip(
-                    xf.columns,
-                    [xf.loc[xf[col].str.len().argmin(), col] for col in xf.columns],  # type: ignore
-                )
-            )
-        ),
-        "longest": pd.Series(
-            dict(
-                zip(
-                    xf.columns,
-                    [xf.loc[xf[col].str.len().argmax(), col] for col in xf.columns],  # type: ignore
-                )
-            )
-        ),
+        "shortest": column_stats["shortest"],
+        "longest": column_stats["longest"],
         # Below are alphabetical min and max
-        "min": pd.Series(
-            dict(zip(xf.columns, [xf[col].sort_values().iloc[0] for col in xf.columns]))
-        ),
-        "max": pd.Series(
-            dict(
-                zip(
-                    xf.columns,
-                    [
-                        xf[col].sort_values(ascending=False).iloc[0]
-                        for col in xf.columns
-                    ],
-                )
-            )
-        ),
-        "chars per row": _round_series(
-            pd.Series(
-                dict(zip(xf.columns, [xf[col].str.len().mean() for col in xf.columns]))
-            ),
-            3,
-        ),
-        "words per row": _round_series(
-            pd.Series(
-                dict(
-                    zip(
-                        xf.columns,
-                        [
-                            xf[col].str.count(" ").add(1).sum() / len(xf)
-                            for col in xf.columns
-                        ],
-                    )
-                )
-            )
-        ),
-        "total words": pd.Series(
-            dict(
-                zip(
-                    xf.columns,
-                    [xf[col].str.count(" ").add(1).sum() for col in xf.columns],
+        "min": column_stats["min"],
+        "max": column_stats["max"],
+        # as for categories, missing values count as a unique value
+        "unique": pd.Series(
+            [
+                n_distinct + int(n_nans > 0)
+                for n_distinct, n_nans in zip(
+                    column_stats["n_distinct"], count_nans_vec
                 )
-            ),
-            dtype="int",
+            ],
+            index=xf.columns,
         ),
+        "chars per row": _round_series(column_stats["chars"].astype("float64"), 3),
+        "words per row": _round_series(words_vec / len(xf)),
+        "total words": words_vec,
     }
     summary_df = pd.DataFrame(data_dict)
     return summary_df
 
 
-@typechecked
-def _timedelta_variable_summary_table(xf: pd.DataFrame) -> pd.DataFrame:
-    """Summarise dataframe columns that have timedelta type. (NB not object type).
+@typing.no_type_check
+def _string_column_stats(series: pd.Series) -> Dict[str, Any]:
+    """Computes all of the summary statistics of one string column together.
+
+    The column is viewed as an Arrow array (without a copy if it is already
+    string[pyarrow]), and the length and number of spaces of each string are
+    computed once, with Arrow compute functions. The shortest and longest
+    strings are the first ones with the minimum and maximum lengths, and the
+    alphabetical min and max are found without sorting. Words are counted as
+    one more than the number of spaces, and distinct strings with a
+    HyperLogLog, which is exact for up to HLL_EXACT_LIMIT of them; as the
+    whole column is in memory, more of them are then counted exactly too.
 
     Args:
-        xf (pd.DataFrame):  Dataframe with columns of only timedelta types
+        series (pd.Series): String column of data frame for analysis
 
     Returns:
-        pd.DataFrame: A dataframe of summary statistics, with a number of rows
-        determined by number of columns of xf
+        Dict[str, Any]: Missing values, shortest, longest, min, and max
+        strings, mean characters per string, total words, and the distinct
+        strings (a HyperLogLog, to merge with those of other parts of the
+        column) and exact number of them, of the column.
     """
-    count_nans_vec = xf.isna().sum()
-    # NB: timedelta doesn't play nicely with rounding
-    data_dict = {
+    try:
+        arr = pa.array(series, from_pandas=True)
+    except (pa.ArrowException, UnicodeEncodeError):
+        # eg lone surrogates, which can't be encoded as UTF-8
+        return _string_column_stats_python(series)
+    if arr.null_count == len(arr):
+        return _string_column_stats_python(series)
+    return _string_array_stats(arr)
+
+
+@typing.no_type_check
+def _string_array_stats(arr: Union[pa.Array, pa.ChunkedArray]) -> Dict[str, Any]:
+    """Computes all of the summary statistics of an Arrow array of strings.
+
+    See _string_column_stats, which this is the Arrow part of.
+
+    Args:
+        arr (Union[pa.Array, pa.ChunkedArray]): Strings, at least one of which
+            isn't missing.
+
+    Returns:
+        Dict[str, Any]: Missing values, shortest, longest, min, and max
+        strings, mean characters per string, total words, and the distinct
+        strings (a HyperLogLog) and exact number of them, of the array.
+    """
+    n_valid = len(arr) - arr.null_count
+    lengths = pc.utf8_length(arr)
+    length_range = pc.min_max(lengths)
+    value_range = pc.min_max(arr)
+    distinct = HyperLogLog()
+    distinct.update(arr)
+    n_distinct = distinct.count()
+    if distinct.relative_error:
+        n_distinct = pc.count_distinct(arr).as_py()
+    return {
+        MISSING_COL: arr.null_count,
+        "shortest": arr[pc.index(lengths, length_range["min"]).as_py()].as_py(),
+        "longest": arr[pc.index(lengths, length_range["max"]).as_py()].as_py(),
+        "min": value_range["min"].as_py(),
+        "max": value_range["max"].as_py(),
+        "chars": pc.sum(lengths).as_py() / n_valid,
+        "words": pc.sum(pc.count_substring(arr, " ")).as_py() + n_valid,
+        "distinct": distinct,
+        "n_distinct": n_distinct,
+    }
+
+
+@typing.no_type_check
+def _string_column_stats_python(series: pd.Series) -> Dict[str, Any]:
+    """Computes the statistics of _string_column_stats with pandas.
+
+    Args:
+        series (pd.Series): String column of data frame for analysis
+
+    Returns:
+        Dict[str, Any]: Missing values, shortest, longest, min, and max
+        strings, mean characters per string, total words, and the distinct
+        strings (a HyperLogLog) and exact number of them, of the column.
+    """
+    lengths = series.str.len()
+    distinct = HyperLogLog()
+    distinct.update(series)
+    return {
+        MISSING_COL: series.isna().sum(),
+        "shortest": series.iloc[lengths.argmin()],
+        "longest": series.iloc[lengths.argmax()],
+        "min": series.min(),
+        "max": series.max(),
+        "chars": lengths.mean(),
+        "words": series.str.count(" ").add(1).sum(),
+        "distinct": distinct,
+        "n_distinct": series.nunique(),
+    }
+
+
+@typechecked
+def _timedelta_variable_summary_table(xf: pd.DataFrame) -> pd.DataFrame:
+    """Summarise dataframe columns that have timedelta type. (NB not object type).
+
+    Args:
+        xf (pd.DataFrame):  Dataframe with columns of only timedelta types
+
+    Returns:
+        pd.DataFrame: A dataframe of summary statistics, with a number of rows
+        determined by number of columns of xf
+    """
+    count_nans_vec = xf.isna().sum()
+    # NB: timedelta doesn't play nicely with rounding
+    data_dict = {
         MISSING_COL: count_nans_vec,
         COMPLETE_COL: 100 * count_nans_vec / xf.shape[0],
         NUM_COL_MEAN: xf.mean().dt.floor("s"),
@@ -606,177 +1607,2086 @@ def _datetime_variable_summary_table(xf: pd.DataFrame) -> pd.DataFrame:
     return summary_df
 
 
-@typechecked
-def _empty_column_summary_table(xf: pd.DataFrame) -> pd.DataFrame:
-    """Summarise dataframe columns that have all empty entries.
+@typechecked
+def _empty_column_summary_table(xf: pd.DataFrame) -> pd.DataFrame:
+    """Summarise dataframe columns that have all empty entries.
+
+    Args:
+        xf (pd.DataFrame): A dataframe with only empty columns
+
+    Returns:
+        pd.DataFrame: A dataframe of summary statistics, with a number of rows
+        determined by number of columns of xf
+    """
+    count_nans_vec = xf.isna().sum()
+    data_dict = {
+        MISSING_COL: count_nans_vec,
+        COMPLETE_COL: 100 * count_nans_vec / xf.shape[0],
+    }
+    summary_df = pd.DataFrame(data_dict)
+    return summary_df
+
+
+@typechecked
+def _delete_unsupported_columns(
+    df: pd.DataFrame, type_plan: Optional[pd.DataFrame] = None
+) -> pd.DataFrame:
+    """This will remove the pd.api.types.infer_dtype types that are not
+    supported.
+
+    Args:
+        df (pd.DataFrame): Input dataframe.
+        type_plan (Optional[pd.DataFrame], optional): Output of
+            _infer_column_type_plan. Computed from df if not given.
+
+    Returns:
+        pd.DataFrame: Dataframe with unsupported columns removed.
+
+    Raises:
+        ValueError: If the input dataframe only has unsupported column types.
+    """
+    if type_plan is None:
+        type_plan = _infer_column_type_plan(df)
+    to_delete = set(type_plan.loc[~type_plan["keep"], "column"])
+    if to_delete:
+        df = _frame_from_columns(
+            df, [i for i, col in enumerate(df.columns) if col not in to_delete]
+        )
+    if df.empty:
+        raise ValueError(
+            f"Your input dataframe only has unsupported column types, eg {', '.join(UNSUPPORTED_INFERRED_TYPES)}"
+        )
+    return df
+
+
+# Maximum number of column summaries that a SummaryCache keeps
+SUMMARY_CACHE_SIZE = 4096
+
+
+@typing.no_type_check
+def _column_buffers(series: pd.Series) -> Iterable[Any]:
+    """Yields the memory buffers that hold the values of a column.
+
+    Numpy-backed columns are one buffer (without a copy, where the column is
+    contiguous), and Arrow-backed columns, categories, and nullable columns
+    are the buffers of their Arrow arrays. Object columns have no buffer of
+    their values (only of pointers to them), so their values are hashed.
+
+    Args:
+        series (pd.Series): Column of a dataframe.
+
+    Yields:
+        Any: Buffers (or arrays) whose bytes are the column's values.
+    """
+    values = series.array
+    if pd.api.types.is_object_dtype(series.dtype):
+        yield pd.util.hash_pandas_object(series, index=False).to_numpy()
+    elif hasattr(values, "__arrow_array__"):
+        arrays = list(pa.chunked_array(values).chunks)
+        while arrays:
+            arr = arrays.pop()
+            yield np.array([arr.offset, len(arr)], dtype=np.int64)
+            yield from (buffer for buffer in arr.buffers() if buffer is not None)
+            if pa.types.is_dictionary(arr.type):
+                arrays.append(arr.dictionary)
+    else:
+        yield np.ascontiguousarray(series.to_numpy())
+
+
+@typechecked
+def _column_fingerprint(series: pd.Series) -> Optional[str]:
+    """A cheap fingerprint of the content of a column.
+
+    This is a hash of the column's type (including whether its categories are
+    ordered), length, and memory buffers, so two columns with the same values
+    have the same fingerprint, whatever their names or index. Columns that can't be hashed (eg of lists, or of strings
+    that can't be encoded as UTF-8) have no fingerprint.
+
+    Args:
+        series (pd.Series): Column of a dataframe.
+
+    Returns:
+        Optional[str]: Hex digest of the column's content, or None.
+    """
+    ordered = getattr(series.dtype, "ordered", None)
+    digest = hashlib.blake2b(
+        f"{series.dtype}:{ordered}:{len(series)}".encode(), digest_size=16
+    )
+    try:
+        for buffer in _column_buffers(series):
+            digest.update(memoryview(buffer).cast("B"))
+    except (TypeError, ValueError, UnicodeEncodeError, pa.ArrowException):
+        return None
+    return digest.hexdigest()
+
+
+class SummaryCache:
+    """A cache of the summaries of columns, keyed by their content.
+
+    Pass the same cache to skim or skim_get_data on dataframes that only
+    change in a few columns, and only the columns whose content has changed
+    (see _column_fingerprint) are summarised again. Summaries are kept in
+    memory, up to max_size of them, and the least recently used are evicted
+    first. If a directory is given, they are saved there too (as pickles, so
+    only use a directory that you trust), and so can be re-used by other
+    processes; the directory is kept to max_size summaries in the same way.
+
+    Other backends (eg a key-value store) can be plugged in by subclassing
+    this and overriding get and put.
+
+    Args:
+        max_size (int): Maximum number of column summaries to keep. Defaults
+            to SUMMARY_CACHE_SIZE.
+        directory (Optional[Union[os.PathLike, str]]): Directory to save
+            summaries in. Defaults to None (memory only).
+
+    Examples
+    --------
+    Skim a dataframe again after changing one of its columns
+
+        >>> df = generate_test_data()
+        >>> cache = SummaryCache()
+        >>> skim(df, cache=cache)
+        >>> df["length"] = df["length"] * 1.2
+        >>> skim(df, cache=cache)
+    """
+
+    def __init__(
+        self,
+        max_size: int = SUMMARY_CACHE_SIZE,
+        directory: Optional[Union[os.PathLike, str]] = None,
+    ) -> None:
+        if max_size < 1:
+            raise ValueError("max_size must be a positive number of summaries.")
+        self.max_size = max_size
+        self.directory = None if directory is None else pathlib.Path(directory)
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+        self._entries: OrderedDict[str, pd.DataFrame] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[pd.DataFrame]:
+        """Looks up a summary, and marks it as the most recently used.
+
+        Args:
+            key (str): Key of the summary.
+
+        Returns:
+            Optional[pd.DataFrame]: The summary (one row of a summary table),
+            or None if it isn't in the cache.
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+        if self.directory is not None:
+            path = self.directory / f"{key}.pkl"
+            try:
+                summary = pd.read_pickle(path)
+                os.utime(path)
+            except (OSError, EOFError, pickle.UnpicklingError):
+                return None
+            self._remember(key, summary)
+            return summary
+        return None
+
+    def put(self, key: str, summary: pd.DataFrame) -> None:
+        """Adds a summary, evicting the least recently used if there are too many.
+
+        Args:
+            key (str): Key of the summary.
+            summary (pd.DataFrame): The summary (one row of a summary table).
+        """
+        self._remember(key, summary)
+        if self.directory is not None:
+            # write to a temporary file first, so readers never see half a file
+            path = self.directory / f"{key}.pkl"
+            temp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            summary.to_pickle(temp_path)
+            os.replace(temp_path, path)
+            paths = sorted(
+                self.directory.glob("*.pkl"), key=lambda x: x.stat().st_mtime
+            )
+            for old_path in paths[: max(len(paths) - self.max_size, 0)]:
+                old_path.unlink(missing_ok=True)
+
+    def _remember(self, key: str, summary: pd.DataFrame) -> None:
+        with self._lock:
+            self._entries[key] = summary
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+
+@typechecked
+def _run_cached_summary_functions(
+    tasks: List[Tuple[str, Callable[[pd.DataFrame], pd.DataFrame], pd.DataFrame]],
+    cache: SummaryCache,
+    options: str = "",
+    n_jobs: Optional[int] = None,
+) -> Dict[str, pd.DataFrame]:
+    """Runs summary functions only on the columns without a summary in a cache.
+
+    The summary of a column is a row of a summary table, which only depends
+    on the column, so each is cached by the name of its table and the
+    fingerprint of the column. The summaries of new or changed columns are
+    computed together (see _run_summary_functions), and added to the cache.
+
+    Args:
+        tasks (List[Tuple[str, Callable[[pd.DataFrame], pd.DataFrame], pd.DataFrame]]):
+            Name of each summary table, the function that computes it, and
+            the columns to compute it from.
+        cache (SummaryCache): Cache of summaries of columns.
+        options (str): Options that the summaries depend on, eg the rank
+            error of quantiles. Defaults to "".
+        n_jobs (Optional[int]): Number of threads (see _run_summary_functions).
+            Defaults to None (no threads).
+
+    Returns:
+        Dict[str, pd.DataFrame]: Summary tables, in the order of tasks.
+    """
+    keys = {}
+    summaries = {}
+    uncached_tasks = []
+    uncached_positions = {}
+    for name, summary_func, xf in tasks:
+        # summaries depend on the version of skimpy, the table, and options
+        prefix = f"{__version__}:{name}:{options}".encode()
+        prefix = hashlib.blake2b(prefix, digest_size=8).hexdigest()
+        fingerprints = [_column_fingerprint(series) for _, series in xf.items()]
+        keys[name] = [None if x is None else f"{prefix}-{x}" for x in fingerprints]
+        summaries[name] = [
+            None if key is None else cache.get(key) for key in keys[name]
+        ]
+        positions = [i for i, x in enumerate(summaries[name]) if x is None]
+        if positions:
+            uncached_positions[name] = positions
+            uncached_tasks.append(
+                (name, summary_func, _frame_from_columns(xf, positions))
+            )
+    computed = _run_summary_functions(uncached_tasks, n_jobs)
+    summary_tables = {}
+    for name, _, xf in tasks:
+        if len(uncached_positions.get(name, [])) == xf.shape[1]:
+            # nothing was cached, so the table is as computed
+            table = computed[name]
+        else:
+            for j, i in enumerate(uncached_positions.get(name, [])):
+                summaries[name][i] = computed[name].iloc[[j]]
+            table = pd.concat(summaries[name])
+        for j, i in enumerate(uncached_positions.get(name, [])):
+            key = keys[name][i]
+            if key is not None:
+                cache.put(key, computed[name].iloc[[j]])
+        table.index = xf.columns
+        summary_tables[name] = table
+    return summary_tables
+
+
+# Names of the kinds of column in the stages of profiles, by name of summary
+# table (or kind of column, in the polars and Arrow engines), where they differ
+SUMMARY_STAGE_KINDS = {
+    "integer": "number",
+    "float": "number",
+    str(datetime.date): "date",
+    "timedelta64[ns]": "timedelta",
+    # (the missing values of every object column, eg of dates)
+    "object": "other",
+    "All null": "all null",
+    "null": "all null",
+}
+
+
+class _Profiler:
+    """Records the wall time, CPU time, and peak memory of the stages of a skim.
+
+    Use it as a context manager around the skim, so that memory is traced
+    (with tracemalloc, which only sees memory allocated by Python and numpy,
+    and which slows the skim down), and record each stage with stage or wrap.
+    The records of stages with the same name, eg the shards of a summary
+    table on threads, are added up, and the largest peak memory is kept.
+    Stages on threads run at the same time, so their times overlap, and
+    their memory is traced together.
+    """
+
+    def __init__(self) -> None:
+        self.stages: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._started_tracing = False
+
+    def __enter__(self) -> "_Profiler":
+        self._started_tracing = not tracemalloc.is_tracing()
+        if self._started_tracing:
+            tracemalloc.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        if self._started_tracing:
+            tracemalloc.stop()
+
+    @contextlib.contextmanager
+    def stage(self, name: str, n_columns: int) -> Iterator[None]:
+        """Records the stage that runs inside the with block.
+
+        Args:
+            name (str): Name of the stage.
+            n_columns (int): Number of columns that the stage works on.
+
+        Yields:
+            None: Control to the with block.
+        """
+        start_memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        start_wall, start_cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            wall_time = time.perf_counter() - start_wall
+            cpu_time = time.process_time() - start_cpu
+            peak_memory = max(tracemalloc.get_traced_memory()[1] - start_memory, 0)
+            with self._lock:
+                record = self.stages.setdefault(
+                    name,
+                    {
+                        "columns": 0,
+                        "wall time (s)": 0.0,
+                        "CPU time (s)": 0.0,
+                        "peak memory (MiB)": 0.0,
+                    },
+                )
+                record["columns"] += n_columns
+                record["wall time (s)"] += wall_time
+                record["CPU time (s)"] += cpu_time
+                record["peak memory (MiB)"] = max(
+                    record["peak memory (MiB)"], peak_memory / 2**20
+                )
+
+    def wrap(
+        self, name: str, summary_func: Callable[[pd.DataFrame], pd.DataFrame]
+    ) -> Callable[[pd.DataFrame], pd.DataFrame]:
+        """Wraps a summary function, so that every call to it is a stage.
+
+        Args:
+            name (str): Name of the stage.
+            summary_func (Callable[[pd.DataFrame], pd.DataFrame]): Summary
+                function, which is called on dataframes of columns.
+
+        Returns:
+            Callable[[pd.DataFrame], pd.DataFrame]: The wrapped function.
+        """
+
+        def profiled(xf: pd.DataFrame) -> pd.DataFrame:
+            with self.stage(name, xf.shape[1]):
+                return summary_func(xf)
+
+        return profiled
+
+
+@typechecked
+def _profile_stage(
+    profiler: Optional[_Profiler], name: str, n_columns: int
+) -> ContextManager[None]:
+    """Records a stage with a profiler, if there is one.
+
+    Args:
+        profiler (Optional[_Profiler]): Profiler, or None to not record.
+        name (str): Name of the stage.
+        n_columns (int): Number of columns that the stage works on.
+
+    Returns:
+        ContextManager[None]: Context manager to run the stage in.
+    """
+    if profiler is None:
+        return contextlib.nullcontext()
+    return profiler.stage(name, n_columns)
+
+
+@typechecked
+def _summary_stage_name(kind: str) -> str:
+    """Names the stage of a profile that summarises a kind of column.
+
+    Args:
+        kind (str): Name of a summary table, or kind of column (as in
+            _skim_from_column_stats).
+
+    Returns:
+        str: Name of the stage, eg 'date summary table'.
+    """
+    return f"{SUMMARY_STAGE_KINDS.get(kind, kind)} summary table"
+
+
+@typechecked
+def _summary_stages(kinds: List[str]) -> Dict[str, List[int]]:
+    """Groups the positions of columns by the stage of a profile that summarises them.
+
+    Args:
+        kinds (List[str]): Kind of each column (as in _skim_from_column_stats).
+
+    Returns:
+        Dict[str, List[int]]: Positions of the columns of each stage, by name.
+    """
+    stages: Dict[str, List[int]] = {}
+    for i, kind in enumerate(kinds):
+        stages.setdefault(_summary_stage_name(kind), []).append(i)
+    return stages
+
+
+@typechecked
+def _n_columns(df: Any) -> int:
+    """Counts the columns of a dataframe, resolving the schema of a lazy one.
+
+    Args:
+        df (Any): Dataframe, of any of the kinds that skim takes.
+
+    Returns:
+        int: Number of columns.
+    """
+    if _is_polars(df, "LazyFrame"):
+        return len(df.collect_schema())
+    return len(df.columns)
+
+
+@typechecked
+def _profile_to_rich_table(profile: Dict[str, Dict[str, Any]]) -> Table:
+    """Converts the records of a _Profiler into a rich table.
+
+    Args:
+        profile (Dict[str, Dict[str, Any]]): Records of each stage, as in the
+            'Profile' of the JSON from skim_get_data.
+
+    Returns:
+        Table: instance of Table from the rich package
+    """
+    df = pd.DataFrame.from_dict(profile, orient="index").rename_axis("stage")
+    df.loc["total"] = df.max()
+    for col in ["wall time (s)", "CPU time (s)"]:
+        df.loc["total", col] = df[col].iloc[:-1].sum()
+    for col in df.columns.drop("columns"):
+        df[col] = _round_series(df[col], 3)
+    df["columns"] = df["columns"].astype(int)
+    return _dataframe_to_rich_table("profile", df)
+
+
+@typechecked
+def _skim_computation(
+    df_in: pd.DataFrame,
+    sample_info: Optional[Dict[str, Any]] = None,
+    quantile_error: Optional[float] = None,
+    n_jobs: Optional[int] = None,
+    cache: Optional[SummaryCache] = None,
+    profiler: Optional[_Profiler] = None,
+) -> Tuple[Dict[str, Any], JSON]:
+    """Performs the under-the-hood summary statistics.
+
+    Args:
+        df_in (pd.DataFrame): Input pandas dataframe to create a summary of.
+        sample_info (Optional[Dict[str, Any]]): If df_in is a sample of the
+            rows of a dataframe, the exact statistics of the whole dataframe
+            (see _sample_dataframe).
+        quantile_error (Optional[float]): If given, quantiles of numeric
+            columns are estimated with quantile sketches with this rank error.
+        n_jobs (Optional[int]): Number of threads to summarise columns with
+            (see _run_summary_functions). Defaults to None (no threads).
+        cache (Optional[SummaryCache]): Cache of summaries of columns, so that
+            only new or changed columns are summarised. Defaults to None.
+        profiler (Optional[_Profiler]): If given, records the time and memory
+            of each stage. Defaults to None.
+
+    Returns:
+        Tuple[Dict[str, Any], JSON]: Summary to render with
+        _render_skim_output, JSON of summary stats.
+    """
+    if hasattr(df_in, "name") and "name" not in df_in.columns:
+        name = str(df_in.name)
+    else:
+        name = "Dataframe"
+
+    # The input dataframe is never modified or copied: all of the steps below
+    # build new dataframes that share the memory of its columns.
+    # Infer the type of each column once; the plan is re-used below
+    with _profile_stage(profiler, "infer column types", df_in.shape[1]):
+        type_plan = _infer_column_type_plan(df_in)
+    # remove any columns with types that are not currently supported
+    with _profile_stage(profiler, "delete unsupported columns", df_in.shape[1]):
+        df = _delete_unsupported_columns(df_in, type_plan)
+    # Perform inference of datatypes
+    with _profile_stage(profiler, "infer datatypes", df.shape[1]):
+        df = _infer_datatypes(df, type_plan)
+
+    # Data summary
+    tab_1_data = {"Number of rows": df.shape[0], "Number of columns": df.shape[1]}
+    # Data types
+    tab_2_data = df.dtypes.astype(str).value_counts().to_dict()
+    # Categorys
+    dtype_strs = df.dtypes.astype(str)
+    cat_names = list(dtype_strs[dtype_strs == "category"].index)
+    # Summaries of cols of specific types
+    types_funcs_dict = {
+        "number": partial(
+            _numeric_variable_summary_table, quantile_error=quantile_error
+        ),
+        "category": _category_variable_summary_table,
+        "bool": _bool_variable_summary_table,
+        "datetime": _datetime_variable_summary_table,
+        # Please note that datetime.date is not directly supported by pandas and registers as being of type "object"
+        datetime.date: _datetime_variable_summary_table,  # Re-use of fn intended.
+        "timedelta64[ns]": _timedelta_variable_summary_table,
+        "string": _string_variable_summary_table,
+        "object": _empty_column_summary_table,
+    }
+    # Summary functions, and the columns to run them on, by name of table
+    tasks = []
+    with _profile_stage(profiler, "select columns by type", df.shape[1]):
+        # We now need a special approach to deal with columns that are just null
+        is_all_null = [series.isna().all() for _, series in df.items()]
+        xf = _frame_from_columns(df, [i for i, x in enumerate(is_all_null) if x])
+        if not xf.empty:
+            tasks.append(("All null", _empty_column_summary_table, xf))
+        # remove all null columns as already dealt with
+        # and other variables have "object" type too.
+        df = _frame_from_columns(df, [i for i, x in enumerate(is_all_null) if not x])
+        for col_type, summary_func in types_funcs_dict.items():
+            if col_type == "number":
+                # timedelta and datetime are technically integers, so exclude these
+                xf = _select_dtypes(
+                    df, col_type, exclude=["datetime", "timedelta", "object"]
+                )
+            elif col_type is datetime.date:
+                # datetime.date columns are stored as objects, so use the type plan
+                date_cols = set(type_plan.loc[type_plan["type"] == "date", "column"])
+                xf = _frame_from_columns(
+                    df, [i for i, col in enumerate(df.columns) if col in date_cols]
+                )
+            else:
+                xf = _select_dtypes(df, col_type)
+            if not xf.empty:
+                # for rich tables, we need to stringify
+                # specialised and unsupported col types, such as datetime.date,
+                # that are actually registered as object type
+                tasks.append((str(col_type), summary_func, xf))
+    if profiler is not None:
+        tasks = [
+            (name, profiler.wrap(_summary_stage_name(name), summary_func), xf)
+            for name, summary_func, xf in tasks
+        ]
+    if cache is None:
+        summary_tables = _run_summary_functions(tasks, n_jobs)
+    else:
+        summary_tables = _run_cached_summary_functions(
+            tasks, cache, f"quantile_error={quantile_error}", n_jobs
+        )
+    with _profile_stage(profiler, "build output", tab_1_data["Number of columns"]):
+        return _build_skim_output(
+            name, tab_1_data, tab_2_data, cat_names, summary_tables, sample_info
+        )
+
+
+@typechecked
+def _run_summary_functions(
+    tasks: List[Tuple[str, Callable[[pd.DataFrame], pd.DataFrame], pd.DataFrame]],
+    n_jobs: Optional[int] = None,
+) -> Dict[str, pd.DataFrame]:
+    """Runs the summary function of each column type, optionally on threads.
+
+    With more than one job, the columns of each type are split into (up to)
+    n_jobs contiguous shards, and every shard of every type is summarised on
+    a pool of threads. Threads share the memory of the dataframe, so columns
+    are never copied or pickled, and the summary functions spend most of
+    their time in numpy, pandas, and pyarrow kernels that release the GIL.
+    The summaries of the shards are put back together in column order, so
+    the results are the same as without threads.
+
+    Args:
+        tasks (List[Tuple[str, Callable[[pd.DataFrame], pd.DataFrame], pd.DataFrame]]):
+            Name of each summary table, the function that computes it, and
+            the columns to compute it from.
+        n_jobs (Optional[int]): Number of threads, or -1 for one per CPU.
+            Defaults to None (no threads).
+
+    Returns:
+        Dict[str, pd.DataFrame]: Summary tables, in the order of tasks.
+
+    Raises:
+        ValueError: If n_jobs is less than 1, and not -1.
+    """
+    if n_jobs is not None and n_jobs < 1 and n_jobs != -1:
+        raise ValueError("n_jobs must be a positive number of threads, or -1.")
+    n_workers = (os.cpu_count() or 1) if n_jobs == -1 else (n_jobs or 1)
+    if n_workers == 1:
+        return {name: summary_func(xf) for name, summary_func, xf in tasks}
+    shards = []
+    for name, summary_func, xf in tasks:
+        n_shards = min(n_workers, xf.shape[1])
+        for positions in np.array_split(np.arange(xf.shape[1]), n_shards):
+            shards.append(
+                (name, summary_func, _frame_from_columns(xf, positions.tolist()))
+            )
+    with ThreadPoolExecutor(max_workers=n_workers) as executor:
+        results = list(executor.map(lambda shard: shard[1](shard[2]), shards))
+    shard_tables = defaultdict(list)
+    for (name, _, _), result in zip(shards, results):
+        shard_tables[name].append(result)
+    return {name: pd.concat(tables) for name, tables in shard_tables.items()}
+
+
+@typechecked
+def _build_skim_output(
+    name: str,
+    tab_1_data: Dict[str, int],
+    tab_2_data: Dict[str, int],
+    cat_names: List[Any],
+    summary_tables: Dict[str, pd.DataFrame],
+    sample_info: Optional[Dict[str, Any]] = None,
+    estimates: Optional[Dict[str, List[str]]] = None,
+) -> Tuple[Dict[str, Any], JSON]:
+    """Puts summary statistics together into JSON, and what is needed to render them.
+
+    This is shared by all of the engines that compute summary statistics,
+    so that they all produce the same output. When the statistics were
+    computed from a sample of rows, the exact numbers of rows and missing
+    values are put back, and the statistics that are estimates are listed
+    under 'Estimates' in the JSON (and marked with '~' when rendered). No
+    rich tables are built here: that is left to _render_skim_output, so that
+    callers that only want the JSON never pay for rendering.
+
+    Args:
+        name (str): Name of the dataframe.
+        tab_1_data (Dict[str, int]): Number of rows and number of columns.
+        tab_2_data (Dict[str, int]): Count of columns by data type.
+        cat_names (List[Any]): Names of the categorical columns.
+        summary_tables (Dict[str, pd.DataFrame]): Summary of columns of each
+            type, in the order to display them.
+        sample_info (Optional[Dict[str, Any]]): If the statistics were computed
+            from a sample of rows, the exact statistics of the whole dataframe
+            (see _sample_dataframe).
+        estimates (Optional[Dict[str, List[str]]]): Names of the statistics in
+            each summary table that are estimates, even of all rows (eg counts
+            of unique strings in a stream). Defaults to None.
+
+    Returns:
+        Tuple[Dict[str, Any], JSON]: Summary to render with
+        _render_skim_output, JSON of summary stats.
+    """
+    estimates = dict(estimates or {})
+    if sample_info is not None:
+        tab_1_data, summary_tables, sample_estimates = _apply_sample_info(
+            tab_1_data, summary_tables, sample_info
+        )
+        estimates.update(sample_estimates)
+    # main data dict
+    json_data: Any = {"Data Summary": tab_1_data, "Data Types": tab_2_data}
+    if cat_names:
+        json_data.update(
+            {"Categories": {"Columns": {cat_name for cat_name in cat_names}}}
+        )
+    for col_type, sum_df in summary_tables.items():
+        json_data.update({col_type: sum_df.to_dict()})
+    if estimates:
+        json_data.update({"Estimates": estimates})
+    summary = {
+        "name": name,
+        "tab_1_data": tab_1_data,
+        "tab_2_data": tab_2_data,
+        "cat_names": cat_names,
+        "summary_tables": summary_tables,
+        "estimates": estimates,
+    }
+    return summary, json_data
+
+
+@typechecked
+def _render_skim_output(summary: Dict[str, Any]) -> Table:
+    """Renders the output of _build_skim_output as a rich table grid.
+
+    Args:
+        summary (Dict[str, Any]): Summary from _build_skim_output.
+
+    Returns:
+        Table: Rich table grid to print to console.
+    """
+    from rich.columns import Columns
+    from rich.table import Table
+
+    header_style = "bold cyan"  # fixed
+    # Data summary
+    dat_sum_table = Table(
+        title="Data Summary", show_header=True, header_style=header_style
+    )
+    dat_sum_table.add_column(summary["name"])
+    dat_sum_table.add_column("Values")
+    for key, val in summary["tab_1_data"].items():
+        dat_sum_table.add_row(key, str(val))
+    # Data types
+    types_sum_table = Table(
+        title="Data Types", show_header=True, header_style=header_style
+    )
+    types_sum_table.add_column("Column Type")
+    types_sum_table.add_column("Count")
+    for key, val in summary["tab_2_data"].items():
+        types_sum_table.add_row(str(key), str(val))
+    tables_list = [dat_sum_table, types_sum_table]
+    # Categorys
+    if summary["cat_names"]:
+        cat_sum_table = Table(
+            title="Categories", show_header=True, header_style=header_style
+        )
+        header_string = f"[{header_style}]Categorical Variables[/{header_style}]"
+        cat_sum_table.add_column(header_string)
+        for cat in summary["cat_names"]:
+            cat_sum_table.add_row(cat)
+        tables_list.append(cat_sum_table)
+    list_of_tabs = []
+    for col_type_to_rich, sum_df in summary["summary_tables"].items():
+        list_of_tabs.append(
+            _dataframe_to_rich_table(
+                col_type_to_rich,
+                sum_df,
+                estimates=summary["estimates"].get(col_type_to_rich),
+            )
+        )
+
+    # Put all of the info together
+    grid = Table.grid(expand=True)
+    grid.add_row(Columns(tables_list))
+    grid.add_column(justify="left")
+    for sum_tab in list_of_tabs:
+        grid.add_row(sum_tab)
+    # Weirdly, iteration over list of tabs misses last entry
+    grid.add_row(list_of_tabs[-1])
+    return grid
+
+
+@typechecked
+def _print_skim_output(summary: Dict[str, Any]) -> Console:
+    """Renders the output of _build_skim_output, and prints it in a panel.
+
+    Args:
+        summary (Dict[str, Any]): Summary from _build_skim_output.
+
+    Returns:
+        Console: The console that it was printed to, which records it.
+    """
+    from rich.console import Console
+    from rich.panel import Panel
+
+    console = Console(record=True)
+    console.print(
+        Panel(_render_skim_output(summary), title="skimpy summary", subtitle="End")
+    )
+    return console
+
+
+@typechecked
+def _apply_sample_info(
+    tab_1_data: Dict[str, int],
+    summary_tables: Dict[str, pd.DataFrame],
+    sample_info: Dict[str, Any],
+) -> Tuple[Dict[str, int], Dict[str, pd.DataFrame], Dict[str, List[str]]]:
+    """Puts exact statistics into summaries computed from a sample of rows.
+
+    The numbers of rows and of missing values are exact. Counts (of true
+    values and of words) are scaled up from the sample to the whole
+    dataframe. All other statistics, except whether categories are ordered,
+    are estimates.
+
+    Args:
+        tab_1_data (Dict[str, int]): Number of rows and number of columns of
+            the sample.
+        summary_tables (Dict[str, pd.DataFrame]): Summary of columns of each
+            type, computed from the sample.
+        sample_info (Dict[str, Any]): Exact statistics of the whole dataframe
+            (see _sample_dataframe).
+
+    Returns:
+        Tuple[Dict[str, int], Dict[str, pd.DataFrame], Dict[str, List[str]]]:
+        Data summary and summary tables with exact statistics, and the names
+        of the statistics in each summary table that are estimates.
+    """
+    n_rows = sample_info["Number of rows"]
+    n_sampled = tab_1_data["Number of rows"]
+    tab_1_data = {
+        "Number of rows": n_rows,
+        "Number of columns": tab_1_data["Number of columns"],
+        "Sampled rows": n_sampled,
+    }
+    exact_cols = [MISSING_COL, COMPLETE_COL, "ordered", RANK_ERROR_COL]
+    scaled_cols = ["true", "total words"]
+    estimates = {}
+    new_tables = {}
+    for table_name, sum_df in summary_tables.items():
+        sum_df = sum_df.copy()
+        if MISSING_COL in sum_df.columns:
+            sum_df[MISSING_COL] = sum_df.index.map(sample_info[MISSING_COL]).astype(
+                "int64"
+            )
+            sum_df[COMPLETE_COL] = 100 * sum_df[MISSING_COL] / n_rows
+        for col in scaled_cols:
+            if col in sum_df.columns:
+                sum_df[col] = (sum_df[col] * n_rows / n_sampled).round().astype("int")
+        estimated_cols = [col for col in sum_df.columns if col not in exact_cols]
+        if estimated_cols:
+            estimates[table_name] = estimated_cols
+        new_tables[table_name] = sum_df
+    return tab_1_data, new_tables, estimates
+
+
+@typechecked
+def _sample_row_positions(
+    n_rows: int,
+    sample: Union[int, float],
+    seed: int,
+    strata: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Chooses a reproducible random sample of rows.
+
+    Args:
+        n_rows (int): Number of rows to sample from.
+        sample (Union[int, float]): Number of rows to sample (an int), or
+            fraction of rows to sample (a float between 0 and 1).
+        seed (int): Seed of the random number generator.
+        strata (Optional[np.ndarray]): Stratum of each row. If given, the same
+            fraction of the rows of each stratum is sampled, and at least one
+            row from every stratum.
+
+    Returns:
+        np.ndarray: Sorted positions of the sampled rows.
+
+    Raises:
+        ValueError: If sample isn't a positive int or a fraction in (0, 1].
+    """
+    if isinstance(sample, float):
+        if not 0 < sample <= 1:
+            raise ValueError("sample must be a fraction of rows in (0, 1].")
+        size = round(sample * n_rows)
+    else:
+        if sample < 1:
+            raise ValueError("sample must be a positive number of rows.")
+        size = min(sample, n_rows)
+    rng = np.random.Generator(np.random.PCG64(seed))
+    if strata is None:
+        positions = rng.choice(n_rows, size=size, replace=False)
+    else:
+        codes, uniques = pd.factorize(strata, use_na_sentinel=False)
+        # a stable sort of small ints is a radix sort
+        codes = codes.astype(np.min_scalar_type(len(uniques)))
+        order = np.argsort(codes, kind="stable")
+        counts = np.bincount(codes, minlength=len(uniques))
+        starts = np.cumsum(counts) - counts
+        to_take = np.maximum(1, np.round(counts * size / max(n_rows, 1))).astype(int)
+        positions = np.concatenate(
+            [
+                order[start + rng.choice(count, size=n_take, replace=False)]
+                for start, count, n_take in zip(starts, counts, to_take)
+            ]
+            or [np.array([], dtype=int)]
+        )
+    return np.sort(positions)
+
+
+@typechecked
+def _sample_dataframe(
+    df_in: Union[pd.DataFrame, pl.DataFrame, pl.LazyFrame, pa.Table],
+    sample: Union[int, float],
+    seed: int,
+    stratify: Optional[Any] = None,
+) -> Tuple[
+    Union[pd.DataFrame, pl.DataFrame, pl.LazyFrame, pa.Table], Optional[Dict[str, Any]]
+]:
+    """Samples the rows of a dataframe, and finds its exact, cheap, statistics.
+
+    The number of rows and the number of missing values (with NaN counted as
+    missing, as in the summaries) of each column are computed from the whole
+    dataframe; everything else is computed from the sample. Lazy polars
+    frames are sampled without collecting them (see _sample_lazyframe).
+
+    Args:
+        df_in (Union[pd.DataFrame, pl.DataFrame, pl.LazyFrame, pa.Table]):
+            Dataframe to sample.
+        sample (Union[int, float]): Number of rows to sample (an int), or
+            fraction of rows to sample (a float between 0 and 1).
+        seed (int): Seed of the random number generator.
+        stratify (Optional[Any]): Name of a column to stratify the sample by.
+
+    Returns:
+        Tuple[Union[pd.DataFrame, pl.DataFrame, pl.LazyFrame, pa.Table], Optional[Dict[str, Any]]]:
+        The sampled dataframe, and the exact statistics of the whole dataframe
+        ('Number of rows' and 'NA', a dict of missing values by column name).
+        If every row is sampled, the dataframe itself and None.
+    """
+    if _is_polars(df_in, "LazyFrame"):
+        return _sample_lazyframe(df_in, sample, seed, stratify)
+    # lazy frames have been sampled, which _is_polars can't tell type checkers
+    df_in = cast(Union[pd.DataFrame, "pl.DataFrame", pa.Table], df_in)
+    n_rows = df_in.shape[0]
+    strata = None if stratify is None else df_in[stratify].to_numpy()
+    positions = _sample_row_positions(n_rows, sample, seed, strata)
+    if len(positions) == n_rows:
+        return df_in, None
+    if _is_polars(df_in):
+        import polars as pl
+
+        df_pl = cast(pl.DataFrame, df_in)
+        float_cols = [
+            name
+            for name, dtype in df_pl.schema.items()
+            if dtype in (pl.Float32, pl.Float64)
+        ]
+        n_missing = df_pl.null_count().row(0, named=True)
+        for name, n_nan in (
+            df_pl.select(pl.col(float_cols).is_nan().sum()).row(0, named=True).items()
+        ):
+            n_missing[name] += n_nan
+        df_sample = df_pl[positions]
+    elif isinstance(df_in, pa.Table):
+        n_missing = {}
+        for name, column in zip(df_in.column_names, df_in.columns):
+            n_missing[name] = column.null_count
+            if pa.types.is_floating(column.type):
+                n_missing[name] += pc.sum(pc.is_nan(column), min_count=0).as_py()
+        df_sample = df_in.take(positions)
+    else:
+        n_missing = dict(zip(df_in.columns, df_in.isna().sum()))
+        df_sample = df_in.iloc[positions]
+        if hasattr(df_in, "name"):
+            df_sample.name = df_in.name
+    return df_sample, {"Number of rows": n_rows, MISSING_COL: n_missing}
+
+
+@typechecked
+def _sample_lazyframe(
+    lf: pl.LazyFrame,
+    sample: Union[int, float],
+    seed: int,
+    stratify: Optional[Any] = None,
+) -> Tuple[Union[pl.DataFrame, pl.LazyFrame], Optional[Dict[str, Any]]]:
+    """Samples the rows of a lazy polars frame, as _sample_dataframe does.
+
+    The frame is never collected whole: its rows are counted with pl.len()
+    (which scans of parquet files answer from their metadata), and then the
+    sampled rows of every column are gathered, and its missing values
+    counted, in one query, so that a scan is read once. Polars can't gather
+    rows in its streaming engine, so the query holds the columns it reads in
+    memory while it runs, but only the sample is kept.
+
+    Args:
+        lf (pl.LazyFrame): Lazy frame to sample.
+        sample (Union[int, float]): Number of rows to sample (an int), or
+            fraction of rows to sample (a float between 0 and 1).
+        seed (int): Seed of the random number generator.
+        stratify (Optional[Any]): Name of a column to stratify the sample by.
+
+    Returns:
+        Tuple[Union[pl.DataFrame, pl.LazyFrame], Optional[Dict[str, Any]]]:
+        The sampled rows, and the exact statistics of the whole frame (see
+        _sample_dataframe). If every row is sampled, the frame itself and
+        None.
+    """
+    import polars as pl
+
+    schema = lf.collect_schema()
+    n_rows = lf.select(pl.len()).collect().item()
+    strata = None
+    if stratify is not None:
+        strata = lf.select(stratify).collect().to_series().to_numpy()
+    positions = _sample_row_positions(n_rows, sample, seed, strata)
+    if len(positions) == n_rows:
+        return lf, None
+    float_cols = [
+        name for name, dtype in schema.items() if dtype in (pl.Float32, pl.Float64)
+    ]
+    # each result is a struct of the columns, so that the names can't clash
+    exprs = [
+        pl.struct(pl.all().gather(positions).implode()).alias("rows"),
+        pl.struct(pl.all().null_count()).alias("null"),
+    ]
+    if float_cols:
+        exprs.append(pl.struct(pl.col(float_cols).is_nan().sum()).alias("nan"))
+    out = lf.select(exprs).collect()
+    rows = out.get_column("rows").struct.unnest()
+    # an empty list explodes to a null, so an empty sample is cut back to no rows
+    df_sample = pl.DataFrame(
+        [rows.get_column(name).explode() for name in schema.names()]
+    ).head(len(positions))
+    n_missing = out.get_column("null").struct.unnest().row(0, named=True)
+    if float_cols:
+        nans = out.get_column("nan").struct.unnest().row(0, named=True)
+        for name, n_nan in nans.items():
+            n_missing[name] += n_nan
+    return df_sample, {"Number of rows": n_rows, MISSING_COL: n_missing}
+
+
+def _polars_column_kind(dtype: Any) -> Optional[str]:
+    """Classifies a polars dtype into the column types that skimpy summarises.
+
+    Args:
+        dtype (Any): A polars data type.
+
+    Returns:
+        Optional[str]: One of 'integer', 'float', 'bool', 'category', 'datetime',
+        'date', 'timedelta', 'string', or 'null'. None if the polars engine does
+        not support the data type.
+    """
+    import polars as pl
+
+    if dtype.is_integer():
+        return "integer"
+    if dtype.is_float():
+        return "float"
+    if dtype == pl.Boolean:
+        return "bool"
+    if dtype == pl.String:
+        return "string"
+    if isinstance(dtype, (pl.Categorical, pl.Enum)):
+        return "category"
+    if isinstance(dtype, pl.Datetime):
+        return "datetime"
+    if dtype == pl.Date:
+        return "date"
+    if isinstance(dtype, pl.Duration):
+        return "timedelta"
+    if dtype == pl.Null:
+        return "null"
+    return None
+
+
+@typechecked
+def _polars_skim_computation(
+    df_in: Union[pl.DataFrame, pl.LazyFrame],
+    sample_info: Optional[Dict[str, Any]] = None,
+    quantile_error: Optional[float] = None,
+    profiler: Optional[_Profiler] = None,
+) -> Tuple[Dict[str, Any], JSON]:
+    """Performs the under-the-hood summary statistics on a polars dataframe.
+
+    Summary statistics are computed with polars expressions in a single
+    (multi-threaded) query, rather than by first converting the dataframe to
+    pandas. The results are the same as those of _skim_computation on the
+    equivalent pandas dataframe. Only the small summary tables, plus the
+    columns needed for histograms and datetime frequencies, are brought into
+    numpy. Dataframes with column types that polars doesn't map onto pandas
+    types in a simple way (eg lists, structs, or decimals) are converted to
+    pandas instead. When profiling, the columns of each kind are summarised
+    by a query of their own, so that each kind is a stage.
+
+    Args:
+        df_in (Union[pl.DataFrame, pl.LazyFrame]): Input polars dataframe, which
+            may be lazy, to create a summary of.
+        sample_info (Optional[Dict[str, Any]]): If df_in is a sample of the
+            rows of a dataframe, the exact statistics of the whole dataframe
+            (see _sample_dataframe).
+        quantile_error (Optional[float]): If given, quantiles of numeric
+            columns are estimated with quantile sketches with this rank error.
+        profiler (Optional[_Profiler]): If given, records the time and memory
+            of the summary of each kind of column. Defaults to None.
+
+    Returns:
+        Tuple[Dict[str, Any], JSON]: Summary to render with
+        _render_skim_output, JSON of summary stats.
+    """
+    import polars as pl
+
+    lf = df_in.lazy()
+    schema = lf.collect_schema()
+    kinds = [_polars_column_kind(dtype) for dtype in schema.dtypes()]
+    n_rows = lf.select(pl.len()).collect().item()
+    if None in kinds or n_rows == 0:
+        return _skim_computation(
+            _convert_to_pandas(lf.collect()),
+            sample_info,
+            quantile_error,
+            profiler=profiler,
+        )
+
+    # As in pandas, NaN is treated as missing, and ints are summarised as floats
+    def _col(i: int) -> pl.Expr:
+        expr = pl.col(schema.names()[i])
+        if kinds[i] in ("integer", "float"):
+            expr = expr.cast(pl.Float64).fill_nan(None)
+        elif kinds[i] == "datetime" and schema.dtypes()[i].time_zone is not None:
+            # Convert timezone-aware to timezone-naive
+            expr = expr.dt.replace_time_zone(None).cast(pl.Datetime("ns"))
+        elif kinds[i] in ("datetime", "date"):
+            expr = expr.cast(pl.Datetime("ns"))
+        return expr
+
+    names = schema.names()
+    stats: Dict[str, Any] = {}
+
+    def _summarise(positions: List[int]) -> None:
+        exprs = [_col(i).null_count().alias(f"{i}:{MISSING_COL}") for i in positions]
+        for i in positions:
+            kind = kinds[i]
+            col = _col(i)
+            if kind in ("integer", "float"):
+                exprs.extend(
+                    [
+                        col.mean().alias(f"{i}:{NUM_COL_MEAN}"),
+                        col.std().alias(f"{i}:sd"),
+                        col.min().alias(f"{i}:min"),
+                        col.max().alias(f"{i}:max"),
+                    ]
+                )
+                if quantile_error is None:
+                    exprs.extend(
+                        col.quantile(x, interpolation="linear").alias(f"{i}:q{x}")
+                        for x in QUANTILES
+                    )
+            elif kind == "bool":
+                exprs.append(col.sum().alias(f"{i}:true"))
+            elif kind == "category":
+                exprs.append(col.n_unique().alias(f"{i}:unique"))
+            elif kind in ("datetime", "date", "timedelta"):
+                # aggregate nanoseconds, so that nothing is lost converting to pandas
+                if kind == "timedelta":
+                    col = col.dt.total_nanoseconds()
+                    exprs.append(col.mean().alias(f"{i}:{NUM_COL_MEAN}"))
+                else:
+                    col = col.dt.epoch("ns")
+                exprs.extend([col.min().alias(f"{i}:min"), col.max().alias(f"{i}:max")])
+            elif kind == "string":
+                lengths = col.str.len_chars()
+                exprs.extend(
+                    [
+                        col.get(lengths.arg_min()).alias(f"{i}:shortest"),
+                        col.get(lengths.arg_max()).alias(f"{i}:longest"),
+                        col.min().alias(f"{i}:min"),
+                        col.max().alias(f"{i}:max"),
+                        col.n_unique().alias(f"{i}:unique"),
+                        lengths.mean().alias(f"{i}:chars"),
+                        (col.str.count_matches(" ", literal=True) + 1)
+                        .sum()
+                        .alias(f"{i}:words"),
+                    ]
+                )
+        stats.update(lf.select(exprs).collect().row(0, named=True))
+
+        # Columns that need more than aggregates are brought into numpy
+        to_numpy = [
+            i
+            for i in positions
+            if kinds[i] in ("integer", "float", "bool", "datetime", "date")
+            and stats[f"{i}:{MISSING_COL}"] < n_rows
+        ]
+        hist_exprs = []
+        for i in to_numpy:
+            if kinds[i] == "bool":
+                # as in pandas, missing values become False
+                hist_exprs.append(_col(i).fill_null(False).cast(pl.Int64))
+            else:
+                hist_exprs.append(_col(i))
+        hist_df = lf.select(hist_exprs).collect()
+        hist_columns = {}
+        for i, column in zip(to_numpy, hist_df.get_columns()):
+            if kinds[i] in ("datetime", "date"):
+                if n_rows > 3:
+                    stats[f"{i}:frequency"] = pd.infer_freq(
+                        pd.Series(column.to_numpy())
+                    )
+            else:
+                hist_columns[i] = column.to_numpy()
+                if quantile_error is not None and kinds[i] != "bool":
+                    sketch = QuantileSketch.from_rank_error(quantile_error)
+                    sketch.update(hist_columns[i])
+                    quantiles = sketch.quantiles(QUANTILES)
+                    stats.update({f"{i}:q{x}": q for x, q in zip(QUANTILES, quantiles)})
+                    stats[f"{i}:{RANK_ERROR_COL}"] = sketch.rank_error
+        hists = _create_unicode_hists(pd.DataFrame(hist_columns, copy=False))
+        stats.update({f"{i}:hist": hist for i, hist in hists.items()})
+
+    if profiler is None:
+        _summarise(list(range(len(kinds))))
+    else:
+        for stage, positions in _summary_stages(kinds).items():
+            with profiler.stage(stage, len(positions)):
+                _summarise(positions)
+    return _skim_from_column_stats(
+        "Dataframe", names, kinds, n_rows, stats, sample_info
+    )
+
+
+@typechecked
+def _arrow_column_kind(arrow_type: pa.DataType) -> Optional[str]:
+    """Classifies an Arrow data type into the column types that skimpy summarises.
+
+    Args:
+        arrow_type (pa.DataType): An Arrow data type.
+
+    Returns:
+        Optional[str]: One of 'integer', 'float', 'bool', 'category', 'datetime',
+        'date', 'timedelta', 'string', or 'null'. None if the Arrow engine does
+        not support the data type.
+    """
+    if pa.types.is_integer(arrow_type):
+        return "integer"
+    if pa.types.is_float32(arrow_type) or pa.types.is_float64(arrow_type):
+        return "float"
+    if pa.types.is_boolean(arrow_type):
+        return "bool"
+    if pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type):
+        return "string"
+    if pa.types.is_dictionary(arrow_type):
+        return "category"
+    if pa.types.is_timestamp(arrow_type):
+        return "datetime"
+    if pa.types.is_date(arrow_type):
+        return "date"
+    if pa.types.is_duration(arrow_type):
+        return "timedelta"
+    if pa.types.is_null(arrow_type):
+        return "null"
+    return None
+
+
+@typechecked
+def _arrow_skim_computation(
+    table: Union[pa.Table, ds.Dataset],
+    sample_info: Optional[Dict[str, Any]] = None,
+    quantile_error: Optional[float] = None,
+    known_stats: Optional[Dict[str, Any]] = None,
+    schema: Optional[pa.Schema] = None,
+    profiler: Optional[_Profiler] = None,
+) -> Tuple[Dict[str, Any], JSON]:
+    """Performs the under-the-hood summary statistics on an Arrow table.
+
+    Summary statistics are computed with Arrow compute functions, one column
+    at a time, rather than by first converting the table to pandas. The
+    results are the same as those of _skim_computation on the equivalent
+    pandas dataframe, with dates as datetimes (as in the polars engine).
+    Only the columns needed for histograms and datetime frequencies are
+    brought into numpy, a block of them at a time. Tables with column types
+    that aren't simple to map onto pandas types (eg lists, structs, or
+    decimals) are converted to pandas instead.
+
+    An Arrow dataset (eg of a parquet file) is read one column at a time, so
+    that no more than one column of it needs to be in memory. When profiling,
+    the columns are summarised a kind at a time, so that each kind is a stage.
+
+    Args:
+        table (Union[pa.Table, ds.Dataset]): Input Arrow table, or dataset, to
+            create a summary of.
+        sample_info (Optional[Dict[str, Any]]): If table is a sample of the
+            rows of a table, the exact statistics of the whole table (see
+            _sample_dataframe).
+        quantile_error (Optional[float]): If given, quantiles of numeric
+            columns are estimated with quantile sketches with this rank error.
+        known_stats (Optional[Dict[str, Any]]): Statistics that are already
+            known exactly (eg from the footers of parquet files), keyed as in
+            _skim_from_column_stats. These aren't computed again, and columns
+            whose statistics are all known (eg columns of only missing values)
+            aren't read at all. Defaults to None.
+        schema (Optional[pa.Schema]): Types to cast the columns to as they
+            are read, if not their own (eg to read dictionaries as their
+            values). Defaults to None.
+        profiler (Optional[_Profiler]): If given, records the time and memory
+            of the summary of each kind of column. Defaults to None.
+
+    Returns:
+        Tuple[Dict[str, Any], JSON]: Summary to render with
+        _render_skim_output, JSON of summary stats.
+    """
+    if schema is None:
+        schema = table.schema
+    elif isinstance(table, pa.Table):
+        table = table.cast(schema)
+    names = schema.names
+    kinds = [_arrow_column_kind(field.type) for field in schema]
+    # the columns of a dataset are cast as they are scanned
+    projection = {field.name: pc.field(field.name).cast(field.type) for field in schema}
+    if isinstance(table, pa.Table):
+        n_rows = table.num_rows
+        read_column = table.column
+    else:
+        n_rows = table.count_rows()
+
+        def read_column(i: int) -> pa.ChunkedArray:
+            return table.to_table(columns={names[i]: projection[names[i]]}).column(0)
+
+    if None in kinds or n_rows == 0:
+        if not isinstance(table, pa.Table):
+            table = table.to_table(columns=projection)
+        return _skim_computation(
+            table.to_pandas(date_as_object=False),
+            sample_info,
+            quantile_error,
+            profiler=profiler,
+        )
+
+    # As in pandas, NaN is treated as missing, and ints are summarised as floats
+    def _col(i: int) -> pa.ChunkedArray:
+        col = read_column(i)
+        if kinds[i] in ("integer", "float"):
+            # (unsafely, since big ints round to the nearest float, as in pandas)
+            col = col.cast(pa.float64(), safe=False)
+            col = pc.if_else(pc.is_nan(col), pa.scalar(None, pa.float64()), col)
+        elif kinds[i] == "datetime" and col.type.tz is not None:
+            # Convert timezone-aware to timezone-naive
+            col = pc.local_timestamp(col).cast(pa.timestamp("ns"))
+        elif kinds[i] in ("datetime", "date"):
+            col = col.cast(pa.timestamp("ns"))
+        elif kinds[i] == "timedelta":
+            col = col.cast(pa.duration("ns"))
+        return col
+
+    stats: Dict[str, Any] = dict(known_stats or {})
+    hist_columns: Dict[int, np.ndarray] = {}
+
+    def _add_hists() -> None:
+        hists = _create_unicode_hists(pd.DataFrame(hist_columns, copy=False))
+        stats.update({f"{i}:hist": hist for i, hist in hists.items()})
+        hist_columns.clear()
+
+    def _summarise(positions: List[int]) -> None:
+        for i in positions:
+            kind = kinds[i]
+            n_null = stats.get(f"{i}:{MISSING_COL}")
+            if n_null == n_rows:
+                continue
+            if (
+                kind in ("datetime", "date")
+                and n_null is not None
+                and f"{i}:min" in stats
+                and f"{i}:max" in stats
+                and (
+                    n_rows <= 3 or n_null > 0 or stats[f"{i}:min"] == stats[f"{i}:max"]
+                )
+            ):
+                # nothing is left to compute: datetimes with missing values, or
+                # that are all the same, have no frequency
+                continue
+            col = _col(i)
+            n_null = col.null_count
+            stats[f"{i}:{MISSING_COL}"] = n_null
+            if n_null == n_rows:
+                continue
+            if kind in ("integer", "float"):
+                stats[f"{i}:{NUM_COL_MEAN}"] = pc.mean(col).as_py()
+                stats[f"{i}:sd"] = pc.stddev(col, ddof=1).as_py()
+                hist_columns[i] = col.to_numpy()
+                if quantile_error is None:
+                    quantiles = pc.quantile(col, q=QUANTILES, interpolation="linear")
+                    quantiles = quantiles.to_pylist()
+                else:
+                    sketch = QuantileSketch.from_rank_error(quantile_error)
+                    sketch.update(hist_columns[i])
+                    quantiles = sketch.quantiles(QUANTILES)
+                    stats[f"{i}:{RANK_ERROR_COL}"] = sketch.rank_error
+                stats.update({f"{i}:q{x}": q for x, q in zip(QUANTILES, quantiles)})
+            elif kind == "bool":
+                stats[f"{i}:true"] = pc.sum(col).as_py()
+                # as in pandas, missing values become False
+                hist_columns[i] = pc.fill_null(col, False).cast(pa.int64()).to_numpy()
+            elif kind == "category":
+                # as in pandas, missing values count as a unique value
+                values = col.cast(col.type.value_type)
+                stats[f"{i}:unique"] = pc.count_distinct(values, mode="all").as_py()
+                stats[f"{i}:ordered"] = col.type.ordered
+            elif kind in ("datetime", "date", "timedelta"):
+                # aggregate nanoseconds, so that nothing is lost converting to pandas
+                nanoseconds = col.cast(pa.int64())
+                if f"{i}:min" not in stats or f"{i}:max" not in stats:
+                    extremes = pc.min_max(nanoseconds)
+                    stats[f"{i}:min"] = extremes["min"].as_py()
+                    stats[f"{i}:max"] = extremes["max"].as_py()
+                if kind == "timedelta":
+                    stats[f"{i}:{NUM_COL_MEAN}"] = pc.mean(nanoseconds).as_py()
+                elif n_rows > 3:
+                    stats[f"{i}:frequency"] = pd.infer_freq(pd.Series(col.to_numpy()))
+            elif kind == "string":
+                string_stats = _string_array_stats(col)
+                for stat in ("shortest", "longest", "min", "max", "chars", "words"):
+                    stats[f"{i}:{stat}"] = string_stats[stat]
+                # as for categories, missing values count as a unique value
+                stats[f"{i}:unique"] = string_stats["n_distinct"] + int(n_null > 0)
+            if len(hist_columns) * n_rows >= HIST_BLOCK_SIZE:
+                _add_hists()
+        _add_hists()
+
+    if profiler is None:
+        _summarise(list(range(len(kinds))))
+    else:
+        for stage, positions in _summary_stages(kinds).items():
+            with profiler.stage(stage, len(positions)):
+                _summarise(positions)
+    return _skim_from_column_stats(
+        "Dataframe", names, kinds, n_rows, stats, sample_info
+    )
+
+
+@typechecked
+def _skim_from_column_stats(
+    name: str,
+    names: List[Any],
+    kinds: List[str],
+    n_rows: int,
+    stats: Dict[str, Any],
+    sample_info: Optional[Dict[str, Any]] = None,
+) -> Tuple[Dict[str, Any], JSON]:
+    """Builds the skim output from statistics computed column by column.
+
+    Engines that compute summary statistics outside of pandas (eg polars or
+    DuckDB) only need to work out per-column statistics: this function puts
+    them into the same summary tables, with the same dtypes and rounding, as
+    _skim_computation.
+
+    Args:
+        name (str): Name of the dataframe.
+        names (List[Any]): Column names.
+        kinds (List[str]): Kind of each column: one of 'integer', 'float',
+            'bool', 'category', 'datetime', 'date', 'timedelta', 'string', or
+            'null'.
+        n_rows (int): Number of rows in the dataframe.
+        stats (Dict[str, Any]): Statistics keyed by '{column position}:{name}'.
+            Missing values ('NA') are needed for every column. Datetimes and
+            timedeltas are in nanoseconds. The rank errors of numeric columns
+            are only shown if their quantiles were estimated. Counts of unique
+            strings that were estimated are flagged by 'unique_estimated', and
+            marked as estimates.
+        sample_info (Optional[Dict[str, Any]]): If the statistics are of a
+            sample of rows, the exact statistics of the whole dataframe (see
+            _sample_dataframe).
+
+    Returns:
+        Tuple[Dict[str, Any], JSON]: Summary to render with
+        _render_skim_output, JSON of summary stats.
+    """
+
+    def _stat(i: int, name: str) -> Any:
+        return stats.get(f"{i}:{name}")
+
+    n_nulls = [_stat(i, MISSING_COL) for i in range(len(kinds))]
+    # The dtype the pandas engine would give each column, once typed
+    pd_dtypes = []
+    for kind, n_null in zip(kinds, n_nulls):
+        if kind == "integer" and n_null == 0:
+            pd_dtypes.append("int64")
+        elif kind in ("integer", "float"):
+            pd_dtypes.append("float64")
+        elif kind in ("bool", "string") and n_null < n_rows:
+            pd_dtypes.append(kind)
+        elif kind in ("datetime", "date"):
+            pd_dtypes.append("datetime64[ns]")
+        elif kind == "timedelta":
+            pd_dtypes.append("timedelta64[ns]")
+        else:
+            pd_dtypes.append(kind if kind == "category" else "object")
+    tab_1_data = {"Number of rows": n_rows, "Number of columns": len(kinds)}
+    tab_2_data = pd.Series(pd_dtypes, dtype=object).value_counts().to_dict()
+    cat_names = [name for name, kind in zip(names, kinds) if kind == "category"]
+
+    is_all_null = [n_null == n_rows for n_null in n_nulls]
+
+    def _positions(*col_kinds: str) -> List[int]:
+        return [
+            i
+            for i, kind in enumerate(kinds)
+            if kind in col_kinds and not is_all_null[i]
+        ]
+
+    def _series(positions: List[int], name: str, dtype: Any = None) -> pd.Series:
+        return pd.Series({names[i]: _stat(i, name) for i in positions}, dtype=dtype)
+
+    def _missing(positions: List[int]) -> Dict[str, pd.Series]:
+        count_nans_vec = pd.Series(
+            {names[i]: n_nulls[i] for i in positions}, dtype="int64"
+        )
+        return {
+            MISSING_COL: count_nans_vec,
+            COMPLETE_COL: 100 * count_nans_vec / n_rows,
+        }
+
+    summary_tables = {}
+    positions = [i for i, x in enumerate(is_all_null) if x]
+    if positions:
+        summary_tables["All null"] = pd.DataFrame(_missing(positions))
+    positions = _positions("integer", "float")
+    if positions:
+        data_dict = _missing(positions)
+        data_dict.update(
+            {
+                NUM_COL_MEAN: _round_series(
+                    _series(positions, NUM_COL_MEAN, dtype="float64"), 4
+                ),
+                "sd": _round_series(_series(positions, "sd", dtype="float64"), 4),
+            }
+        )
+        display_quantiles_as_pct = 100
+        data_dict.update(
+            {
+                "p" + str(int(x * display_quantiles_as_pct)): _round_series(
+                    _series(positions, f"q{x}", dtype="float64"), 4
+                )
+                for x in QUANTILES
+            }
+        )
+        if any(f"{i}:{RANK_ERROR_COL}" in stats for i in positions):
+            data_dict[RANK_ERROR_COL] = _round_series(
+                _series(positions, RANK_ERROR_COL, dtype="float64"), 4
+            )
+        data_dict["hist"] = _series(positions, "hist", dtype="string")
+        summary_tables["number"] = pd.DataFrame(data_dict)
+    positions = _positions("category")
+    if positions:
+        data_dict = _missing(positions)
+        data_dict.update(
+            {
+                "ordered": pd.Series(
+                    {names[i]: bool(_stat(i, "ordered")) for i in positions}
+                ),
+                "unique": _series(positions, "unique", dtype="int64"),
+            }
+        )
+        summary_tables["category"] = pd.DataFrame(data_dict)
+    positions = _positions("bool")
+    if positions:
+        true_vec = _series(positions, "true", dtype="int64")
+        data_dict = {"true": true_vec, "true rate": _round_series(true_vec / n_rows)}
+        data_dict["hist"] = _series(positions, "hist", dtype="string")
+        summary_tables["bool"] = pd.DataFrame(data_dict)
+    positions = _positions("datetime", "date")
+    if positions:
+        data_dict = _missing(positions)
+        data_dict.update(
+            {
+                DATE_COL_FIRST: pd.Series(
+                    {names[i]: pd.Timestamp(_stat(i, "min")) for i in positions}
+                ),
+                DATE_COL_LAST: pd.Series(
+                    {names[i]: pd.Timestamp(_stat(i, "max")) for i in positions}
+                ),
+            }
+        )
+        if n_rows > 3:
+            data_dict["frequency"] = _series(positions, "frequency")
+        summary_tables["datetime"] = pd.DataFrame(data_dict)
+    positions = _positions("timedelta")
+    if positions:
+        data_dict = _missing(positions)
+        # NB: timedelta doesn't play nicely with rounding
+        data_dict.update(
+            {
+                NUM_COL_MEAN: pd.Series(
+                    {
+                        names[i]: pd.Timedelta(_stat(i, NUM_COL_MEAN), unit="ns")
+                        for i in positions
+                    }
+                ).dt.floor("s"),
+                "median": pd.Series(
+                    {
+                        names[i]: pd.Timedelta(_stat(i, "min"), unit="ns")
+                        for i in positions
+                    }
+                ).dt.floor("s"),
+                "max": pd.Series(
+                    {
+                        names[i]: pd.Timedelta(_stat(i, "max"), unit="ns")
+                        for i in positions
+                    }
+                ).dt.ceil("s"),
+            }
+        )
+        summary_tables["timedelta64[ns]"] = pd.DataFrame(data_dict)
+    estimates = {}
+    positions = _positions("string")
+    if positions:
+        data_dict = _missing(positions)
+        words_vec = _series(positions, "words", dtype="int")
+        data_dict.update(
+            {
+                "shortest": _series(positions, "shortest"),
+                "longest": _series(positions, "longest"),
+                # Below are alphabetical min and max
+                "min": _series(positions, "min"),
+                "max": _series(positions, "max"),
+                "unique": _series(positions, "unique", dtype="int64"),
+                "chars per row": _round_series(
+                    _series(positions, "chars", dtype="float64"), 3
+                ),
+                "words per row": _round_series(words_vec / n_rows),
+                "total words": words_vec,
+            }
+        )
+        summary_tables["string"] = pd.DataFrame(data_dict)
+        if any(_stat(i, "unique_estimated") for i in positions):
+            estimates["string"] = ["unique"]
+    return _build_skim_output(
+        name,
+        tab_1_data,
+        tab_2_data,
+        cat_names,
+        summary_tables,
+        sample_info,
+        estimates,
+    )
+
+
+@typechecked
+def _pandas_column_kind(series: pd.Series, inferred_type: str) -> Optional[str]:
+    """Classifies a typed pandas column into the column types that skimpy summarises.
+
+    Args:
+        series (pd.Series): Column, after _infer_datatypes.
+        inferred_type (str): Type of the column in the type plan.
+
+    Returns:
+        Optional[str]: One of 'integer', 'float', 'bool', 'category',
+        'datetime', 'date', 'timedelta', 'string', or 'null' (see
+        _skim_from_column_stats). None if the column type isn't supported.
+    """
+    dtype = series.dtype
+    if inferred_type == "date":
+        return "date"
+    if isinstance(dtype, pd.CategoricalDtype):
+        return "category"
+    if isinstance(dtype, pd.StringDtype):
+        return "string"
+    if pd.api.types.is_bool_dtype(dtype):
+        return "bool"
+    if pd.api.types.is_datetime64_dtype(dtype):
+        return "datetime"
+    if pd.api.types.is_timedelta64_dtype(dtype):
+        return "timedelta"
+    if pd.api.types.is_integer_dtype(dtype):
+        return "integer"
+    if pd.api.types.is_float_dtype(dtype):
+        return "float"
+    if pd.api.types.is_object_dtype(dtype) and series.isna().all():
+        return "null"
+    return None
+
+
+@typechecked
+def _merge_column_kinds(kind: str, other: str) -> str:
+    """Works out the kind of a column from the kinds of two parts of it.
+
+    Args:
+        kind (str): Kind of one part of the column.
+        other (str): Kind of the other part.
+
+    Returns:
+        str: Kind of the whole column: 'unsupported' if the parts can't be
+        summarised together.
+    """
+    if kind == other or other == "null":
+        return kind
+    if kind == "null":
+        return other
+    if {kind, other} == {"integer", "float"}:
+        return "float"
+    return "unsupported"
+
+
+@typing.no_type_check
+def _column_state(
+    kind: str, series: pd.Series, quantile_error: Optional[float] = None
+) -> Dict[str, Any]:
+    """Computes the mergeable summary statistics of a part of a column.
 
     Args:
-        xf (pd.DataFrame): A dataframe with only empty columns
+        kind (str): Kind of the column (see _pandas_column_kind).
+        series (pd.Series): Part of the column, after _infer_datatypes.
+        quantile_error (Optional[float]): Rank error of the quantile sketches
+            of numeric columns. Defaults to None (sketches of SKETCH_SIZE).
 
     Returns:
-        pd.DataFrame: A dataframe of summary statistics, with a number of rows
-        determined by number of columns of xf
+        Dict[str, Any]: Number of values that aren't missing ('valid'), and
+        the statistics of the column's kind that can be merged with
+        _merge_column_states.
     """
-    count_nans_vec = xf.isna().sum()
-    data_dict = {
-        MISSING_COL: count_nans_vec,
-        COMPLETE_COL: 100 * count_nans_vec / xf.shape[0],
-    }
-    summary_df = pd.DataFrame(data_dict)
-    return summary_df
+    if kind in ("integer", "float"):
+        values = series.to_numpy(dtype="float64", na_value=np.nan)
+        valid = values[~np.isnan(values)]
+        if quantile_error is None:
+            sketch = QuantileSketch()
+        else:
+            sketch = QuantileSketch.from_rank_error(quantile_error)
+        sketch.update(valid)
+        mean = valid.mean() if valid.size else 0.0
+        return {
+            "valid": valid.size,
+            "sum": valid.sum(),
+            # sum of squared deviations from the mean, for Chan et al's update
+            "m2": ((valid - mean) ** 2).sum(),
+            "sketch": sketch,
+        }
+    if kind == "bool":
+        return {"valid": len(series), "true": int(series.sum())}
+    if kind == "category":
+        counts = series.value_counts(sort=False)
+        return {
+            "valid": int(series.notna().sum()),
+            "ordered": series.cat.ordered,
+            "counts": counts[counts > 0],
+        }
+    if kind in ("datetime", "date", "timedelta"):
+        if kind == "date":
+            series = pd.to_datetime(series)
+        values = series.to_numpy().view("int64")
+        valid = values[series.notna().to_numpy()]
+        state = {
+            "valid": valid.size,
+            "min": valid.min() if valid.size else None,
+            "max": valid.max() if valid.size else None,
+        }
+        if kind == "timedelta":
+            state["sum"] = int(valid.sum(dtype=object)) if valid.size else 0
+        else:
+            # frequencies are inferred from runs of at least 3 datetimes,
+            # which overlap by 2 datetimes where parts are merged
+            dts = series.to_numpy()
+            state["head"] = dts[:2]
+            state["tail"] = dts[-2:]
+            state["freqs"] = {pd.infer_freq(series)} if len(series) > 2 else set()
+        return state
+    if kind == "string":
+        n_valid = int(series.notna().sum())
+        if n_valid == 0:
+            return {"valid": 0}
+        stats = _string_column_stats(series)
+        return {
+            "valid": n_valid,
+            "shortest": stats["shortest"],
+            "longest": stats["longest"],
+            "min": stats["min"],
+            "max": stats["max"],
+            "chars": round(stats["chars"] * n_valid),
+            "words": int(stats["words"]),
+            "distinct": stats["distinct"],
+        }
+    return {"valid": 0}
 
 
-@typechecked
-def _delete_unsupported_columns(df: pd.DataFrame) -> pd.DataFrame:
-    """This will remove the pd.api.types.infer_dtype types that are not
-    supported.
+@typing.no_type_check
+def _merge_column_states(
+    kind: str, state: Dict[str, Any], other: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Merges the statistics of two consecutive parts of a column.
+
+    Means and variances are merged as in Chan, Golub, and LeVeque (1979), so
+    that no values need to be kept, and quantiles and histograms come from
+    merged quantile sketches.
 
     Args:
-        df (pd.DataFrame): Input dataframe.
+        kind (str): Kind of the whole column (see _merge_column_kinds).
+        state (Dict[str, Any]): Statistics of the first part of the column.
+        other (Dict[str, Any]): Statistics of the second part of the column.
 
     Returns:
-        pd.DataFrame: Dataframe with unsupported columns removed.
+        Dict[str, Any]: Statistics of both parts together.
+    """
+    # Parts with nothing but missing values only add missing values
+    if state["valid"] == 0:
+        return other
+    if other["valid"] == 0:
+        return state
+    merged = {"valid": state["valid"] + other["valid"]}
+    if kind in ("integer", "float"):
+        n_a, n_b = state["valid"], other["valid"]
+        merged["sum"] = state["sum"] + other["sum"]
+        merged["m2"] = state["m2"] + other["m2"]
+        if n_a and n_b:
+            delta = other["sum"] / n_b - state["sum"] / n_a
+            merged["m2"] += delta**2 * n_a * n_b / (n_a + n_b)
+        state["sketch"].merge(other["sketch"])
+        merged["sketch"] = state["sketch"]
+    elif kind == "bool":
+        merged["true"] = state["true"] + other["true"]
+    elif kind == "category":
+        merged["ordered"] = state["ordered"]
+        merged["counts"] = state["counts"].add(other["counts"], fill_value=0)
+    elif kind in ("datetime", "date", "timedelta"):
+        for stat, func in (("min", min), ("max", max)):
+            values = [x[stat] for x in (state, other) if x[stat] is not None]
+            merged[stat] = func(values) if values else None
+        if kind == "timedelta":
+            merged["sum"] = state["sum"] + other["sum"]
+        else:
+            merged["freqs"] = state["freqs"] | other["freqs"]
+            boundary = np.concatenate([state["tail"], other["head"]])
+            if len(boundary) > 2:
+                merged["freqs"].add(pd.infer_freq(pd.DatetimeIndex(boundary)))
+            merged["head"] = np.concatenate([state["head"], other["head"]])[:2]
+            merged["tail"] = np.concatenate([state["tail"], other["tail"]])[-2:]
+    elif kind == "string":
+        # ties go to the first part, as in _string_column_stats
+        merged["shortest"] = min(state["shortest"], other["shortest"], key=len)
+        merged["longest"] = max(state["longest"], other["longest"], key=len)
+        merged["min"] = min(state["min"], other["min"])
+        merged["max"] = max(state["max"], other["max"])
+        merged["chars"] = state["chars"] + other["chars"]
+        merged["words"] = state["words"] + other["words"]
+        state["distinct"].merge(other["distinct"])
+        merged["distinct"] = state["distinct"]
+    return merged
 
-    Raises:
-        ValueError: If the input dataframe only has unsupported column types.
+
+@typing.no_type_check
+def _column_stats_from_state(
+    kind: str, state: Dict[str, Any], n_rows: int, show_rank_error: bool = False
+) -> Dict[str, Any]:
+    """Computes the statistics that _skim_from_column_stats needs for a column.
+
+    Args:
+        kind (str): Kind of the column.
+        state (Dict[str, Any]): Mergeable statistics of the whole column.
+        n_rows (int): Number of rows in the dataframe.
+        show_rank_error (bool): Whether to include the rank error of the
+            quantiles of numeric columns. Defaults to False.
+
+    Returns:
+        Dict[str, Any]: Statistics of the column, keyed by name.
     """
-    df_types = (
-        pd.DataFrame(df.apply(pd.api.types.infer_dtype, axis=0))
-        .reset_index()
-        .rename(columns={"index": "column", 0: "type"})
-    )
-    df_types["delete"] = df_types["type"].isin(UNSUPPORTED_INFERRED_TYPES)
-    for _, row in df_types.iterrows():
-        if row["delete"]:
-            df = df.drop(row["column"], axis=1)
-    if df.empty:
-        raise ValueError(
-            f"Your input dataframe only has unsupported column types, eg {', '.join(UNSUPPORTED_INFERRED_TYPES)}"
-        )
-    return df
+    n_valid = state["valid"]
+    stats = {MISSING_COL: n_rows - n_valid}
+    if n_valid == 0:
+        return stats
+    if kind in ("integer", "float"):
+        stats[NUM_COL_MEAN] = state["sum"] / n_valid
+        stats["sd"] = np.sqrt(state["m2"] / (n_valid - 1)) if n_valid > 1 else np.nan
+        quantiles = state["sketch"].quantiles(QUANTILES)
+        stats.update({f"q{x}": q for x, q in zip(QUANTILES, quantiles)})
+        stats["hist"] = _hist_to_unicode(state["sketch"].histogram())
+        if show_rank_error:
+            stats[RANK_ERROR_COL] = state["sketch"].rank_error
+    elif kind == "bool":
+        n_true = state["true"]
+        # as in _create_unicode_hists, with False as 0 and True as 1
+        counts = np.zeros(HIST_BINS, dtype=int)
+        if 0 < n_true < n_rows:
+            counts[0], counts[-1] = n_rows - n_true, n_true
+        else:
+            counts[HIST_BINS // 2] = n_rows
+        stats["true"] = n_true
+        stats["hist"] = _hist_to_unicode(counts / counts.sum())
+    elif kind == "category":
+        stats["ordered"] = state["ordered"]
+        # as in pandas, missing values count as a unique value
+        stats["unique"] = len(state["counts"]) + int(n_valid < n_rows)
+    elif kind in ("datetime", "date", "timedelta"):
+        stats["min"] = state["min"]
+        stats["max"] = state["max"]
+        if kind == "timedelta":
+            stats[NUM_COL_MEAN] = state["sum"] / n_valid
+        else:
+            # as in pd.infer_freq, there's no frequency if any are missing
+            freqs = state["freqs"]
+            is_regular = len(freqs) == 1 and n_valid == n_rows
+            stats["frequency"] = next(iter(freqs)) if is_regular else None
+    elif kind == "string":
+        stats.update({key: state[key] for key in ("shortest", "longest", "min", "max")})
+        stats["chars"] = state["chars"] / n_valid
+        stats["words"] = state["words"]
+        # as for categories, missing values count as a unique value
+        stats["unique"] = state["distinct"].count() + int(n_valid < n_rows)
+        stats["unique_estimated"] = state["distinct"].relative_error > 0
+    return stats
 
 
 @typechecked
-def _skim_computation(
-    df_in: pd.DataFrame,
-) -> Tuple[Table, JSON]:
-    """Performs the under-the-hood summary statistics.
+def _chunk_to_pandas(chunk: Any) -> pd.DataFrame:
+    """Converts a chunk of rows of a dataframe to pandas.
 
     Args:
-        df_in (pd.DataFrame): Input pandas dataframe to create a summary of.
+        chunk (Any): A pandas or polars dataframe, or a pyarrow Table or
+            RecordBatch.
 
     Returns:
-        Tuple[Table, JSON]: Rich table grid to print to console, JSON of summary stats.
+        pd.DataFrame: The chunk as a pandas dataframe.
+
+    Raises:
+        TypeError: If the chunk isn't one of the supported types.
     """
-    if hasattr(df_in, "name") and "name" not in df_in.columns:
-        name = str(df_in.name)
-    else:
-        name = "Dataframe"
+    if isinstance(chunk, pd.DataFrame):
+        return chunk
+    if isinstance(chunk, (pa.Table, pa.RecordBatch)):
+        return chunk.to_pandas()
+    if _is_polars(chunk):
+        return _convert_to_pandas(chunk)
+    raise TypeError(f"Chunks of type {type(chunk).__name__} are not supported.")
+
+
+class _SkimAccumulator:
+    """Mergeable summary statistics of a dataframe that arrives in chunks of rows.
+
+    Each chunk is typed as _skim_computation types a dataframe, and only
+    mergeable statistics are kept for each column: counts, sums, Welford-style
+    sums of squared deviations, quantile sketches, extremes, string lengths,
+    and category counts. So the memory used doesn't grow with the number of
+    rows (except for category counts, which grow with the number of
+    categories), and the accumulators of different chunks can be merged.
+    Columns that have different, incompatible, types in different chunks are
+    not summarised, as they would have mixed types in the whole dataframe.
 
-    # Make a copy so as not to mess with dataframe
-    df = df_in.copy()
-    # remove any columns with types that are not currently supported
-    df = _delete_unsupported_columns(df)
-    # Perform inference of datatypes
-    df = _infer_datatypes(df)
+    Args:
+        quantile_error (Optional[float]): Rank error of the quantile sketches
+            of numeric columns, which is then shown in the output. Defaults to
+            None (sketches of SKETCH_SIZE, without showing their rank error).
+    """
 
-    header_style = "bold cyan"  # fixed
-    # main data dict
-    json_data: Any = {}
-    # Data summary
-    tab_1_data = {"Number of rows": df.shape[0], "Number of columns": df.shape[1]}
-    dat_sum_table_title = "Data Summary"
-    dat_sum_table = Table(
-        title=dat_sum_table_title, show_header=True, header_style=header_style
-    )
-    dat_sum_table.add_column(name)
-    dat_sum_table.add_column("Values")
-    for key, val in tab_1_data.items():
-        dat_sum_table.add_row(key, str(val))
-    json_data.update({dat_sum_table_title: tab_1_data})
-    # Data types
-    data_types_title = "Data Types"
-    types_sum_table = Table(
-        title=data_types_title, show_header=True, header_style=header_style
-    )
-    tab_2_data = df.dtypes.astype(str).value_counts().to_dict()
-    types_sum_table.add_column("Column Type")
-    types_sum_table.add_column("Count")
-    for key, val in tab_2_data.items():
-        types_sum_table.add_row(str(key), str(val))
-    json_data.update({data_types_title: tab_2_data})
-    # Categorys
-    if "category" in df.dtypes.astype(str).to_list():
-        cat_section_title = "Categories"
-        xf = pd.DataFrame(df.dtypes.astype(str))
-        cat_sum_table = Table(
-            title=cat_section_title, show_header=True, header_style=header_style
-        )
-        header_string = f"[{header_style}]Categorical Variables[/{header_style}]"
-        cat_sum_table.add_column(header_string)
-        cat_names = list(xf[xf[0] == "category"].index)
-        for cat in cat_names:
-            cat_sum_table.add_row(cat)
-        json_data.update(
-            {cat_section_title: {"Columns": {cat_name for cat_name in cat_names}}}
-        )
-    # Summaries of cols of specific types
-    types_funcs_dict = {
-        "number": _numeric_variable_summary_table,
-        "category": _category_variable_summary_table,
-        "bool": _bool_variable_summary_table,
-        "datetime": _datetime_variable_summary_table,
-        # Please note that datetime.date is not directly supported by pandas and registers as being of type "object"
-        datetime.date: _datetime_variable_summary_table,  # Re-use of fn intended.
-        "timedelta64[ns]": _timedelta_variable_summary_table,
-        "string": _string_variable_summary_table,
-        "object": _empty_column_summary_table,
-    }
-    list_of_tabs = []
-    # We now need a special approach to deal with columns that are just null
-    xf = df.loc[:, df.isnull().all()]
-    if not xf.empty:
-        sum_df = _empty_column_summary_table(xf)
-        col_type_to_rich = str("All null")
-        list_of_tabs.append(_dataframe_to_rich_table(col_type_to_rich, sum_df))
-        json_data.update({col_type_to_rich: sum_df.to_dict()})
-    # remove all null columns as already dealt with
-    # and other variables have "object" type too.
-    df = df.loc[:, ~df.isnull().all()].copy()
-    for col_type, summary_func in types_funcs_dict.items():
-        if col_type == "number":
-            # timedelta and datetime are technically integers, so exclude these
-            xf = df.select_dtypes(col_type, exclude=["datetime", "timedelta", "object"])  # type: ignore
+    def __init__(self, quantile_error: Optional[float] = None) -> None:
+        self.quantile_error = quantile_error
+        self.name = "Dataframe"
+        self.names: Optional[List[Any]] = None
+        self.kinds: List[str] = []
+        self.first_kinds: List[str] = []
+        self.states: List[Dict[str, Any]] = []
+        self.n_rows = 0
+
+    def update(self, chunk: Any) -> None:
+        """Adds a chunk of rows to the summary statistics.
+
+        Args:
+            chunk (Any): A pandas or polars dataframe, or a pyarrow Table or
+                RecordBatch, with the same columns as previous chunks.
+
+        Raises:
+            ValueError: If the chunk has different columns to previous chunks.
+        """
+        df = _chunk_to_pandas(chunk)
+        if self.names is None:
+            self.names = list(df.columns)
+            self.kinds = ["null"] * len(self.names)
+            self.states = [{"valid": 0} for _ in self.names]
+            if hasattr(df, "name") and "name" not in df.columns:
+                self.name = str(df.name)
+        elif list(df.columns) != self.names:
+            raise ValueError("Every chunk must have the same columns.")
+        type_plan = _infer_column_type_plan(df)
+        df = _infer_datatypes(df, type_plan)
+        chunk_kinds = [
+            _pandas_column_kind(series, inferred_type) if keep else None
+            for (_, series), inferred_type, keep in zip(
+                df.items(), type_plan["type"], type_plan["keep"]
+            )
+        ]
+        chunk_kinds = [kind or "unsupported" for kind in chunk_kinds]
+        if not self.first_kinds:
+            self.first_kinds = chunk_kinds
+        for i, kind in enumerate(chunk_kinds):
+            state = {"valid": 0}
+            if kind != "unsupported":
+                state = _column_state(kind, df.iloc[:, i], self.quantile_error)
+            if state["valid"] == 0 and kind != "unsupported":
+                # all missing, eg read as float64 by pd.read_csv, which fits
+                # in a column of any kind
+                kind = "null"
+            self._merge_column(i, kind, state)
+        self.n_rows += len(df)
+
+    def _merge_column(self, i: int, kind: str, state: Dict[str, Any]) -> None:
+        self.kinds[i] = _merge_column_kinds(self.kinds[i], kind)
+        if self.kinds[i] == "unsupported":
+            self.states[i] = {"valid": 0}
         else:
-            xf = df.select_dtypes(col_type)  # type: ignore
-        if not xf.empty:
-            sum_df = summary_func(xf)
-            # for rich tables, we need to stringify
-            # specialised and unsupported col types, such as datetime.date,
-            # that are actually registered as object type
-            col_type_to_rich = str(col_type)
-            list_of_tabs.append(_dataframe_to_rich_table(col_type_to_rich, sum_df))
-            json_data.update({col_type_to_rich: sum_df.to_dict()})
+            self.states[i] = _merge_column_states(self.kinds[i], self.states[i], state)
+
+    def merge(self, other: "_SkimAccumulator") -> None:
+        """Adds the summary statistics of the chunks that come after this one's.
+
+        Args:
+            other (_SkimAccumulator): Summary statistics of the later chunks.
+
+        Raises:
+            ValueError: If the two have different columns.
+        """
+        if other.names is None:
+            return
+        if self.names is None:
+            self.__dict__.update(other.__dict__)
+            return
+        if other.names != self.names:
+            raise ValueError("Every chunk must have the same columns.")
+        for i, (kind, state) in enumerate(zip(other.kinds, other.states)):
+            self._merge_column(i, kind, state)
+        self.n_rows += other.n_rows
+
+    def result(self) -> Tuple[Dict[str, Any], JSON]:
+        """Builds the skim output from the statistics of all of the chunks.
+
+        Returns:
+            Tuple[Dict[str, Any], JSON]: Summary to render with
+        _render_skim_output, JSON of summary stats.
+
+        Raises:
+            ValueError: If there were no chunks, or no supported columns.
+        """
+        if self.names is None:
+            raise ValueError("There were no chunks of rows to skim.")
+        # columns that are all missing keep the type of their first chunk
+        kinds = [
+            first_kind if kind == "null" else kind
+            for kind, first_kind in zip(self.kinds, self.first_kinds)
+        ]
+        positions = [i for i, kind in enumerate(kinds) if kind != "unsupported"]
+        if not positions:
+            raise ValueError(
+                f"Your input dataframe only has unsupported column types, eg {', '.join(UNSUPPORTED_INFERRED_TYPES)}"
+            )
+        stats = {}
+        for new_i, i in enumerate(positions):
+            column_stats = _column_stats_from_state(
+                kinds[i], self.states[i], self.n_rows, self.quantile_error is not None
+            )
+            stats.update({f"{new_i}:{key}": x for key, x in column_stats.items()})
+        return _skim_from_column_stats(
+            self.name,
+            [self.names[i] for i in positions],
+            [kinds[i] for i in positions],
+            self.n_rows,
+            stats,
+        )
 
-    # Put all of the info together
-    grid = Table.grid(expand=True)
-    tables_list = [dat_sum_table, types_sum_table]
-    if "category" in df.dtypes.astype(str).to_list():
-        tables_list.append(cat_sum_table)
-    grid.add_row(Columns(tables_list))
-    grid.add_column(justify="left")
-    for sum_tab in list_of_tabs:
-        grid.add_row(sum_tab)
-    # Weirdly, iteration over list of tabs misses last entry
-    grid.add_row(list_of_tabs[-1])
-    return grid, json_data
+
+@typechecked
+def _stream_skim_computation(
+    chunks: Iterable[Any], quantile_error: Optional[float] = None
+) -> Tuple[Dict[str, Any], JSON]:
+    """Performs the summary statistics of a dataframe that arrives in chunks.
+
+    Only one chunk is in memory at a time. The output is that of
+    _skim_computation on all of the chunks put together, except that, for
+    columns with more values than fit in a quantile sketch, quantiles and
+    histograms are approximate, and counts of more than HLL_EXACT_LIMIT
+    unique strings are estimates (marked as such). Datetime frequencies are inferred from each
+    chunk (and from where chunks meet), so they are only found if every chunk
+    has the same one. As in the other engines, columns of datetime.date are
+    summarised as datetimes.
+
+    Args:
+        chunks (Iterable[Any]): Chunks of rows, eg from
+            pd.read_csv(..., chunksize=...), pyarrow.RecordBatchReader, or
+            duckdb's fetch_df_chunk. Each may be a pandas or polars dataframe,
+            or a pyarrow Table or RecordBatch.
+        quantile_error (Optional[float]): Rank error of the quantile sketches
+            of numeric columns, which is then shown in the output. Defaults to
+            None (sketches of SKETCH_SIZE, without showing their rank error).
+
+    Returns:
+        Tuple[Dict[str, Any], JSON]: Summary to render with
+        _render_skim_output, JSON of summary stats.
+    """
+    accumulator = _SkimAccumulator(quantile_error)
+    for chunk in chunks:
+        accumulator.update(chunk)
+    return accumulator.result()
 
 
 @typechecked
 def skim(
-    df_in: Union[pd.DataFrame, pl.DataFrame],
+    df_in: Union[
+        pd.DataFrame, pl.DataFrame, pl.LazyFrame, pa.Table, pa.RecordBatchReader
+    ],
+    sample: Optional[Union[int, float]] = None,
+    seed: int = 0,
+    stratify: Optional[Any] = None,
+    quantile_error: Optional[float] = None,
+    n_jobs: Optional[int] = None,
+    cache: Optional[SummaryCache] = None,
+    profile: bool = False,
 ) -> None:
-    """Skim a pandas or polars dataframe and return visual summary statistics on it.
+    """Skim a pandas or polars dataframe, or Arrow table, and return visual summary statistics on it.
 
     skim is an alternative to pandas.DataFrame.describe(), quickly providing
     an overview of a data frame via a table displayed in the console. It produces a different set of summary
@@ -788,7 +3698,30 @@ def skim(
     processed.
 
     Args:
-        df_in (Union[pd.DataFrame, pl.DataFrame]): Dataframe to skim.
+        df_in (Union[pd.DataFrame, pl.DataFrame, pl.LazyFrame, pa.Table, pa.RecordBatchReader]): Dataframe,
+            or Arrow table or stream of record batches, to skim.
+        sample (Optional[Union[int, float]]): Compute the summary statistics
+            from a random sample of this many rows (an int), or of this
+            fraction of rows (a float between 0 and 1). The numbers of rows
+            and of missing values are still exact; other statistics are
+            estimates, and are marked with '~'. Defaults to None (all rows).
+        seed (int): Seed of the random sample, for reproducibility. Defaults to 0.
+        stratify (Optional[Any]): Name of a column to stratify the sample by,
+            so that every value of it is represented. Defaults to None.
+        quantile_error (Optional[float]): Estimate the quantiles of numeric
+            columns with quantile sketches (see QuantileSketch), which use a
+            fixed amount of memory, with this rank error (eg 0.001). The rank
+            error of each column is shown. Defaults to None (exact quantiles).
+        n_jobs (Optional[int]): Number of threads to summarise the columns of
+            a pandas dataframe on, or -1 for one per CPU. Polars dataframes
+            are summarised on polars' own threads. Defaults to None (no threads).
+        cache (Optional[SummaryCache]): Cache of the summaries of the columns
+            of pandas dataframes, so that skimming a dataframe again only
+            summarises the columns that have changed. Defaults to None.
+        profile (bool): If True, the wall time, CPU time, and peak memory of
+            each stage of the skim (eg each summary table, and rendering) are
+            shown in a table of their own. Profiling traces memory, which
+            slows the skim down. Defaults to False.
 
     Raises:
         NotImplementedError: If the dataframe has a MultiIndex column structure.
@@ -805,31 +3738,105 @@ def skim(
                 })
         >>> df["col1"] = df["col1"].astype("string")
         >>> skim(df)
+
+    Skim a large dataframe from a sample of 10,000 of its rows
+
+        >>> skim(df, sample=10_000)
+
+    See which stages of a skim are slow
+
+        >>> skim(df, profile=True)
     """
-    if isinstance(df_in.columns, pd.MultiIndex):
+    if isinstance(df_in, pd.DataFrame) and isinstance(df_in.columns, pd.MultiIndex):
         raise NotImplementedError(
             "Skimpy does not currently support multi-column indexes. Try using a simple column structure."
         )
 
-    df_out = _convert_to_pandas(df_in)
-    grid, _ = _skim_computation(df_out)
-    console = Console(record=True)
-    console.print(Panel(grid, title="skimpy summary", subtitle="End"))
+    profiler = _Profiler() if profile else None
+    with profiler or contextlib.nullcontext():
+        summary, _ = _run_skim_computation(
+            df_in, sample, seed, stratify, quantile_error, n_jobs, cache, profiler
+        )
+        n_columns = summary["tab_1_data"]["Number of columns"]
+        with _profile_stage(profiler, "render", n_columns):
+            console = _print_skim_output(summary)
+    if profiler is not None:
+        console.print(_profile_to_rich_table(profiler.stages))
+
+
+@typechecked
+def _is_polars(df: Any, class_name: str = "DataFrame") -> bool:
+    """Checks if a dataframe is from polars, without importing polars.
+
+    If polars hasn't been imported, nothing can be a polars dataframe.
+
+    Args:
+        df (Any): Dataframe to check.
+        class_name (str): Name of the polars class, eg 'LazyFrame'. Defaults
+            to 'DataFrame'.
+
+    Returns:
+        bool: Whether df is an instance of the polars class.
+    """
+    polars = sys.modules.get("polars")
+    return polars is not None and isinstance(df, getattr(polars, class_name))
 
 
 def _convert_to_pandas(df_in: Union[pd.DataFrame, pl.DataFrame]) -> pd.DataFrame:
-    if isinstance(df_in, pl.DataFrame):
+    # No copy for pandas input: _skim_computation never modifies its input
+    if _is_polars(df_in):
         df_out = df_in.to_pandas()
     else:
-        df_out = df_in.copy()
+        df_out = df_in
     return df_out
 
 
+def _run_skim_computation(
+    df_in: Union[
+        pd.DataFrame, pl.DataFrame, pl.LazyFrame, pa.Table, pa.RecordBatchReader
+    ],
+    sample: Optional[Union[int, float]] = None,
+    seed: int = 0,
+    stratify: Optional[Any] = None,
+    quantile_error: Optional[float] = None,
+    n_jobs: Optional[int] = None,
+    cache: Optional[SummaryCache] = None,
+    profiler: Optional[_Profiler] = None,
+) -> Tuple[Dict[str, Any], JSON]:
+    # the record batches of a stream become the chunks of a table, uncopied
+    if isinstance(df_in, pa.RecordBatchReader):
+        df_in = df_in.read_all()
+    sample_info = None
+    if sample is not None:
+        with _profile_stage(profiler, "sample", _n_columns(df_in)):
+            df_in, sample_info = _sample_dataframe(df_in, sample, seed, stratify)
+    # polars dataframes are summarised natively, without converting to pandas
+    if _is_polars(df_in) or _is_polars(df_in, "LazyFrame"):
+        return _polars_skim_computation(df_in, sample_info, quantile_error, profiler)
+    # and so are Arrow tables, with Arrow compute functions
+    if isinstance(df_in, pa.Table):
+        return _arrow_skim_computation(
+            df_in, sample_info, quantile_error, profiler=profiler
+        )
+    return _skim_computation(
+        df_in, sample_info, quantile_error, n_jobs, cache, profiler
+    )
+
+
 @typechecked
 def skim_get_data(
-    df_in: Union[pd.DataFrame, pl.DataFrame],
+    df_in: Union[
+        pd.DataFrame, pl.DataFrame, pl.LazyFrame, pa.Table, pa.RecordBatchReader
+    ],
+    sample: Optional[Union[int, float]] = None,
+    seed: int = 0,
+    stratify: Optional[Any] = None,
+    quantile_error: Optional[float] = None,
+    n_jobs: Optional[int] = None,
+    cache: Optional[SummaryCache] = None,
+    profile: bool = False,
 ) -> Union[JSON, str]:
-    """Skim a pandas or polars dataframe and return summary statistics as a dictionary, and without printing to the console.
+    """Skim a pandas or polars dataframe, or Arrow table, and return summary statistics as a dictionary, and without printing to the console.
 
     skim is an alternative to pandas.DataFrame.describe(), quickly providing
     an overview of a data frame via a table of summary statistics. It produces a different set of summary
@@ -841,23 +3848,59 @@ def skim_get_data(
     processed.
 
     Args:
-        df_in (Union[pd.DataFrame, pl.DataFrame]): Dataframe to get summary statistics on.
+        df_in (Union[pd.DataFrame, pl.DataFrame, pl.LazyFrame, pa.Table, pa.RecordBatchReader]): Dataframe,
+            or Arrow table or stream of record batches, to get summary statistics on.
+        sample (Optional[Union[int, float]]): Compute the summary statistics
+            from a random sample of this many rows (an int), or of this
+            fraction of rows (a float between 0 and 1). The numbers of rows
+            and of missing values are still exact; other statistics are
+            estimates, and are listed under 'Estimates'. Defaults to None (all rows).
+        seed (int): Seed of the random sample, for reproducibility. Defaults to 0.
+        stratify (Optional[Any]): Name of a column to stratify the sample by,
+            so that every value of it is represented. Defaults to None.
+        quantile_error (Optional[float]): Estimate the quantiles of numeric
+            columns with quantile sketches (see QuantileSketch), which use a
+            fixed amount of memory, with this rank error (eg 0.001). The rank
+            error of each column is shown. Defaults to None (exact quantiles).
+        n_jobs (Optional[int]): Number of threads to summarise the columns of
+            a pandas dataframe on, or -1 for one per CPU. Polars dataframes
+            are summarised on polars' own threads. Defaults to None (no threads).
+        cache (Optional[SummaryCache]): Cache of the summaries of the columns
+            of pandas dataframes, so that skimming a dataframe again only
+            summarises the columns that have changed. Defaults to None.
+        profile (bool): If True, the wall time, CPU time, and peak memory of
+            each stage of the skim (eg each summary table) are put under
+            'Profile'. Profiling traces memory, which slows the skim down.
+            Defaults to False.
 
     Returns:
         Union[JSON, str]: Dictionary of summary statistics.
     """
-    df_out = _convert_to_pandas(df_in)
-    _, json_data = _skim_computation(df_out)
+    profiler = _Profiler() if profile else None
+    with profiler or contextlib.nullcontext():
+        _, json_data = _run_skim_computation(
+            df_in, sample, seed, stratify, quantile_error, n_jobs, cache, profiler
+        )
+    if profiler is not None:
+        json_data["Profile"] = profiler.stages
     return json_data
 
 
 @typechecked
 def skim_get_figure(
-    df_in: Union[pd.DataFrame, pl.DataFrame],
+    df_in: Union[
+        pd.DataFrame, pl.DataFrame, pl.LazyFrame, pa.Table, pa.RecordBatchReader
+    ],
     save_path: Union[os.PathLike, str],
     format: str = "svg",
+    sample: Optional[Union[int, float]] = None,
+    seed: int = 0,
+    stratify: Optional[Any] = None,
+    quantile_error: Optional[float] = None,
+    n_jobs: Optional[int] = None,
+    cache: Optional[SummaryCache] = None,
 ) -> None:
-    """Skim a pandas or polars dataframe, print the stats to the console, and save a version of the table as an SVG, HTML, or text file.
+    """Skim a pandas or polars dataframe, or Arrow table, print the stats to the console, and save a version of the table as an SVG, HTML, or text file.
 
     skim is an alternative to pandas.DataFrame.describe(), quickly providing
     an overview of a data frame via a table of summary statistics. It produces a different set of summary
@@ -869,18 +3912,37 @@ def skim_get_figure(
     processed.
 
     Args:
-        df_in (Union[pd.DataFrame, pl.DataFrame]): Dataframe to skim.
+        df_in (Union[pd.DataFrame, pl.DataFrame, pl.LazyFrame, pa.Table, pa.RecordBatchReader]): Dataframe,
+            or Arrow table or stream of record batches, to skim.
         save_path (Union[os.PathLike, str]): Path to save figure to (include extension).
         format (str, optional): svg, html, or text. Defaults to "svg".
+        sample (Optional[Union[int, float]]): Compute the summary statistics
+            from a random sample of this many rows (an int), or of this
+            fraction of rows (a float between 0 and 1). The numbers of rows
+            and of missing values are still exact; other statistics are
+            estimates, and are marked with '~'. Defaults to None (all rows).
+        seed (int): Seed of the random sample, for reproducibility. Defaults to 0.
+        stratify (Optional[Any]): Name of a column to stratify the sample by,
+            so that every value of it is represented. Defaults to None.
+        quantile_error (Optional[float]): Estimate the quantiles of numeric
+            columns with quantile sketches (see QuantileSketch), which use a
+            fixed amount of memory, with this rank error (eg 0.001). The rank
+            error of each column is shown. Defaults to None (exact quantiles).
+        n_jobs (Optional[int]): Number of threads to summarise the columns of
+            a pandas dataframe on, or -1 for one per CPU. Polars dataframes
+            are summarised on polars' own threads. Defaults to None (no threads).
+        cache (Optional[SummaryCache]): Cache of the summaries of the columns
+            of pandas dataframes, so that skimming a dataframe again only
+            summarises the columns that have changed. Defaults to None.
 
     Raises:
 
         ValueError: If the format is not one of svg, html, or text.
     """
-    df_out = _convert_to_pandas(df_in)
-    grid, _ = _skim_computation(df_out)
-    console = Console(record=True)
-    console.print(Panel(grid, title="skimpy summary", subtitle="End"))
+    summary, _ = _run_skim_computation(
+        df_in, sample, seed, stratify, quantile_error, n_jobs, cache
+    )
+    console = _print_skim_output(summary)
     if not isinstance(save_path, str):
         save_path_str = str(save_path)
     else:
@@ -905,6 +3967,139 @@ def skim_get_figure(
         raise ValueError("Format must be: svg, html, or text")
 
 
+@typechecked
+def skim_stream(chunks: Iterable[Any], quantile_error: Optional[float] = None) -> None:
+    """Skim a dataframe that arrives in chunks of rows, and print summary statistics on it.
+
+    The chunks are summarised one at a time, so that dataframes larger than
+    memory can be skimmed, eg as they are read from a file. The output is
+    that of skim on all of the chunks put together, except that quantiles and
+    histograms of long numeric columns are approximate (with a rank error of
+    about 0.15%, unless quantile_error is given), counts of more than
+    HLL_EXACT_LIMIT unique strings are estimates (marked with '~'), and
+    datetime frequencies are only found if every chunk has the same one.
+
+    Args:
+        chunks (Iterable[Any]): Chunks of rows with the same columns. Each
+            may be a pandas or polars dataframe, or a pyarrow Table or
+            RecordBatch.
+        quantile_error (Optional[float]): Rank error of the quantiles of
+            numeric columns (eg 0.001), which is then shown for each column.
+            Defaults to None.
+
+    Examples
+    --------
+    Skim a dataframe 250 rows at a time (chunks can just as well come from
+    eg pd.read_csv(path, chunksize=100_000))
+
+        >>> df = generate_test_data()
+        >>> chunks = [df.iloc[start : start + 250] for start in range(0, len(df), 250)]
+        >>> skim_stream(chunks)
+    """
+    summary, _ = _stream_skim_computation(chunks, quantile_error)
+    _print_skim_output(summary)
+
+
+@typechecked
+def skim_stream_get_data(
+    chunks: Iterable[Any], quantile_error: Optional[float] = None
+) -> Union[JSON, str]:
+    """Skim a dataframe that arrives in chunks of rows, and return summary statistics as a dictionary.
+
+    See skim_stream for how the chunks are summarised.
+
+    Args:
+        chunks (Iterable[Any]): Chunks of rows with the same columns. Each
+            may be a pandas or polars dataframe, or a pyarrow Table or
+            RecordBatch.
+        quantile_error (Optional[float]): Rank error of the quantiles of
+            numeric columns (eg 0.001), which is then shown for each column.
+            Defaults to None.
+
+    Returns:
+        Union[JSON, str]: Dictionary of summary statistics.
+    """
+    _, json_data = _stream_skim_computation(chunks, quantile_error)
+    return json_data
+
+
+class SkimState:
+    """Summary statistics of a dataframe that grows by appending rows.
+
+    The statistics are kept in the mergeable form that skim_stream uses, so
+    update only summarises the new rows, and never rescans the rows that were
+    already seen. get_data then gives the output of skim_get_data on all of the
+    rows so far (with the same approximations as skim_stream_get_data).
+
+    Args:
+        df_in (Any): First rows of the dataframe: a pandas or polars
+            dataframe, or a pyarrow Table or RecordBatch. Defaults to None (no
+            rows yet).
+        quantile_error (Optional[float]): Rank error of the quantiles of
+            numeric columns (eg 0.001), which is then shown for each column.
+            Defaults to None.
+
+    Examples
+    --------
+    Skim a table again after every batch of rows appended to it
+
+        >>> df = generate_test_data()
+        >>> state = SkimState(df.iloc[:500])
+        >>> for start in range(500, len(df), 250):
+        ...     state.update(df.iloc[start : start + 250])
+        ...     summary = state.get_data()
+    """
+
+    def __init__(
+        self, df_in: Any = None, quantile_error: Optional[float] = None
+    ) -> None:
+        self._accumulator = _SkimAccumulator(quantile_error)
+        if df_in is not None:
+            self.update(df_in)
+
+    @property
+    def n_rows(self) -> int:
+        """Number of rows summarised so far.
+
+        Returns:
+            int: Number of rows.
+        """
+        return self._accumulator.n_rows
+
+    def update(self, new_rows: Any) -> None:
+        """Adds appended rows to the summary statistics.
+
+        Args:
+            new_rows (Any): The new rows, with the same columns as before: a
+                pandas or polars dataframe, or a pyarrow Table or RecordBatch.
+        """
+        self._accumulator.update(new_rows)
+
+    def merge(self, other: "SkimState") -> None:
+        """Adds the rows summarised by another SkimState, eg of another shard.
+
+        Args:
+            other (SkimState): Summary statistics of rows that come after
+                this one's.
+        """
+        # copied, so that updating either one later doesn't change the other
+        self._accumulator.merge(copy.deepcopy(other._accumulator))
+
+    def get_data(self) -> JSON:
+        """Returns the summary statistics of all of the rows so far as a dictionary.
+
+        Returns:
+            JSON: Dictionary of summary statistics, as from skim_get_data.
+        """
+        _, json_data = self._accumulator.result()
+        return json_data
+
+    def skim(self) -> None:
+        """Prints the summary statistics of all of the rows so far, as skim does."""
+        summary, _ = self._accumulator.result()
+        _print_skim_output(summary)
+
+
 @typechecked
 def clean_columns(
     df: Union[pd.DataFrame, pl.DataFrame],
@@ -962,23 +4157,160 @@ def clean_columns(
             f"case {case} is invalid, options are: {', '.join(c for c in CASE_STYLES)}"
         )
 
-    if replace and isinstance(df, pd.DataFrame):
-        df = df.rename(columns=lambda col: _replace_values(col, replace))
-    elif replace:
-        df = df.rename(lambda col: _replace_values(col, replace))
+    names = _clean_names(list(df.columns), case, replace, remove_accents)
+    if isinstance(df, pd.DataFrame):
+        return df.set_axis(names, axis="columns")
+    return df.rename(dict(zip(df.columns, names)))
 
-    if remove_accents and isinstance(df, pd.DataFrame):
-        df = df.rename(columns=_remove_accents)
-    elif remove_accents:
-        df = df.rename(_remove_accents)
 
-    if isinstance(df, pd.DataFrame):
-        df = df.rename(columns=lambda col: _convert_case(col, case))
+@typechecked
+def _clean_names(
+    names: List[Any],
+    case: str,
+    replace: Optional[Dict[str, str]] = None,
+    remove_accents: bool = True,
+) -> List[Any]:
+    """Cleans a whole index of column names at once.
+
+    Each distinct name is cleaned once (see _clean_name), and then duplicates
+    are renamed.
+
+    Args:
+        names (List[Any]): Column names.
+        case (str): Preferred case type, eg snake or camel.
+        replace (Optional[Dict[str, str]]): Values to replace in the names.
+        remove_accents (bool): Whether to strip accents from the names.
+
+    Returns:
+        List[Any]: Cleaned column names, in the same order.
+    """
+    replace_items = tuple(replace.items()) if replace else ()
+    if len(names) >= CLEAN_BATCH_MIN_NAMES:
+        cleaned = _clean_names_batch(names, case, replace_items, remove_accents)
     else:
-        df = df.rename(lambda col: _convert_case(col, case))
+        cleaned = [
+            _clean_name(name, case, replace_items, remove_accents) for name in names
+        ]
+    return _rename_duplicates(cleaned, case)
 
-    df.columns = _rename_duplicates(df.columns, case)
-    return df
+
+@functools.lru_cache(maxsize=CLEAN_NAME_CACHE_SIZE, typed=True)
+def _clean_name(
+    name: Any,
+    case: str,
+    replace_items: Tuple[Tuple[str, str], ...],
+    remove_accents: bool,
+) -> Any:
+    """Cleans one column name, remembering the results for repeated names.
+
+    Args:
+        name (Any): Column name.
+        case (str): Preferred case type, eg snake or camel.
+        replace_items (Tuple[Tuple[str, str], ...]): Values to replace in the
+            name, as (old value, new value) pairs.
+        remove_accents (bool): Whether to strip accents from the name.
+
+    Returns:
+        Any: Cleaned column name.
+    """
+    if replace_items:
+        name = _replace_values(name, dict(replace_items))
+    if remove_accents:
+        name = _remove_accents(name)
+    return _convert_case(name, case)
+
+
+@typechecked
+def _clean_names_batch(
+    names: List[Any],
+    case: str,
+    replace_items: Tuple[Tuple[str, str], ...],
+    remove_accents: bool,
+) -> List[str]:
+    """Cleans column names with vectorised string operations over all of them.
+
+    The names are the same as cleaning each one in turn (see _clean_name).
+    Python regexes are used (through pandas .str), rather than those of
+    pyarrow or polars, which treat some Unicode characters differently.
+
+    Args:
+        names (List[Any]): Column names.
+        case (str): Preferred case type, eg snake or camel.
+        replace_items (Tuple[Tuple[str, str], ...]): Values to replace in the
+            names, as (old value, new value) pairs.
+        remove_accents (bool): Whether to strip accents from the names.
+
+    Returns:
+        List[str]: Cleaned column names, before duplicates are renamed.
+
+    Raises:
+        IndexError: If a name has no words to convert to camel case.
+    """
+    is_null = np.array([name in NULL_VALUES for name in names], dtype=bool)
+    # as in _remove_accents, only names that are strings (or have had values
+    # replaced) lose their accents, and can be left empty
+    is_text = np.array([bool(replace_items) or isinstance(name, str) for name in names])
+    strings = pd.Series([str(name) for name in names], dtype=object)
+    for pattern, new_val in _compile_replacements(replace_items):
+        strings = strings.str.replace(pattern, new_val, regex=True)
+
+    if remove_accents:
+        strings[is_text] = (
+            strings[is_text]
+            .str.normalize("NFD")
+            .str.encode("ascii", "ignore")
+            .str.decode("ascii")
+        )
+    strings[is_null | (is_text & (strings == "").to_numpy())] = "header"
+
+    if case in {"snake", "kebab", "camel", "pascal", "const"}:
+        words = (
+            strings.str.replace(_PUNCTUATION_RE, " ", regex=True)
+            .str.replace(_QUOTES_RE, "", regex=True)
+            .str.findall(_STRIPPED_WORD_RE)
+        )
+    else:
+        words = strings.str.findall(_WORD_RE)
+
+    if case in {"snake", "const"}:
+        strings = words.str.join("_")
+    elif case == "kebab":
+        strings = words.str.join("-")
+    elif case in {"sentence", "lower", "upper"}:
+        strings = words.str.join(" ")
+    elif case == "camel":
+        first_words = words.str.get(0)
+        if first_words.isna().any():
+            raise IndexError("list index out of range")
+        strings = first_words.str.lower() + _join_capitalized(words.str[1:], "")
+    else:
+        strings = _join_capitalized(words, "" if case == "pascal" else " ")
+
+    if case in {"snake", "kebab", "lower"}:
+        strings = strings.str.lower()
+    elif case in {"const", "upper"}:
+        strings = strings.str.upper()
+    elif case == "sentence":
+        strings = strings.str.capitalize()
+    return strings.tolist()
+
+
+@typechecked
+def _join_capitalized(words: pd.Series, sep: str) -> pd.Series:
+    """Capitalizes every word in lists of words, and joins each list.
+
+    Args:
+        words (pd.Series): Lists of words.
+        sep (str): Separator between words.
+
+    Returns:
+        pd.Series: Joined words, one string per list.
+    """
+    return pd.Series(
+        [sep.join(map(str.capitalize, word_list)) for word_list in words],
+        index=words.index,
+        dtype=object,
+    )
 
 
 @typechecked
@@ -1025,20 +4357,16 @@ def _convert_case(name: Any, case: str) -> Any:
 @typechecked
 def _split_strip_string(string: str) -> List[str]:
     """Split the string into separate words and strip punctuation."""
-    string = re.sub(r"[!()*+\,\-./:;<=>?[\]^_{|}~]", " ", string)
-    string = re.sub(r"[\'\"\`]", "", string)
+    string = _PUNCTUATION_RE.sub(" ", string)
+    string = _QUOTES_RE.sub("", string)
 
-    return re.sub(
-        r"([A-Z][a-z]+)", r" \1", re.sub(r"([A-Z]+|[0-9]+|\W+)", r" \1", string)
-    ).split()
+    return _STRIPPED_WORD_RE.findall(string)
 
 
 @typechecked
 def _split_string(string: str) -> List[str]:
     """Split the string into separate words."""
-    string = re.sub(r"[\-_]", " ", string)
-
-    return re.sub(r"([A-Z][a-z]+)", r" \1", re.sub(r"([A-Z]+)", r"\1", string)).split()
+    return _WORD_RE.findall(string)
 
 
 @typechecked
@@ -1056,7 +4384,33 @@ def _replace_values(name: Any, mapping: Dict[str, str]) -> Any:
         return name
 
     name = str(name)
-    for old_value, new_value in mapping.items():
+    for pattern, new_val in _compile_replacements(tuple(mapping.items())):
+        name = pattern.sub(new_val, name)
+    return name
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_replacements(
+    replace_items: Tuple[Tuple[str, str], ...],
+) -> List[Tuple[re.Pattern, Union[str, Callable[[re.Match], str]]]]:
+    """Compiles the replacements of _replace_values into as few regexes as possible.
+
+    Each old value is a (case-insensitive) regular expression, and they are
+    applied one after another. When they are all plain text, and no match of
+    one can overlap a match of another, or the text that replaces it, every
+    replacement can be made in one pass of a single alternation regex, with
+    the same result.
+
+    Args:
+        replace_items (Tuple[Tuple[str, str], ...]): (old value, new value)
+            pairs.
+
+    Returns:
+        List[Tuple[re.Pattern, Union[str, Callable[[re.Match], str]]]]: Regexes
+        and their replacements, to substitute one after another.
+    """
+    replacements = []
+    for old_value, new_value in replace_items:
         # If the old value or the new value is not alphanumeric, add underscores to the
         # beginning and end so the new value will be parsed correctly for _convert_case()
         new_val = (
@@ -1064,9 +4418,49 @@ def _replace_values(name: Any, mapping: Dict[str, str]) -> Any:
             if old_value.isalnum() and new_value.isalnum()
             else rf"_{new_value}_"
         )
-        name = re.sub(rf"{old_value}", new_val, name, flags=re.IGNORECASE)
+        replacements.append((old_value, new_val))
+    one_by_one: List[Tuple[re.Pattern, Union[str, Callable[[re.Match], str]]]] = [
+        (re.compile(old, flags=re.IGNORECASE), new) for old, new in replacements
+    ]
+    is_plain = all(
+        old
+        and old.isascii()
+        and new.isascii()
+        and re.escape(old) == old.replace(" ", "\\ ")
+        and "\\" not in new
+        for old, new in replacements
+    )
+    if not is_plain or len(replacements) < 2:
+        return one_by_one
+    for i, (old, new) in enumerate(replacements):
+        for other, _ in replacements[i + 1 :]:
+            if _can_overlap(old, other) or _can_overlap(other, new):
+                return one_by_one
+    pattern = re.compile(
+        "|".join(re.escape(old) for old, _ in replacements), flags=re.IGNORECASE
+    )
+    lookup = {old.lower(): new for old, new in replacements}
+    return [(pattern, lambda match: lookup[match[0].lower()])]
 
-    return name
+
+@typechecked
+def _can_overlap(pattern: str, text: str) -> bool:
+    """Checks if a match of plain text can overlap some text, ignoring case.
+
+    Args:
+        pattern (str): Plain text to match.
+        text (str): Text that it might overlap.
+
+    Returns:
+        bool: Whether there is any alignment of pattern and text (next to
+        other characters) in which their overlapping characters are equal.
+    """
+    pattern, text = pattern.lower(), text.lower()
+    for offset in range(1 - len(pattern), len(text)):
+        start, end = max(offset, 0), min(offset + len(pattern), len(text))
+        if pattern[start - offset : end - offset] == text[start:end]:
+            return True
+    return False
 
 
 @typechecked
@@ -1119,7 +4513,7 @@ def generate_test_data() -> pd.DataFrame:
         >>> df = generate_test_data()
     """
     seed = 34729
-    rng = Generator(PCG64(seed))
+    rng = np.random.Generator(np.random.PCG64(seed))
     len_df = 1000
     df = pd.DataFrame()
     df["length"] = rng.beta(0.5, 0.5, size=len_df)
@@ -1,12 +1,84 @@
 """Command-line interface for skimpy."""
 
+from __future__ import annotations
+
 import pathlib
+from typing import TYPE_CHECKING, Any, Iterator, Sequence
 
 import click
-import duckdb
+import numpy as np
 import pandas as pd
 
-from skimpy import skim
+from skimpy import (
+    COMPLETE_COL,
+    DATE_COL_FIRST,
+    DATE_COL_LAST,
+    HIST_BINS,
+    JSON,
+    MISSING_COL,
+    NUM_COL_MEAN,
+    QUANTILES,
+    _arrow_column_kind,
+    _arrow_skim_computation,
+    _build_skim_output,
+    _hist_to_unicode,
+    _print_skim_output,
+    _round_series,
+    _skim_computation,
+    _skim_from_column_stats,
+    _stream_skim_computation,
+)
+
+# duckdb and pyarrow.dataset are imported where they are needed, so that
+# skimpy --help is fast
+if TYPE_CHECKING:
+    import duckdb
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+# File suffixes of Arrow IPC (Feather) files
+ARROW_IPC_SUFFIXES = [".arrow", ".feather", ".ipc"]
+
+# Summary tables of the --metadata-only mode, and the kinds of column in each
+# (columns that are all missing, or of kinds that skimpy doesn't summarise,
+# are put in tables of their own)
+METADATA_TABLES = {
+    "number": ["integer", "float"],
+    "category": ["category"],
+    "bool": ["bool"],
+    "datetime": ["datetime", "date"],
+    "timedelta64[ns]": ["timedelta"],
+    "string": ["string"],
+}
+
+# Number of DuckDB vectors (of 2,048 rows) in each chunk of the stream engine
+VECTORS_PER_CHUNK = 256
+
+# DuckDB column types that are summarised in the database, by kind of column
+DUCKDB_TYPE_TO_KIND = {
+    "tinyint": "integer",
+    "smallint": "integer",
+    "integer": "integer",
+    "bigint": "integer",
+    "utinyint": "integer",
+    "usmallint": "integer",
+    "uinteger": "integer",
+    "ubigint": "integer",
+    "float": "float",
+    "double": "float",
+    "decimal": "float",
+    "hugeint": "float",
+    "uhugeint": "float",
+    "boolean": "bool",
+    "varchar": "string",
+    "enum": "category",
+    "date": "date",
+    "timestamp": "datetime",
+    "timestamp_s": "datetime",
+    "timestamp_ms": "datetime",
+    "timestamp_ns": "datetime",
+    "timestamp with time zone": "datetime",
+}
 
 
 @click.command()
@@ -18,51 +90,223 @@ from skimpy import skim
     default=None,
     help="Table name (required for sqlite files). If not provided, shows available tables.",
 )
-def main(input: str, table: str | None) -> None:
+@click.option(
+    "--engine",
+    "-e",
+    type=click.Choice(["duckdb", "arrow", "pandas", "stream"]),
+    default="duckdb",
+    show_default=True,
+    help="Compute summary statistics inside DuckDB, on the data as Arrow (a column at a time for parquet and Arrow files), load the data into pandas first, or load it into pandas in chunks of rows.",
+)
+@click.option(
+    "--columns",
+    "-c",
+    multiple=True,
+    help="Column to summarise; repeat for more columns. If not provided, summarises every column.",
+)
+@click.option(
+    "--metadata-only",
+    is_flag=True,
+    help="Only show the statistics that the footers of parquet files answer (rows, missing values, min, and max), without reading any data.",
+)
+def main(
+    input: str,
+    table: str | None,
+    engine: str,
+    columns: tuple[str, ...],
+    metadata_only: bool,
+) -> None:
     """The skimpy command line interface. Usage refers only to command line.
 
     Args:
-        input (str): Path of data file (csv, parquet, or sqlite)
+        input (str): Path of data file (csv, parquet, Arrow IPC/Feather, or
+            sqlite), or of a directory of parquet files
         table (str | None): Table name for sqlite files; shows available tables if not provided
+        engine (str): Engine that computes the summary statistics (duckdb,
+            arrow, pandas, or stream)
+        columns (tuple[str, ...]): Names of the columns to summarise; all of
+            them if empty
+        metadata_only (bool): Whether to only summarise the footers of
+            parquet files
     """
-    df = _load_data_from_file(input, table)
-    skim(df)
+    if metadata_only:
+        dataset = _load_dataset_from_file(input, columns)
+        summary, _ = _parquet_metadata_skim_computation(dataset)
+    elif engine == "arrow":
+        summary, _ = _arrow_skim_file(input, table, columns)
+    else:
+        rel = _load_relation_from_file(input, table, columns)
+        if engine == "duckdb":
+            summary, _ = _duckdb_skim_computation(rel)
+        elif engine == "stream":
+            summary, _ = _stream_skim_computation(_iter_relation_chunks(rel))
+        else:
+            summary, _ = _skim_computation(rel.to_df())
+    _print_skim_output(summary)
 
 
-def _load_data_from_file(input: str, table: str | None = None) -> pd.DataFrame:
+def _load_data_from_file(
+    input: str, table: str | None = None, columns: Sequence[str] = ()
+) -> pd.DataFrame:
     """Load data from a file based on its extension.
 
     Args:
-        input: Path to CSV, parquet, or SQLite file
+        input: Path to CSV, parquet, Arrow IPC/Feather, or SQLite file
         table: Optional table name for SQLite files
+        columns: Optional names of the columns to load; all of them if empty
 
     Returns:
         pandas DataFrame loaded from the specified file
+    """
+    return _load_relation_from_file(input, table, columns).to_df()
+
+
+def _input_path(input: str) -> pathlib.Path:
+    """Check that an input file exists.
+
+    Args:
+        input: Path to the input file
+
+    Returns:
+        Path of the input file
 
     Raises:
-        ValueError: If file extension is not supported or required arguments are missing
+        FileNotFoundError: If the input file does not exist
     """
     input_path = pathlib.Path(input)
     if not input_path.exists():
         msg = f"Input path does not exist: {input}"
         raise FileNotFoundError(msg)
+    return input_path
 
-    suffix = input_path.suffix.lower()
 
-    if suffix == ".csv":
-        return duckdb.read_csv(str(input_path)).to_df()
+def _check_columns(
+    columns: Sequence[str], available: Sequence[str], input: str
+) -> None:
+    """Check that the columns to summarise are all in a file.
+
+    Args:
+        columns: Names of the columns to summarise
+        available: Names of the columns of the file
+        input: Path to the file
+
+    Raises:
+        ValueError: If any of the columns are not in the file
+    """
+    missing = [name for name in columns if name not in available]
+    if missing:
+        msg = f"Columns not found in {input}: {', '.join(missing)}. Available columns: {', '.join(available)}"
+        raise ValueError(msg)
+
+
+def _load_relation_from_file(
+    input: str, table: str | None = None, columns: Sequence[str] = ()
+) -> duckdb.DuckDBPyRelation:
+    """Open a file as a (lazy) DuckDB relation, based on its extension.
+
+    Args:
+        input: Path to CSV, parquet, Arrow IPC/Feather, or SQLite file, or to a
+            directory of parquet files
+        table: Optional table name for SQLite files
+        columns: Optional names of the columns to keep; all of them if empty
+
+    Returns:
+        DuckDB relation reading the specified file; no data is read until it is queried
+
+    Raises:
+        ValueError: If file extension is not supported or required arguments are missing
+    """
+    import duckdb
 
-    if suffix == ".parquet":
-        return duckdb.read_parquet(str(input_path)).to_df()
+    input_path = _input_path(input)
+    suffix = input_path.suffix.lower()
 
-    if suffix == ".sqlite":
+    if suffix == ".csv":
+        rel = duckdb.read_csv(str(input_path))
+    elif suffix == ".parquet":
+        rel = duckdb.read_parquet(str(input_path))
+    elif input_path.is_dir() or suffix in ARROW_IPC_SUFFIXES:
+        rel = duckdb.from_arrow(_load_dataset_from_file(input))
+    elif suffix == ".sqlite":
         _handle_sqlite_file(str(input_path), table)
         # Use ATTACH to load from SQLite database
-        df = duckdb.sql(f"ATTACH '{input}' AS mydb; SELECT * FROM mydb.{table}").to_df()
-        return df
+        con = duckdb.connect()
+        con.execute(f"ATTACH '{input}' AS mydb")
+        rel = con.sql(f"SELECT * FROM mydb.{table}")
+    else:
+        msg = f"Unsupported file type: {suffix}. Supported types: .csv, .parquet, {', '.join(ARROW_IPC_SUFFIXES)}, .sqlite"
+        raise ValueError(msg)
+
+    if columns:
+        _check_columns(columns, rel.columns, input)
+        rel = rel.select(", ".join(_quote(name) for name in dict.fromkeys(columns)))
+    return rel
+
+
+def _load_dataset_from_file(input: str, columns: Sequence[str] = ()) -> ds.Dataset:
+    """Open a parquet or Arrow IPC/Feather file as a memory-mapped Arrow dataset.
+
+    A directory is opened as a dataset of all of the parquet files in it,
+    with any hive partitions (eg year=2024/) as columns.
 
-    msg = f"Unsupported file type: {suffix}. Supported types: .csv, .parquet, .sqlite"
-    raise ValueError(msg)
+    Args:
+        input: Path to parquet or Arrow IPC/Feather file, or to a directory of
+            parquet files
+        columns: Optional names of the columns to keep; all of them if empty
+
+    Returns:
+        Arrow dataset of the specified file; columns are only read (through a
+        memory map) when they are scanned, and can be read one at a time
+
+    Raises:
+        ValueError: If file extension is not supported
+    """
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    from pyarrow import fs
+
+    input_path = _input_path(input)
+    suffix = input_path.suffix.lower()
+    if input_path.is_dir() or suffix == ".parquet":
+        file_format = "parquet"
+    elif suffix in ARROW_IPC_SUFFIXES:
+        file_format = "ipc"
+    else:
+        msg = f"Unsupported file type: {suffix}. Supported types: .parquet, {', '.join(ARROW_IPC_SUFFIXES)}"
+        raise ValueError(msg)
+
+    dataset = ds.dataset(
+        str(input_path.resolve()),
+        format=file_format,
+        filesystem=fs.LocalFileSystem(use_mmap=True),
+        partitioning="hive",
+    )
+    if columns:
+        _check_columns(columns, dataset.schema.names, input)
+        dataset = dataset.replace_schema(
+            pa.schema([dataset.schema.field(name) for name in dict.fromkeys(columns)])
+        )
+    return dataset
+
+
+def _iter_relation_chunks(
+    rel: duckdb.DuckDBPyRelation, vectors_per_chunk: int = VECTORS_PER_CHUNK
+) -> Iterator[pd.DataFrame]:
+    """Read a DuckDB relation into pandas a chunk of rows at a time.
+
+    Args:
+        rel: DuckDB relation to read
+        vectors_per_chunk: Number of DuckDB vectors (of 2,048 rows) in each chunk
+
+    Yields:
+        pandas DataFrame of each chunk of rows; only the first may be empty
+    """
+    chunk = rel.fetch_df_chunk(vectors_per_chunk)
+    yield chunk
+    while not chunk.empty:
+        chunk = rel.fetch_df_chunk(vectors_per_chunk)
+        if not chunk.empty:
+            yield chunk
 
 
 def _handle_sqlite_file(sqlite_path: str, table: str | None) -> None:
@@ -75,6 +319,8 @@ def _handle_sqlite_file(sqlite_path: str, table: str | None) -> None:
     Raises:
         ValueError: If no table is provided for a non-empty SQLite database
     """
+    import duckdb
+
     con = duckdb.connect(sqlite_path)
     available_tables = con.execute(
         "SELECT name FROM sqlite_master WHERE type='table'"
@@ -100,5 +346,389 @@ def _handle_sqlite_file(sqlite_path: str, table: str | None) -> None:
     con.close()
 
 
+def _quote(name: str) -> str:
+    """Quote a column name for use in a DuckDB query.
+
+    Args:
+        name: Column name
+
+    Returns:
+        Column name as a quoted SQL identifier
+    """
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _duckdb_column(name: str, type_id: str, kind: str) -> str:
+    """Build the SQL expression that a column is summarised through.
+
+    As in the pandas engine, NaN counts as missing, numbers are summarised as
+    doubles, and timezone-aware datetimes are summarised in local time.
+
+    Args:
+        name: Column name
+        type_id: DuckDB type id of the column
+        kind: Kind of column (see DUCKDB_TYPE_TO_KIND)
+
+    Returns:
+        SQL expression for the column
+    """
+    col = _quote(name)
+    if type_id in ("float", "double"):
+        return f"CASE WHEN isnan({col}) THEN NULL ELSE {col}::DOUBLE END"
+    if kind in ("integer", "float"):
+        return f"{col}::DOUBLE"
+    if kind in ("datetime", "date"):
+        return f"{col}::TIMESTAMP"
+    return col
+
+
+def _aggregate_row(rel: duckdb.DuckDBPyRelation, exprs: str) -> tuple[Any, ...]:
+    """Aggregate a whole relation to its one row of results.
+
+    Args:
+        rel: DuckDB relation to aggregate
+        exprs: Comma-separated aggregate expressions
+
+    Returns:
+        The value of each expression
+
+    Raises:
+        ValueError: If DuckDB returns no row
+    """
+    row = rel.aggregate(exprs).fetchone()
+    if row is None:
+        raise ValueError(f"DuckDB returned no row for the aggregate {exprs}.")
+    return row
+
+
+def _duckdb_skim_computation(
+    rel: duckdb.DuckDBPyRelation,
+) -> tuple[dict[str, Any], JSON]:
+    """Compute the summary statistics of a DuckDB relation inside DuckDB.
+
+    Rather than loading the whole table into pandas, the statistics are pushed
+    down into (at most) two aggregate queries: one for missing values, moments,
+    quantiles, extremes, and string lengths, and one for histogram bin counts.
+    Only the small summary tables come back to Python, so that files larger
+    than memory can be skimmed. Tables with column types that skimpy doesn't
+    summarise in DuckDB (eg lists, structs, or intervals) are loaded into
+    pandas instead. Where several strings are tied for shortest or longest,
+    the one shown may differ from the pandas engine.
+
+    Args:
+        rel: DuckDB relation to summarise
+
+    Returns:
+        Summary to render with _render_skim_output, JSON of summary stats
+    """
+    names = rel.columns
+    type_ids = [dtype.id for dtype in rel.types]
+    kinds = [DUCKDB_TYPE_TO_KIND.get(type_id) for type_id in type_ids]
+    n_rows = _aggregate_row(rel, "count(*)")[0]
+    if None in kinds or n_rows == 0:
+        return _skim_computation(rel.to_df())
+
+    cols = [
+        _duckdb_column(name, type_id, kind)
+        for name, type_id, kind in zip(names, type_ids, kinds)
+        if kind is not None
+    ]
+    keys = []
+    exprs = []
+
+    def _add(i: int, stat: str, expr: str) -> None:
+        keys.append(f"{i}:{stat}")
+        exprs.append(expr)
+
+    for i, (col, kind) in enumerate(zip(cols, kinds)):
+        _add(i, MISSING_COL, f"count(*) - count({col})")
+        if kind in ("integer", "float"):
+            _add(i, NUM_COL_MEAN, f"avg({col})")
+            _add(i, "sd", f"stddev_samp({col})")
+            _add(i, "quantiles", f"quantile_cont({col}, {QUANTILES})")
+        elif kind == "bool":
+            _add(i, "true", f"count_if({col})")
+        elif kind == "category":
+            _add(i, "unique", f"count(DISTINCT {col})")
+        elif kind in ("datetime", "date"):
+            _add(i, "min", f"epoch_ns(min({col}))")
+            _add(i, "max", f"epoch_ns(max({col}))")
+            _add(i, "distinct", f"count(DISTINCT {col})")
+        elif kind == "string":
+            _add(i, "shortest", f"arg_min({col}, length({col}))")
+            _add(i, "longest", f"arg_max({col}, length({col}))")
+            _add(i, "min", f"min({col})")
+            _add(i, "max", f"max({col})")
+            _add(i, "unique", f"count(DISTINCT {col})")
+            _add(i, "chars", f"avg(length({col}))")
+            _add(
+                i,
+                "words",
+                f"sum(length({col}) - length(replace({col}, ' ', '')) + 1)",
+            )
+    stats: dict[str, Any] = dict(zip(keys, _aggregate_row(rel, ", ".join(exprs))))
+
+    # Histograms are bin counts, with the same bin edges as numpy
+    hist_edges = {}
+    exprs = []
+    for i, (col, kind) in enumerate(zip(cols, kinds)):
+        n_null = stats[f"{i}:{MISSING_COL}"]
+        if kind in ("category", "string"):
+            # as in pandas, missing values count as a unique value
+            stats[f"{i}:unique"] += int(n_null > 0)
+        elif kind == "bool":
+            # as in pandas, missing values become False
+            counts = np.zeros(HIST_BINS, dtype=int)
+            n_true = stats[f"{i}:true"]
+            if 0 < n_true < n_rows:
+                counts[0], counts[-1] = n_rows - n_true, n_true
+            else:
+                counts[HIST_BINS // 2] = n_rows
+            stats[f"{i}:hist"] = _hist_to_unicode(counts / counts.sum())
+        elif kind in ("integer", "float") and n_null < n_rows:
+            quantiles = stats.pop(f"{i}:quantiles")
+            stats.update({f"{i}:q{x}": q for x, q in zip(QUANTILES, quantiles)})
+            edges = np.histogram_bin_edges([quantiles[0], quantiles[-1]], HIST_BINS)
+            hist_edges[i] = edges
+            edges = edges.tolist()
+            exprs.append(f"count_if({col} < {edges[1]!r})")
+            exprs.extend(
+                f"count_if({col} >= {lo!r} AND {col} < {hi!r})"
+                for lo, hi in zip(edges[1:-2], edges[2:-1])
+            )
+            exprs.append(f"count_if({col} >= {edges[-2]!r})")
+        elif kind in ("datetime", "date") and n_rows > 3:
+            # Only strictly increasing, unique, datetimes can have a frequency
+            stats[f"{i}:frequency"] = None
+            if stats[f"{i}:distinct"] == n_rows:
+                column = rel.select(f"{col} AS dt").to_df()["dt"]
+                stats[f"{i}:frequency"] = pd.infer_freq(column)
+    if exprs:
+        counts = np.array(_aggregate_row(rel, ", ".join(exprs)))
+        for i, bin_counts in zip(hist_edges, counts.reshape(-1, HIST_BINS)):
+            # density, as calculated by numpy.histogram
+            db = np.array(np.diff(hist_edges[i]), float)
+            stats[f"{i}:hist"] = _hist_to_unicode(bin_counts / db / bin_counts.sum())
+    return _skim_from_column_stats("Dataframe", names, kinds, n_rows, stats)
+
+
+def _arrow_skim_file(
+    input: str, table: str | None = None, columns: Sequence[str] = ()
+) -> tuple[dict[str, Any], JSON]:
+    """Compute the summary statistics of a file with the Arrow engine.
+
+    Parquet and Arrow IPC/Feather files (and directories of parquet files)
+    are memory-mapped, and summarised a column at a time, so that no more than one column needs to be in memory.
+    Their columns are read as the types that DuckDB reads them as (see
+    _duckdb_arrow_schema), so that every engine gives the same summary.
+    Statistics that the footers of parquet files answer exactly are taken
+    from there (see _parquet_footer_stats). Other files are read through
+    DuckDB into an Arrow table.
+
+    Args:
+        input: Path to data file
+        table: Optional table name for SQLite files
+        columns: Optional names of the columns to summarise; all of them if empty
+
+    Returns:
+        Summary to render with _render_skim_output, JSON of summary stats
+    """
+    input_path = _input_path(input)
+    suffix = input_path.suffix.lower()
+    is_parquet = input_path.is_dir() or suffix == ".parquet"
+    if is_parquet or suffix in ARROW_IPC_SUFFIXES:
+        dataset = _load_dataset_from_file(input, columns)
+        known_stats = _parquet_footer_stats(dataset)[1] if is_parquet else None
+        return _arrow_skim_computation(
+            dataset,
+            known_stats=known_stats,
+            schema=_duckdb_arrow_schema(dataset.schema, suffix == ".parquet"),
+        )
+    rel = _load_relation_from_file(input, table, columns)
+    return _arrow_skim_computation(rel.to_arrow_table())
+
+
+def _duckdb_arrow_schema(schema: pa.Schema, read_parquet: bool) -> pa.Schema:
+    """Find the Arrow types that DuckDB reads the columns of a file as.
+
+    DuckDB reads dictionaries as their values, and timezone-aware datetimes
+    in its TimeZone setting, so that the other engines summarise them as
+    strings (say), and as datetimes in that time zone. A parquet file that
+    DuckDB reads itself is read by its parquet types, rather than the Arrow
+    schema that pyarrow saves in it, so durations, which parquet stores as
+    integers, are integers.
+
+    Args:
+        schema: Arrow schema of the file
+        read_parquet: Whether DuckDB reads the file as parquet, rather than
+            from Arrow (as it reads Arrow IPC/Feather files, and directories
+            of parquet files)
+
+    Returns:
+        The schema, with the types that DuckDB reads its columns as
+    """
+    import pyarrow as pa
+
+    time_zone = None
+    fields = []
+    for field in schema:
+        if pa.types.is_dictionary(field.type):
+            field = field.with_type(field.type.value_type)
+        elif pa.types.is_timestamp(field.type) and field.type.tz is not None:
+            time_zone = time_zone or _duckdb_time_zone()
+            field = field.with_type(pa.timestamp(field.type.unit, time_zone))
+        elif pa.types.is_duration(field.type) and read_parquet:
+            field = field.with_type(pa.int64())
+        fields.append(field)
+    return pa.schema(fields, metadata=schema.metadata)
+
+
+def _duckdb_time_zone() -> str:
+    """Find the time zone that DuckDB reads timezone-aware datetimes in.
+
+    Returns:
+        The TimeZone setting of DuckDB (by default, the local time zone)
+    """
+    import duckdb
+
+    return str(duckdb.sql("SELECT current_setting('TimeZone')").fetchall()[0][0])
+
+
+def _parquet_footer_stats(dataset: ds.Dataset) -> tuple[int, dict[str, Any]]:
+    """Read the statistics of a parquet dataset that its footers answer exactly.
+
+    The footer of a parquet file holds its number of rows, and statistics of
+    each column of each of its row groups. Where every row group of a column
+    has them, they give the number of missing values of the column (except
+    of floats, whose NaNs aren't counted, unless every value is null), and
+    the min and max of numbers, dates, and timezone-naive datetimes. Only the
+    footers are read, not the data.
+
+    Args:
+        dataset: Arrow dataset of parquet files
+
+    Returns:
+        Number of rows, and statistics keyed as in _skim_from_column_stats
+        ('{column position}:{name}')
+
+    Raises:
+        ValueError: If the dataset is not of parquet files
+    """
+    import pyarrow.dataset as ds
+
+    if not isinstance(dataset.format, ds.ParquetFileFormat):
+        msg = "Only parquet files have footers with statistics of their columns."
+        raise ValueError(msg)
+    names = dataset.schema.names
+    n_rows = 0
+    n_nulls: list[int | None] = [0] * len(names)
+    lows: list[list[Any] | None] = [[] for _ in names]
+    highs: list[list[Any]] = [[] for _ in names]
+    for fragment in dataset.get_fragments():
+        metadata = fragment.metadata
+        n_rows += metadata.num_rows
+        paths = {metadata.schema.column(j).path: j for j in range(metadata.num_columns)}
+        for k in range(metadata.num_row_groups):
+            row_group = metadata.row_group(k)
+            for i, name in enumerate(names):
+                j = paths.get(name)
+                statistics = None if j is None else row_group.column(j).statistics
+                if statistics is None or not statistics.has_null_count:
+                    n_nulls[i] = None
+                elif n_nulls[i] is not None:
+                    n_nulls[i] += statistics.null_count
+                low_values = lows[i]
+                if statistics is not None and statistics.has_min_max:
+                    if low_values is not None:
+                        low_values.append(statistics.min)
+                        highs[i].append(statistics.max)
+                elif statistics is None or statistics.num_values > 0:
+                    # (row groups of only missing values have no min or max)
+                    lows[i] = None
+
+    stats: dict[str, Any] = {}
+    for i, field in enumerate(dataset.schema):
+        kind = _arrow_column_kind(field.type)
+        n_null = n_rows if kind == "null" else n_nulls[i]
+        if n_null is not None and (kind != "float" or n_null == n_rows):
+            stats[f"{i}:{MISSING_COL}"] = n_null
+        low_values = lows[i]
+        if kind is None or not low_values:
+            continue
+        low, high = min(low_values), max(highs[i])
+        if kind in ("integer", "float") and not np.isnan([low, high]).any():
+            # (+ 0.0 turns the -0.0 that parquet writes for a min of zero into 0.0)
+            stats[f"{i}:q0"] = float(low) + 0.0
+            stats[f"{i}:q1"] = float(high) + 0.0
+        elif kind == "date" or (kind == "datetime" and field.type.tz is None):
+            stats[f"{i}:min"] = pd.Timestamp(low).value
+            stats[f"{i}:max"] = pd.Timestamp(high).value
+    return n_rows, stats
+
+
+def _parquet_metadata_skim_computation(
+    dataset: ds.Dataset,
+) -> tuple[dict[str, Any], JSON]:
+    """Summarise a parquet dataset from the footers of its files alone.
+
+    No data is read, so that even very large datasets are summarised in
+    milliseconds. Only the number of rows, and the statistics that the
+    footers answer exactly (see _parquet_footer_stats) are shown: missing
+    values, p0 and p100 of numbers, and the first and last datetimes. Those
+    that the footers don't answer (eg missing values of floats, which may be
+    NaN) are left missing. Data types are those of Arrow.
+
+    Args:
+        dataset: Arrow dataset of parquet files
+
+    Returns:
+        Summary to render with _render_skim_output, JSON of summary stats
+    """
+    n_rows, stats = _parquet_footer_stats(dataset)
+    names = dataset.schema.names
+    kinds = [_arrow_column_kind(field.type) for field in dataset.schema]
+    for i, kind in enumerate(kinds):
+        if kind is not None and stats.get(f"{i}:{MISSING_COL}") == n_rows:
+            kinds[i] = "null"
+    dtypes = [
+        "category" if kind == "category" else str(field.type)
+        for field, kind in zip(dataset.schema, kinds)
+    ]
+    tab_1_data = {"Number of rows": n_rows, "Number of columns": len(names)}
+    tab_2_data = pd.Series(dtypes, dtype=object).value_counts().to_dict()
+    cat_names = [name for name, kind in zip(names, kinds) if kind == "category"]
+
+    def _series(positions: list[int], name: str, dtype: str) -> pd.Series:
+        values = [stats.get(f"{i}:{name}") for i in positions]
+        return pd.Series(values, index=[names[i] for i in positions], dtype=dtype)
+
+    summary_tables = {}
+    tables = {"All null": ["null"], **METADATA_TABLES, "object": [None]}
+    for table_name, table_kinds in tables.items():
+        positions = [i for i, kind in enumerate(kinds) if kind in table_kinds]
+        if not positions:
+            continue
+        count_nans_vec = _series(positions, MISSING_COL, "Int64")
+        data_dict = {
+            MISSING_COL: count_nans_vec,
+            COMPLETE_COL: 100 * count_nans_vec / n_rows,
+        }
+        if table_name == "number":
+            for stat, col in [("q0", "p0"), ("q1", "p100")]:
+                values = _round_series(_series(positions, stat, "float64"), 4)
+                data_dict[col] = values.astype("Float64")
+        elif table_name == "datetime":
+            data_dict[DATE_COL_FIRST] = pd.to_datetime(
+                _series(positions, "min", "Int64")
+            )
+            data_dict[DATE_COL_LAST] = pd.to_datetime(
+                _series(positions, "max", "Int64")
+            )
+        summary_tables[table_name] = pd.DataFrame(data_dict)
+    return _build_skim_output(
+        "Dataframe", tab_1_data, tab_2_data, cat_names, summary_tables
+    )
+
+
 if __name__ == "__main__":
     main(prog_name="skimpy")  # pragma: no cover
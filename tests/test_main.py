@@ -1,33 +1,59 @@
 """Test cases for the __main__ module."""
 
 import datetime
+import io
+import json
 import os
+import re
 import subprocess
+import sys
+import textwrap
 
 import numpy as np
 import pandas as pd
 import polars as pl
+import pyarrow as pa
+import pyarrow.compute as pc
 import pytest
 from click.testing import CliRunner
-from pandas.testing import assert_frame_equal
+from numpy.testing import assert_array_equal
+from pandas.testing import assert_frame_equal, assert_series_equal
 from typeguard import typeguard_ignore
 
 from skimpy import (
+    HIST_BINS,
+    QUANTILES,
+    HyperLogLog,
+    QuantileSketch,
+    SkimState,
+    SummaryCache,
     __main__,
+    _arrow_skim_computation,
     _bool_variable_summary_table,
+    _clean_name,
+    _clean_names_batch,
     _compute_column_widths,
     _convert_case,
+    _create_unicode_hists,
+    _delete_unsupported_columns,
+    _hist_to_unicode,
+    _infer_column_type_plan,
     _infer_datatypes,
     _map_row_positions_to_text_style,
+    _numeric_column_stats,
     _replace_values,
     _round_series,
     _simplify_datetimes_in_array,
+    _skim_computation,
+    _SkimAccumulator,
     _string_variable_summary_table,
     clean_columns,
     generate_test_data,
     skim,
     skim_get_data,
     skim_get_figure,
+    skim_stream,
+    skim_stream_get_data,
 )
 
 
@@ -480,6 +506,106 @@ def test_21_dataframe_with_null_values():
     assert list(result.dtypes.astype("string").values) == expected_data_types
 
 
+def test_infer_column_type_plan():
+    """Type plan is computed once and shared by the deletion and typing steps."""
+    df = pd.DataFrame(
+        {
+            "string_col": ["apple", "banana", "orange"],
+            "int_col": [1, 2, 3],
+            "mixed_col": ["a", 1, 2.0],
+            "date_col": pd.date_range("2023-07-22", periods=3).date,
+        }
+    )
+    type_plan = _infer_column_type_plan(df)
+    assert list(type_plan["type"]) == ["string", "integer", "mixed-integer", "date"]
+    assert list(type_plan["dtype"]) == ["string", "int", None, None]
+    assert list(type_plan["keep"]) == [True, True, False, True]
+    result = _infer_datatypes(_delete_unsupported_columns(df, type_plan), type_plan)
+    assert list(result.columns) == ["string_col", "int_col", "date_col"]
+    assert list(result.dtypes.astype(str)) == ["string", "int64", "object"]
+
+
+def test_import_is_lazy() -> None:
+    """Importing skimpy, or its command line, doesn't import optional modules."""
+    for module in ["skimpy", "skimpy.__main__"]:
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        # lines are "import time: <self us> | <cumulative us> | <module>"
+        imported = {
+            line.split("|")[2].strip().split(".")[0]
+            for line in result.stderr.splitlines()[1:]
+            if line.startswith("import time:")
+        }
+        assert not imported & {"rich", "polars", "typeguard", "duckdb"}
+
+
+def test_public_typecheck_mode() -> None:
+    """In the public mode, only the public API has its types checked."""
+    script = textwrap.dedent(
+        """
+        import pandas as pd
+        from typeguard import TypeCheckError
+        import skimpy
+
+        assert skimpy.TYPECHECK_MODE == "public"
+        assert not hasattr(skimpy._round_series, "__wrapped__")
+        assert skimpy._round_series(pd.Series([1.234]), places=2).iloc[0] == 1.2
+        try:
+            skimpy.skim_get_data(pd.DataFrame({"a": [1.0]}), seed="not a seed")
+        except TypeCheckError:
+            print("checked")
+        """
+    )
+    env = {**os.environ, "SKIMPY_TYPECHECK": "public"}
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, env=env
+    )
+    assert result.stdout.strip() == "checked", result.stderr
+    env["SKIMPY_TYPECHECK"] = "off"
+    result = subprocess.run(
+        [sys.executable, "-c", "import skimpy"], capture_output=True, text=True, env=env
+    )
+    assert "ValueError" in result.stderr
+
+
+def test_skim_does_not_copy_input() -> None:
+    """Skimming should not materialise copies of the input dataframe."""
+    if not os.access("/proc/self/clear_refs", os.W_OK):
+        pytest.skip("Needs Linux to reset and read peak resident memory")
+    script = textwrap.dedent(
+        """
+        import numpy as np
+        import pandas as pd
+        from skimpy import skim_get_data
+
+        def peak_rss():
+            with open("/proc/self/status") as f:
+                for line in f:
+                    if line.startswith("VmHWM"):
+                        return int(line.split()[1]) * 1024
+
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame({f"c{i}": rng.random(1_000_000) for i in range(10)})
+        df["text"] = pd.Series(rng.choice(["a b", "cc"], 1_000_000)).astype("string")
+        size = df.memory_usage(deep=True).sum()
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        before = peak_rss()
+        skim_get_data(df)
+        print((peak_rss() - before) / size)
+        """
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    # A single copy of the input alone would take this to at least 1
+    assert float(result.stdout) < 0.75
+
+
 def test_22_string_summary():
     """test summarising string columns of dataframes."""
     string_list = [
@@ -499,6 +625,7 @@ def test_22_string_summary():
         "Indeed, it was the most outrageously pompous cat I have ever seen.",
         "How are you?",
         "blah",
+        5,
         23.8,
         3.6,
         18,
@@ -507,6 +634,22 @@ def test_22_string_summary():
         assert result_df.iloc[0, i] == expected_values[i]
 
 
+@pytest.mark.parametrize("dtype", ["string[python]", "string[pyarrow]"])
+def test_string_summary_storage_and_index(dtype: str) -> None:
+    """String summaries don't depend on the string storage or on the index."""
+    string_list = ["a b", "ccc", None, "dd", "é", "ccc dd e"]
+    df = pd.DataFrame({"text": string_list}, index=[10, 3, 7, 0, 2, 5], dtype=dtype)
+    result = _string_variable_summary_table(df).loc["text"]
+    assert result["NA"] == 1
+    assert result["shortest"] == "é"
+    assert result["longest"] == "ccc dd e"
+    assert result["min"] == "a b"
+    assert result["max"] == "é"
+    assert result["unique"] == 6
+    assert result["chars per row"] == 3.4
+    assert result["total words"] == 8
+
+
 def test_23_bool_summary():
     """test summarising bool columns of dataframes."""
     bool_list = [
@@ -536,6 +679,79 @@ def test_24_round_series():
     )
 
 
+@pytest.mark.parametrize("places", [1, 2, 3, 4, 7, 16])
+def test_round_series_matches_string_formatting(places: int) -> None:
+    """Vectorised rounding gives the same floats as formatting each value."""
+    rng = np.random.default_rng(places)
+    n = 10_000
+    values = np.concatenate(
+        [
+            # any magnitude
+            rng.normal(size=n) * 10.0 ** rng.integers(-30, 30, n),
+            # exactly representable halfway values, eg 0.125
+            (rng.integers(0, 2000, n) + 0.5) / 2.0 ** rng.integers(0, 10, n),
+            # decimals that are close to halfway
+            (rng.integers(0, 2000, n) + 0.5) / 10.0 ** rng.integers(0, 5, n),
+            # either side of powers of ten
+            10.0 ** rng.integers(-300, 300, n)
+            * rng.choice([1, -1, 0.9999999999999999, 1.0000000000000002], n),
+            # arbitrary bit patterns
+            np.frombuffer(rng.bytes(8 * n), dtype=np.float64),
+            [0.0, -0.0, np.inf, -np.inf, np.nan, 5e-324, 1.7976931348623157e308],
+        ]
+    )
+    expected = [float(f"{float(f'{x:.{places}g}'):g}") for x in values]
+    result = _round_series(pd.Series(values), places)
+    assert_series_equal(result, pd.Series(expected))
+
+
+def test_numeric_column_stats_match_pandas() -> None:
+    """The batched numeric kernel gives the same statistics as pandas."""
+    rng = np.random.default_rng(42)
+    xf = pd.DataFrame(
+        {
+            "float": rng.normal(size=500),
+            "float_with_nans": np.where(
+                rng.random(500) < 0.3, np.nan, rng.standard_cauchy(500)
+            ),
+            "int": rng.integers(-(2**40), 2**40, 500),
+            "float32": rng.normal(size=500).astype("float32"),
+        }
+    )
+    for col in xf.columns:
+        stats = _numeric_column_stats(xf[col])
+        assert stats["NA"] == xf[col].isna().sum()
+        assert stats["mean"] == xf[col].mean()
+        assert stats["sd"] == xf[col].std()
+        for x in [0, 0.25, 0.5, 0.75, 1]:
+            assert stats[f"q{x}"] == xf[col].quantile(x)
+
+
+def test_create_unicode_hists_matches_numpy() -> None:
+    """Batched histograms of all columns match np.histogram of each column."""
+    rng = np.random.default_rng(7)
+    n = 300
+    xf = pd.DataFrame(
+        {
+            "float": rng.normal(size=n) * 1e6,
+            "int_with_nans": np.where(
+                rng.random(n) < 0.5, np.nan, rng.integers(-5, 5, n)
+            ),
+            "bool": rng.random(n) < 0.2,
+            "constant": np.full(n, 3.3),
+            "all_nan": np.full(n, np.nan),
+            "thirds": rng.integers(0, 10, n) / 3,
+        }
+    )
+    hists = _create_unicode_hists(xf)
+    for col in xf.columns:
+        with np.errstate(invalid="ignore"):
+            hist, _ = np.histogram(
+                xf[col].dropna().astype(float), density=True, bins=HIST_BINS
+            )
+        assert hists[col] == _hist_to_unicode(hist)
+
+
 def test_25_column_with_mixed_type():
     """Columns of residual object type, or mixed columns, alongside useful ones."""
     data_list = [
@@ -642,6 +858,350 @@ def test_running_with_polars_return_data():
     assert pandas_tbl_out == polars_tbl_out
 
 
+def test_polars_engine_matches_pandas(monkeypatch):
+    """The native polars engine gives the same summary as the pandas path."""
+    df = pl.from_pandas(generate_test_data()).with_columns(
+        pl.col("depth").cast(pl.Int32).alias("depth_32"),
+        pl.col("rnd").cast(pl.Float32).alias("rnd_32"),
+        pl.col("datetime").dt.replace_time_zone("UTC").alias("datetime_tz"),
+        pl.when(pl.col("depth") > 5).then(pl.col("booly_col")).alias("booly_null"),
+        pl.lit(None, dtype=pl.String).alias("all_null"),
+    )
+    pandas_tbl_out = skim_get_data(df.to_pandas())
+    # polars should never need to convert to pandas for these column types
+    monkeypatch.setattr(pl.DataFrame, "to_pandas", None)
+    assert skim_get_data(df) == pandas_tbl_out
+    assert skim_get_data(df.lazy()) == pandas_tbl_out
+
+
+def test_skim_get_data_never_renders(monkeypatch):
+    """Getting only the data never builds rich tables, in any engine."""
+    df = generate_test_data()
+    expected = skim_get_data(df, sample=500)
+    monkeypatch.setattr("skimpy._render_skim_output", None)
+    monkeypatch.setattr("skimpy._dataframe_to_rich_table", None)
+    assert skim_get_data(df, sample=500) == expected
+    skim_get_data(pl.from_pandas(df))
+    skim_stream_get_data([df.iloc[:500], df.iloc[500:]])
+
+
+def test_arrow_engine_matches_pandas(monkeypatch):
+    """The Arrow engine gives the same summary as the pandas path."""
+    df = generate_test_data()
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    table = table.append_column(
+        "datetime_tz", pc.assume_timezone(table["datetime"], "UTC")
+    ).append_column("all_null", pa.nulls(len(df), pa.string()))
+    pandas_tbl_out = skim_get_data(table.to_pandas(date_as_object=False))
+    assert skim_get_data(table, sample=300) == skim_get_data(
+        table.to_pandas(date_as_object=False), sample=300
+    )
+    # Arrow should never need to go via pandas for these column types
+    monkeypatch.setattr("skimpy._skim_computation", None)
+    assert skim_get_data(table) == pandas_tbl_out
+    reader = pa.RecordBatchReader.from_batches(
+        table.schema, table.to_batches(max_chunksize=128)
+    )
+    assert skim_get_data(reader) == pandas_tbl_out
+
+
+def test_arrow_engine_unsupported_types():
+    """Column types that the Arrow engine doesn't handle go via pandas."""
+    table = pa.table({"list_col": [[1], [2, 3], [4]], "num": [1.0, 2.5, 3.0]})
+    arrow_tbl_out = skim_get_data(table)
+    assert arrow_tbl_out == skim_get_data(table.to_pandas())
+    assert arrow_tbl_out["Data Summary"]["Number of columns"] == 1
+
+
+def test_polars_engine_unsupported_types():
+    """Column types that the polars engine doesn't handle go via pandas."""
+    df = pl.DataFrame({"list_col": [[1], [2, 3], [4]], "num": [1.0, 2.5, 3.0]})
+    polars_tbl_out = skim_get_data(df.lazy())
+    assert polars_tbl_out == skim_get_data(df.to_pandas())
+    assert polars_tbl_out["Data Summary"]["Number of columns"] == 1
+
+
+def test_skim_sample_exact_and_estimated_stats():
+    """Sampled skims keep exact counts, and list the estimated statistics."""
+    df = generate_test_data()
+    full = skim_get_data(df)
+    sampled = skim_get_data(df, sample=200, seed=3)
+    assert sampled == skim_get_data(df, sample=200, seed=3)
+    assert sampled["Data Summary"] == {
+        "Number of rows": 1000,
+        "Number of columns": 13,
+        "Sampled rows": 200,
+    }
+    assert sampled["number"]["NA"] == full["number"]["NA"]
+    assert sampled["number"]["NA %"] == full["number"]["NA %"]
+    assert "NA" not in sampled["Estimates"]["number"]
+    assert "p50" in sampled["Estimates"]["number"]
+    assert sampled["Estimates"]["string"][-1] == "total words"
+    # sampling every row is the same as not sampling
+    assert skim_get_data(df, sample=1.0) == full
+    assert skim_get_data(df, sample=5000) == full
+    skim(df, sample=0.1)
+
+
+def test_skim_sample_stratified_and_polars():
+    """Stratified samples include every stratum, for pandas and polars."""
+    df = pd.DataFrame(
+        {
+            "group": ["rare"] + ["common"] * 999,
+            "value": np.arange(1000, dtype=float),
+        }
+    )
+    df.loc[::10, "value"] = np.nan
+    df.loc[0, "value"] = -1.0
+    for df_in in [df, pl.from_pandas(df), pl.from_pandas(df).lazy()]:
+        result = skim_get_data(df_in, sample=0.01, stratify="group")
+        assert result["Data Summary"]["Sampled rows"] == 11
+        assert result["number"]["NA"] == {"value": 99}
+        # the only row of the rare group is always sampled
+        assert result["number"]["p0"] == {"value": -1.0}
+    with pytest.raises(ValueError):
+        skim_get_data(df, sample=1.5)
+
+
+def test_skim_sample_lazyframe_matches_dataframe():
+    """Sampling a lazy frame, without collecting it, matches sampling it eagerly."""
+    df = pl.from_pandas(generate_test_data()).with_columns(
+        pl.int_range(pl.len()).alias("row")
+    )
+    for kwargs in [
+        {"sample": 100},
+        {"sample": 0.3, "stratify": "class"},
+        {"sample": 5000},
+    ]:
+        assert skim_get_data(df.lazy(), seed=3, **kwargs) == skim_get_data(
+            df, seed=3, **kwargs
+        )
+
+
+def test_skim_n_jobs_matches_serial():
+    """Summarising columns on threads gives the same results, in the same order."""
+    df = generate_test_data()
+    df["all_null"] = None
+    for n_jobs in [2, 5, -1]:
+        assert skim_get_data(df, n_jobs=n_jobs) == skim_get_data(df)
+    with pytest.raises(ValueError):
+        skim_get_data(df, n_jobs=0)
+
+
+def test_skim_stream_matches_skim():
+    """Skimming a dataframe in chunks gives the same output as skimming it."""
+    df = generate_test_data().drop(columns=["datetime.date", "datetime.date_no_freq"])
+    df["all_null"] = None
+    full = skim_get_data(df)
+    for chunksize in [1, 3, 128, 5000]:
+        chunks = (
+            df.iloc[start : start + chunksize] for start in range(0, 1000, chunksize)
+        )
+        assert skim_stream_get_data(chunks) == full
+    numbers = df[["length", "depth", "booly_col"]]
+    full = skim_get_data(numbers)
+    assert skim_stream_get_data(pl.from_pandas(numbers).iter_slices(300)) == full
+    table = pa.Table.from_pandas(numbers, preserve_index=False)
+    assert skim_stream_get_data(table.to_batches(max_chunksize=300)) == full
+    skim_stream([df.iloc[:500], df.iloc[500:]])
+
+
+def test_skim_state_updates_with_appended_rows():
+    """A SkimState summarises appended rows without rescanning earlier ones."""
+    df = generate_test_data().drop(columns=["datetime.date", "datetime.date_no_freq"])
+    state = SkimState(df.iloc[:300])
+    assert state.get_data() == skim_get_data(df.iloc[:300])
+    state.update(df.iloc[300:700])
+    state.update(pl.from_pandas(df.iloc[700:]))
+    assert state.n_rows == 1000
+    assert state.get_data() == skim_get_data(df)
+    # merging copies the other state, which can still be updated on its own
+    merged = SkimState()
+    merged.merge(state)
+    state.update(df.iloc[:10])
+    assert merged.get_data() == skim_get_data(df)
+    merged.skim()
+
+
+def test_skim_stream_chunks_of_different_types():
+    """Chunks that pd.read_csv types differently are summarised together."""
+    csv = "a,b,c\n" + "".join(f"{i},,{'x' if i > 5 else ''}\n" for i in range(20))
+    full = skim_get_data(pd.read_csv(io.StringIO(csv)))
+    # the first chunk of c is all missing, so pd.read_csv reads it as floats
+    chunks = pd.read_csv(io.StringIO(csv), chunksize=4)
+    assert skim_stream_get_data(chunks) == full
+    # columns with mixed types are not summarised, as in skim
+    result = skim_stream_get_data(
+        [
+            pd.DataFrame({"a": [1, 2], "b": [1, 2]}),
+            pd.DataFrame({"a": ["x", "y"], "b": [3, 4]}),
+        ]
+    )
+    assert result["Data Summary"]["Number of columns"] == 1
+    with pytest.raises(ValueError):
+        skim_stream_get_data([pd.DataFrame({"a": [1]}), pd.DataFrame({"b": [1]})])
+    with pytest.raises(ValueError):
+        skim_stream_get_data([])
+
+
+def test_skim_stream_long_columns_and_merging():
+    """Quantiles of long columns are approximate, and accumulators merge."""
+    rng = np.random.default_rng(42)
+    df = pd.DataFrame({"x": rng.random(100_000)})
+    exact = df["x"].quantile([0.25, 0.5, 0.75]).to_numpy()
+    first, second = _SkimAccumulator(), _SkimAccumulator()
+    for start in range(0, 50_000, 10_000):
+        first.update(df.iloc[start : start + 10_000])
+        second.update(df.iloc[50_000 + start : 60_000 + start])
+    first.merge(second)
+    _, result = first.result()
+    full = skim_get_data(df)
+    for stat in ["NA", "mean", "sd", "p0", "p100", "hist"]:
+        assert result["number"][stat] == full["number"][stat]
+    quantiles = [result["number"][p]["x"] for p in ["p25", "p50", "p75"]]
+    # uniform values, so the error in rank is the error in value
+    assert np.abs(np.array(quantiles) - exact).max() < 0.01
+
+
+def test_quantile_sketch_rank_error_merging_and_serialisation():
+    """Quantile sketches are exact when small, and mergeable and serialisable."""
+    rng = np.random.default_rng(7)
+    values = rng.random(200_000)
+    small = QuantileSketch.from_rank_error(0.001)
+    small.update(values[:500])
+    assert small.rank_error == 0
+    assert_array_equal(
+        small.quantiles(QUANTILES),
+        np.percentile(values[:500], np.array(QUANTILES) * 100),
+    )
+    first, second = (
+        QuantileSketch.from_rank_error(0.01),
+        QuantileSketch.from_rank_error(0.01),
+    )
+    first.update(values[:100_000])
+    second.update(values[100_000:])
+    # a sketch that is saved as JSON, and loaded again, can still be merged
+    second = QuantileSketch.from_dict(json.loads(json.dumps(second.to_dict())))
+    first.merge(second)
+    assert first.n == values.size
+    assert 0 < first.rank_error <= 0.01
+    estimates = first.quantiles(QUANTILES)
+    assert estimates[0] == values.min()
+    assert estimates[-1] == values.max()
+    # uniform values, so the error in rank is the error in value
+    exact = np.quantile(values, QUANTILES)
+    assert np.abs(estimates - exact).max() <= first.rank_error
+    with pytest.raises(ValueError):
+        QuantileSketch.from_rank_error(0)
+
+
+def test_skim_quantile_error():
+    """Quantiles estimated with sketches show their rank error, in every engine."""
+    df = pd.DataFrame({"x": np.random.default_rng(3).random(50_000), "y": 1.0})
+    result = skim_get_data(df, quantile_error=0.01)
+    assert list(result["number"]["rank error"].values()) == [0.009966, 0.009966]
+    assert result == skim_get_data(pl.from_pandas(df), quantile_error=0.01)
+    assert abs(result["number"]["p50"]["x"] - df["x"].median()) < 0.01
+    result = skim_stream_get_data(
+        [df.iloc[:100], df.iloc[100:200]], quantile_error=0.01
+    )
+    assert result["number"]["rank error"] == {"x": 0, "y": 0}
+    assert "rank error" not in skim_get_data(df)["number"]
+
+
+def test_hyperloglog_exact_estimated_and_merged():
+    """Distinct counts are exact when small, and mergeable and serialisable."""
+    small = HyperLogLog()
+    small.update(pd.Series(["a", "b", None, "a", "é", "\udc80"], dtype=object))
+    assert small.count() == 4
+    assert small.relative_error == 0
+    values = pa.array(np.arange(300_000).astype(str))
+    first, second = HyperLogLog(), HyperLogLog()
+    first.update(values[:200_000])
+    second.update(values[100_000:])
+    # a count that is saved as JSON, and loaded again, can still be merged
+    second = HyperLogLog.from_dict(json.loads(json.dumps(second.to_dict())))
+    first.merge(second)
+    assert 0 < first.relative_error < 0.01
+    assert abs(first.count() / 300_000 - 1) < 4 * first.relative_error
+    with pytest.raises(ValueError):
+        first.merge(HyperLogLog(precision=10))
+
+
+def test_unique_strings_and_categories():
+    """Every engine counts unique strings and categories, with missing as one."""
+    df = pd.DataFrame(
+        {
+            "text": pd.Series(["a", "b", None, "a"], dtype="string"),
+            "cat": pd.Categorical(["x", None, "x", "x"], categories=["x", "y"]),
+        }
+    )
+    result = skim_get_data(df)
+    assert result["string"]["unique"] == {"text": 3}
+    assert result["category"]["unique"] == {"cat": 2}
+    assert skim_get_data(pl.from_pandas(df)) == result
+    assert skim_get_data(pa.Table.from_pandas(df)) == result
+    assert skim_stream_get_data([df.iloc[:2], df.iloc[2:]]) == result
+
+
+def test_many_unique_strings_are_exact_or_marked_as_estimates():
+    """Engines that hold a whole column count its strings exactly; streams estimate."""
+    n_distinct = 2 * 2**14
+    df = pd.DataFrame(
+        {"text": pd.Series(np.arange(n_distinct).astype(str), dtype="string")}
+    )
+    result = skim_get_data(df)
+    assert result["string"]["unique"] == {"text": n_distinct}
+    assert "Estimates" not in result
+    assert skim_get_data(pa.Table.from_pandas(df)) == result
+    assert skim_get_data(pl.from_pandas(df)) == result
+    streamed = skim_stream_get_data([df.iloc[:1000], df.iloc[1000:]])
+    assert streamed["Estimates"] == {"string": ["unique"]}
+    assert abs(streamed["string"]["unique"]["text"] / n_distinct - 1) < 0.05
+
+
+def test_summary_cache_only_summarises_changed_columns(tmp_path):
+    """Cached summaries are re-used for columns whose content hasn't changed."""
+
+    class CountingCache(SummaryCache):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.puts = 0
+
+        def put(self, key, summary):
+            self.puts += 1
+            super().put(key, summary)
+
+    df = generate_test_data()
+    expected = skim_get_data(df)
+    cache = CountingCache(directory=tmp_path)
+    assert skim_get_data(df, cache=cache) == expected
+    n_columns = cache.puts
+    assert skim_get_data(df, cache=cache) == expected
+    assert cache.puts == n_columns
+    changed = df.assign(length=df["length"] * 2)
+    assert skim_get_data(changed, cache=cache) == skim_get_data(changed)
+    assert cache.puts == n_columns + 1
+    # summaries on disk are re-used by other caches, whatever the column names
+    renamed = df.rename(columns=str.upper)
+    other_cache = CountingCache(directory=tmp_path)
+    assert skim_get_data(renamed, cache=other_cache) == skim_get_data(renamed)
+    assert other_cache.puts == 0
+    small_cache = SummaryCache(max_size=2)
+    skim_get_data(df, cache=small_cache)
+    assert len(small_cache) == 2
+
+
+def test_summary_cache_tells_ordered_categories_apart():
+    """Columns that only differ in whether their categories are ordered."""
+    unordered = pd.DataFrame({"cat": pd.Categorical(["a", "b", "a"])})
+    ordered = unordered.assign(cat=unordered["cat"].cat.as_ordered())
+    cache = SummaryCache()
+    assert skim_get_data(unordered, cache=cache) == skim_get_data(unordered)
+    assert skim_get_data(ordered, cache=cache) == skim_get_data(ordered)
+    assert skim_get_data(ordered)["category"]["ordered"] == {"cat": True}
+
+
 def test_exporting_to_svg(tmp_path):
     """Export results to a file."""
     df = generate_test_data()
@@ -783,6 +1343,157 @@ def test_main_sqlite_invalid_table(runner: CliRunner) -> None:
         assert "employees" in str(result.exception) or "employees" in result.output
 
 
+def test_main_duckdb_engine_matches_pandas(runner: CliRunner) -> None:
+    """Test that statistics computed inside DuckDB match those of pandas."""
+    with runner.isolated_filesystem():
+        df = generate_test_data()
+        df["all_null"] = None
+        df["tz_aware"] = pd.date_range(
+            "2024-01-01 23:30", periods=len(df), freq="h", tz="America/New_York"
+        )
+        df.to_csv("test_file.csv", index=False)
+        rel = __main__._load_relation_from_file("test_file.csv")
+        _, duckdb_data = __main__._duckdb_skim_computation(rel)
+        _, pandas_data = _skim_computation(rel.to_df())
+        assert duckdb_data == pandas_data
+
+        arrow_table = rel.to_arrow_table()
+        _, arrow_data = _arrow_skim_computation(arrow_table)
+        assert arrow_data == pandas_data
+
+        _, stream_data = __main__._stream_skim_computation(
+            __main__._iter_relation_chunks(rel, vectors_per_chunk=1)
+        )
+        assert stream_data == pandas_data
+
+        for engine in ["duckdb", "arrow", "pandas", "stream"]:
+            result = runner.invoke(__main__.main, ["test_file.csv", "-e", engine])
+            assert result.exit_code == 0
+
+
+def test_main_arrow_engine_reads_files_a_column_at_a_time(tmp_path) -> None:
+    """Test that parquet and Feather files are summarised as DuckDB summarises them."""
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+
+    df = generate_test_data()
+    df["tz_aware"] = pd.date_range(
+        "2024-01-01 23:30", periods=len(df), freq="h", tz="America/New_York"
+    )
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    table = table.append_column("all_null", pa.nulls(len(table), pa.float64()))
+    # DuckDB reads dictionaries (here, categories) as their values, and
+    # timezone-aware datetimes in its own time zone
+    assert pa.types.is_dictionary(table.schema.field("class").type)
+    pq.write_table(table, tmp_path / "data.parquet", row_group_size=100)
+    feather.write_feather(table, tmp_path / "data.feather")
+    for path in [tmp_path / "data.parquet", tmp_path / "data.feather"]:
+        rel = __main__._load_relation_from_file(str(path))
+        _, expected = __main__._duckdb_skim_computation(rel)
+        _, arrow_data = __main__._arrow_skim_file(str(path))
+        assert arrow_data == expected
+        assert "class" in arrow_data["string"]["NA"]
+
+    # footers of parquet files answer some statistics exactly
+    dataset = __main__._load_dataset_from_file(str(tmp_path / "data.parquet"))
+    n_rows, stats = __main__._parquet_footer_stats(dataset)
+    names = dataset.schema.names
+    assert n_rows == len(table)
+    assert stats[f"{names.index('text')}:NA"] == expected["string"]["NA"]["text"]
+    assert f"{names.index('rnd')}:NA" not in stats  # NaNs aren't counted
+    assert stats[f"{names.index('all_null')}:NA"] == len(table)
+    assert stats[f"{names.index('depth')}:q1"] == expected["number"]["p100"]["depth"]
+    assert (
+        pd.Timestamp(stats[f"{names.index('datetime')}:min"])
+        == (expected["datetime"]["first"]["datetime"])
+    )
+
+    _, projected = __main__._arrow_skim_file(
+        str(tmp_path / "data.parquet"), columns=["text", "depth"]
+    )
+    assert projected == _arrow_skim_computation(table.select(["text", "depth"]))[1]
+
+
+def test_main_columns_and_feather_files(runner: CliRunner, tmp_path) -> None:
+    """Test that every engine reads Feather files, and only the given columns."""
+    import pyarrow.feather as feather
+
+    path = str(tmp_path / "data.feather")
+    feather.write_feather(generate_test_data(), path)
+    for engine in ["duckdb", "arrow", "pandas", "stream"]:
+        result = runner.invoke(
+            __main__.main, [path, "-e", engine, "-c", "depth", "-c", "text"]
+        )
+        assert result.exit_code == 0
+        assert "depth" in result.output and "booly_col" not in result.output
+    result = runner.invoke(__main__.main, [path, "-c", "nope"])
+    assert isinstance(result.exception, ValueError)
+    assert "nope" in str(result.exception)
+    df = __main__._load_data_from_file(path, columns=["class", "depth"])
+    assert list(df.columns) == ["class", "depth"]
+
+
+def test_main_metadata_only(runner: CliRunner, tmp_path) -> None:
+    """Test that directories of parquet files are summarised from their footers."""
+    import pyarrow.parquet as pq
+
+    table = pa.Table.from_pandas(generate_test_data(), preserve_index=False)
+    table = table.append_column("all_null", pa.nulls(len(table)))
+    (tmp_path / "data").mkdir()
+    pq.write_table(table.slice(0, 600), tmp_path / "data" / "a.parquet")
+    pq.write_table(table.slice(600), tmp_path / "data" / "b.parquet")
+    path = str(tmp_path / "data")
+    _, expected = __main__._arrow_skim_file(path)
+    # (the DuckDB engine can't yet summarise columns of only nulls, of no type)
+    columns = table.column_names[:-1]
+    rel = __main__._load_relation_from_file(path, columns=columns)
+    assert (
+        __main__._arrow_skim_file(path, columns=columns)[1]
+        == __main__._duckdb_skim_computation(rel)[1]
+    )
+
+    summary, data = __main__._parquet_metadata_skim_computation(
+        __main__._load_dataset_from_file(path)
+    )
+    assert data["Data Summary"] == expected["Data Summary"]
+    for table_name, stat, column in [
+        ("number", "NA", "depth"),
+        ("number", "p0", "length"),
+        ("number", "p100", "depth"),
+        ("string", "NA", "text"),
+        ("datetime", "first", "datetime"),
+        ("datetime", "last", "datetime.date_no_freq"),
+        ("All null", "NA", "all_null"),
+    ]:
+        assert data[table_name][stat][column] == expected[table_name][stat][column]
+    # NaNs aren't counted in the footers
+    assert pd.isna(data["number"]["NA"]["rnd"])
+
+    for args in [[path, "--metadata-only"], [path, "--metadata-only", "-c", "depth"]]:
+        result = runner.invoke(__main__.main, args)
+        assert result.exit_code == 0
+        assert "depth" in result.output
+    assert "text" not in result.output
+    for engine in ["duckdb", "arrow"]:
+        result = runner.invoke(__main__.main, [path, "-e", engine, "-c", "depth"])
+        assert result.exit_code == 0
+        assert "1000" in result.output
+
+    feather_path = str(tmp_path / "data.feather")
+    pa.feather.write_feather(table, feather_path)
+    result = runner.invoke(__main__.main, [feather_path, "--metadata-only"])
+    assert isinstance(result.exception, ValueError)
+
+
+def test_main_duckdb_engine_unsupported_types() -> None:
+    """Test that tables with types DuckDB doesn't summarise are loaded into pandas."""
+    import duckdb
+
+    rel = duckdb.sql("SELECT [1, 2] AS list_col, 1 AS int_col")
+    _, duckdb_data = __main__._duckdb_skim_computation(rel)
+    assert duckdb_data["Data Summary"]["Number of columns"] == 1
+
+
 def test_compute_column_widths() -> None:
     """Tests that _compute_column_widths returns sensible per-column widths."""
     df = pd.DataFrame(
@@ -810,3 +1521,91 @@ def test_compute_column_widths_empty_dataframe() -> None:
     # "col_a" is 5 chars -> 6 (min), "b" is 1 char -> 6 (min)
     assert widths[0] == 6
     assert widths[1] == 6
+
+
+def test_clean_columns_replacements_in_one_pass() -> None:
+    """Tests that replacements give the same names in one pass as one by one."""
+    names = ["Nom #1", "nom%2", "NOM (#3)", "Tel ID", "Nom #1", "abc", "ABC"]
+    df = pd.DataFrame(columns=names)
+    for replace in [
+        {"nom": "name", "#": "number", "%": "percent"},
+        {"ab": "x", "bc": "y"},
+        {"tel": "telephone", "id": "identifier"},
+        {"a": "b", "b": "c"},
+    ]:
+        expected = []
+        for name in names:
+            for old_value, new_value in replace.items():
+                if not (old_value.isalnum() and new_value.isalnum()):
+                    new_value = f"_{new_value}_"
+                name = re.sub(old_value, new_value, name, flags=re.IGNORECASE)
+            expected.append(name)
+        expected = list(clean_columns(pd.DataFrame(columns=expected)).columns)
+        assert list(clean_columns(df, replace=replace).columns) == expected
+    assert list(clean_columns(df).columns) == [
+        "nom_#_1",
+        "nom_%_2",
+        "nom_#_3",
+        "tel_id",
+        "nom_#_1_1",
+        "abc",
+        "abc_1",
+    ]
+
+
+@pytest.mark.parametrize("case", ["snake", "camel", "pascal", "title", "sentence"])
+def test_clean_names_batch_matches_one_name_at_a_time(case: str) -> None:
+    """Tests that the batch engine of clean_columns cleans names the same way."""
+    names = [
+        "pivotValue_1Über",
+        "Sensor Réading (°C)",
+        "HTTPServer 2XX",
+        "ǅemal-Σσ ١٢",
+        "\u0301",
+        'it\'s a "quote"',
+        ("é", 1),
+        3,
+        None,
+        "",
+    ]
+    for replace_items, remove_accents in [((), True), ((("é", "e"),), False)]:
+        expected = [
+            _clean_name(name, case, replace_items, remove_accents) for name in names
+        ]
+        assert (
+            _clean_names_batch(names, case, replace_items, remove_accents) == expected
+        )
+
+
+def test_profile_stages_of_skim(capsys):
+    """Profiling records every stage, and doesn't change the statistics."""
+    df = generate_test_data()
+    profiled = skim_get_data(df, profile=True, n_jobs=2)
+    profile = profiled.pop("Profile")
+    assert profiled == skim_get_data(df)
+    assert list(profile)[:3] == [
+        "infer column types",
+        "delete unsupported columns",
+        "infer datatypes",
+    ]
+    assert profile["number summary table"]["columns"] == 4
+    assert profile["string summary table"]["columns"] == 1
+    assert profile["date summary table"]["columns"] == 2
+    assert profile["timedelta summary table"]["columns"] == 1
+    for record in profile.values():
+        assert record["wall time (s)"] >= 0
+        assert record["CPU time (s)"] >= 0
+        assert record["peak memory (MiB)"] >= 0
+    json.dumps(profile)
+    # the polars and Arrow engines record a stage for each kind of column too
+    # (but have no table of the missing values of object columns)
+    summary_stages = {name for name in profile if name.endswith("summary table")}
+    summary_stages.remove("other summary table")
+    for df_in in [pl.from_pandas(df), pa.Table.from_pandas(df, preserve_index=False)]:
+        profiled = skim_get_data(df_in, profile=True)
+        assert set(profiled.pop("Profile")) == summary_stages
+        assert profiled == skim_get_data(df_in)
+
+    skim(df, profile=True)
+    out = capsys.readouterr().out
+    assert "profile" in out and "render" in out and "total" in out